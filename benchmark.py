@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos motores de busca do PathFinder A*
+Compara o motor original (objetos Node + get_neighbors) com o motor de vetores
+planos sobre grid com borda em labirintos aleatórios grandes.
+
+Uso:
+    python3 benchmark.py                 # grids 1000x1000
+    python3 benchmark.py --size 500      # grids menores
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from src.pathfinder import a_star
+
+
+def random_grid(size: int, obstacle_ratio: float, max_weight: int, seed: int) -> List[List[int]]:
+    """
+    Gera um grid aleatório na convenção interna (-1 = obstáculo).
+    
+    Args:
+        size: Número de linhas e colunas
+        obstacle_ratio: Fração de obstáculos
+        max_weight: Maior peso de célula livre (1 = custo uniforme)
+        seed: Semente do gerador aleatório
+    
+    Returns:
+        Grid numérico com início e fim livres nos cantos opostos
+    """
+    rng = random.Random(seed)
+    grid = [[-1 if rng.random() < obstacle_ratio else rng.randint(1, max_weight)
+             for _ in range(size)] for _ in range(size)]
+    grid[0][0] = 1
+    grid[size - 1][size - 1] = 1
+    return grid
+
+
+def run_case(name: str, grid: List[List[int]], engines: List[str], repeat: int) -> None:
+    """
+    Executa cada motor sobre o mesmo grid e imprime o melhor tempo.
+    
+    Args:
+        name: Descrição do cenário
+        grid: Grid numérico
+        engines: Motores de a_star a comparar
+        repeat: Número de repetições (é reportado o menor tempo)
+    """
+    size = len(grid)
+    print(f"\n{name} ({size}x{size})")
+    baseline = None
+    for engine in engines:
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = a_star(grid, (0, 0), (size - 1, size - 1), engine=engine)
+            best = min(best, time.perf_counter() - started)
+        
+        cost = f"{result.cost:.2f}" if result else "sem solução"
+        speedup = f"  ({baseline / best:.1f}x)" if baseline else ""
+        print(f"  {engine:<5} {best * 1000:9.1f} ms  custo={cost}  "
+              f"explorados={result.nodes_explored}{speedup}")
+        if baseline is None:
+            baseline = best
+
+
+def main():
+    """Executa o benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark dos motores de busca')
+    parser.add_argument('--size', type=int, default=1000, help='Tamanho do grid (padrão: 1000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições por motor')
+    args = parser.parse_args()
+    
+    print("=" * 70)
+    print("BENCHMARK - PATHFINDER A*")
+    print("=" * 70)
+    
+    run_case("Custo uniforme, 20% obstáculos",
+             random_grid(args.size, 0.2, 1, seed=1), ['node', 'flat', 'jps'], args.repeat)
+    run_case("Pesos 1-9, 20% obstáculos",
+             random_grid(args.size, 0.2, 9, seed=2), ['node', 'flat'], args.repeat)
+    
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
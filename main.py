@@ -8,13 +8,17 @@ import sys
 import argparse
 from typing import Optional
 from src.maze import Maze
-from src.pathfinder import a_star
+from src.pathfinder import a_star_with_report, print_search_result
+from src.batch import load_queries, solve_many_parallel
+from src.landmarks import LandmarkHeuristic
 from src.visualizer import visualize_solution, print_header
 from src.gui import visualize_maze_gui
 
 
 def run_pathfinder(maze: Maze, allow_diagonal: bool = False, 
-                   use_gui: bool = True, use_euclidean: bool = False) -> None:
+                   use_gui: bool = True, use_euclidean: bool = False,
+                   bidirectional: bool = False, use_alt: bool = False,
+                   use_components: bool = False, animate: bool = False) -> None:
     """
     Executa o algoritmo A* em um labirinto e visualiza o resultado.
     
@@ -23,13 +27,26 @@ def run_pathfinder(maze: Maze, allow_diagonal: bool = False,
         allow_diagonal: Permitir movimentos diagonais
         use_gui: Usar interface gráfica (Pygame)
         use_euclidean: Usar distância Euclidiana ao invés de Manhattan
+        bidirectional: Usar A* bidirecional (início e fim simultaneamente)
+        use_alt: Usar a heurística ALT (landmarks pré-calculados)
+        use_components: Rotular as componentes conexas antes da busca, para
+            responder sem busca quando o fim é inalcançável (custa uma passada
+            pelo grid inteiro)
+        animate: Executar a busca ao vivo na janela (A* unidirecional) em vez
+            de mostrar só o resultado final; requer use_gui
     """
     print_header("PATHFINDER A* - ENCONTRANDO O MENOR CAMINHO")
     
     print(f"\nConfigurações:")
     print(f"  • Movimentos diagonais: {'Sim' if allow_diagonal else 'Não'}")
-    print(f"  • Heurística: {'Euclidiana' if use_euclidean else 'Manhattan'}")
-    print(f"  • Interface: {'Gráfica (Pygame)' if use_gui else 'Console'}")
+    if use_alt:
+        heuristic_name = 'ALT (landmarks)'
+    else:
+        heuristic_name = 'Euclidiana' if use_euclidean else 'Manhattan'
+    print(f"  • Heurística: {heuristic_name}")
+    print(f"  • Busca: {'Bidirecional' if bidirectional else 'Unidirecional'}")
+    print(f"  • Interface: {'Gráfica (Pygame)' if use_gui else 'Console'}"
+          f"{' com animação' if animate else ''}")
     
     print(f"\nDimensões do labirinto: {maze.rows}x{maze.cols}")
     print(f"Início: {maze.start}")
@@ -42,16 +59,45 @@ def run_pathfinder(maze: Maze, allow_diagonal: bool = False,
         """Callback para rastrear exploração."""
         explored_cells.add(position)
     
+    landmarks = None
+    if use_alt:
+        landmarks = LandmarkHeuristic.from_maze(maze, allow_diagonal=allow_diagonal)
+        print(f"\nLandmarks: {landmarks.landmarks} "
+              f"(pré-processamento: {landmarks.build_time_ns / 1e6:.2f} ms)")
+    
+    # A rotulação percorre o grid inteiro: só vale a pena quando pedida
+    labels = maze.component_labels(allow_diagonal) if use_components else None
+    
+    if animate:
+        # A própria janela executa a busca; o resumo é impresso ao fechá-la
+        print("\n🎬 Executando algoritmo A* ao vivo na janela...")
+        print("   (Pressione ESC ou feche a janela para sair)")
+        try:
+            result = visualize_maze_gui(maze, animate=True, allow_diagonal=allow_diagonal,
+                                        use_euclidean=use_euclidean, landmarks=landmarks)
+        except Exception as e:
+            print(f"\n⚠ Erro ao abrir GUI: {e}")
+            return
+        if result is None:
+            print("\n⚠ Janela fechada antes do fim da busca.")
+            return
+        print_search_result(result)
+        visualize_solution(maze, result.path, result.cost, set(), colored=True)
+        return
+    
     print("\n🔍 Executando algoritmo A*...\n")
     
-    # Executa o A*
-    result = a_star(
+    # Executa o A* (o wrapper imprime o resumo da busca)
+    result = a_star_with_report(
         maze.grid,
         maze.start,
         maze.end,
         allow_diagonal=allow_diagonal,
         use_euclidean=use_euclidean,
-        exploration_callback=exploration_callback
+        exploration_callback=exploration_callback,
+        bidirectional=bidirectional,
+        component_labels=labels,
+        landmarks=landmarks
     )
     
     # Processa resultado
@@ -82,6 +128,40 @@ def run_pathfinder(maze: Maze, allow_diagonal: bool = False,
                 print(f"\n⚠ Erro ao abrir GUI: {e}")
 
 
+def run_batch(maze: Maze, queries_file: str, workers: Optional[int] = None,
+              allow_diagonal: bool = False, use_euclidean: bool = False) -> None:
+    """
+    Resolve um arquivo de consultas (início, fim) sobre o labirinto.
+    
+    Args:
+        maze: Objeto Maze
+        queries_file: Arquivo com uma consulta por linha (linha_início coluna_início
+            linha_fim coluna_fim)
+        workers: Número de processos (padrão: número de CPUs)
+        allow_diagonal: Permitir movimentos diagonais
+        use_euclidean: Usar distância Euclidiana ao invés de Manhattan
+    """
+    print_header("PATHFINDER A* - CONSULTAS EM LOTE")
+    
+    queries = load_queries(queries_file)
+    print(f"\nDimensões do labirinto: {maze.rows}x{maze.cols}")
+    print(f"Consultas: {len(queries)}")
+    print(f"Processos: {workers or 'automático'}\n")
+    
+    solved = 0
+    for index, result in solve_many_parallel(maze, queries, allow_diagonal=allow_diagonal,
+                                             use_euclidean=use_euclidean, workers=workers):
+        start, end = queries[index]
+        if result:
+            solved += 1
+            print(f"  [{index}] {start} -> {end}: custo {result.cost:.2f}, "
+                  f"{len(result.path)} passos, {result.nodes_explored} nós explorados")
+        else:
+            print(f"  [{index}] {start} -> {end}: sem solução")
+    
+    print(f"\n✓ {solved}/{len(queries)} consultas com caminho encontrado")
+
+
 def main():
     """Função principal com interface de linha de comando."""
     parser = argparse.ArgumentParser(
@@ -94,6 +174,10 @@ Exemplos de uso:
   python main.py --diagonal               # Permite movimentos diagonais
   python main.py --no-gui                 # Apenas visualização em console
   python main.py --example 3 --diagonal   # Exemplo 3 com diagonais
+  python main.py --bidirectional          # A* bidirecional
+  python main.py --alt --diagonal         # Heurística ALT (landmarks)
+  python main.py --example 3 --animate    # Busca animada na janela
+  python main.py -f mapa.txt --queries q.txt --workers 4  # Consultas em lote
         """
     )
     
@@ -123,20 +207,67 @@ Exemplos de uso:
         help='Usa distância Euclidiana ao invés de Manhattan'
     )
     
+    parser.add_argument(
+        '--bidirectional', '-bd',
+        action='store_true',
+        help='Usa A* bidirecional (busca a partir do início e do fim)'
+    )
+    
+    parser.add_argument(
+        '--alt', '-a',
+        action='store_true',
+        help='Usa a heurística ALT com landmarks pré-calculados (não combina com --bidirectional)'
+    )
+    
+    parser.add_argument(
+        '--components', '-c',
+        action='store_true',
+        help='Rotula as componentes conexas antes da busca (resposta imediata quando não há caminho)'
+    )
+    
+    parser.add_argument(
+        '--animate', '-an',
+        action='store_true',
+        help='Executa a busca ao vivo na janela gráfica (A* unidirecional)'
+    )
+    
     parser.add_argument(
         '--file', '-f',
         type=str,
-        help='Carrega labirinto de um arquivo'
+        help='Carrega labirinto de um arquivo (texto ou binário .pfmz, detectado automaticamente)'
+    )
+    
+    parser.add_argument(
+        '--queries', '-q',
+        type=str,
+        help='Arquivo de consultas em lote (uma por linha: linha_início coluna_início linha_fim coluna_fim)'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Número de processos para as consultas em lote (padrão: número de CPUs)'
     )
     
     args = parser.parse_args()
+    if args.alt and args.bidirectional:
+        parser.error("--alt não pode ser combinado com --bidirectional")
+    if args.workers is not None and not args.queries:
+        parser.error("--workers só pode ser usado com --queries")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers deve ser pelo menos 1")
+    if args.animate and (args.no_gui or args.bidirectional or args.queries):
+        parser.error("--animate requer a interface gráfica e não combina com "
+                     "--bidirectional nem --queries")
     
     # Carrega labirinto
     if args.file:
         try:
-            with open(args.file, 'r') as f:
-                maze_string = f.read()
-            maze = Maze.from_string(maze_string)
+            if Maze.is_binary_file(args.file):
+                maze = Maze.load_binary(args.file)
+            else:
+                maze = Maze.from_file(args.file)
         except FileNotFoundError:
             print(f"❌ Erro: Arquivo '{args.file}' não encontrado.")
             sys.exit(1)
@@ -150,11 +281,25 @@ Exemplos de uso:
     
     # Executa PathFinder
     try:
+        if args.queries:
+            run_batch(
+                maze,
+                args.queries,
+                workers=args.workers,
+                allow_diagonal=args.diagonal,
+                use_euclidean=args.euclidean
+            )
+            return
+        
         run_pathfinder(
             maze,
             allow_diagonal=args.diagonal,
             use_gui=not args.no_gui,
-            use_euclidean=args.euclidean
+            use_euclidean=args.euclidean,
+            bidirectional=args.bidirectional,
+            use_alt=args.alt,
+            use_components=args.components,
+            animate=args.animate
         )
     except KeyboardInterrupt:
         print("\n\n⚠ Execução interrompida pelo usuário.")
@@ -0,0 +1,221 @@
+"""
+Módulo de consultas em lote do PathFinder.
+Descrição: Resolve vários pares (início, fim) sobre o mesmo labirinto, pré-processando
+o grid uma única vez e reaproveitando os vetores de trabalho entre as buscas. As
+consultas também podem ser distribuídas entre processos que compartilham o grid
+por memória compartilhada.
+"""
+
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.maze import Maze
+from src.pathfinder import (SearchResult, SearchSpace, _in_different_components,
+                            _pad_weights)
+
+Query = Tuple[Tuple[int, int], Tuple[int, int]]
+
+# Estado de cada processo trabalhador (preenchido por _init_worker)
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+_worker_space: Optional[SearchSpace] = None
+_worker_euclidean = False
+
+
+def validate_pairs(maze: Maze, pairs: Iterable[Query]) -> List[Query]:
+    """
+    Valida os pares de consulta contra o labirinto.
+    
+    Args:
+        maze: Labirinto a ser consultado
+        pairs: Pares ((linha, coluna), (linha, coluna)) de início e fim
+    
+    Returns:
+        Lista de pares normalizados em tuplas de inteiros
+    
+    Raises:
+        ValueError: Se algum ponto estiver fora do labirinto ou sobre um obstáculo
+    """
+    validated = []
+    for number, (start, end) in enumerate(pairs):
+        start = (int(start[0]), int(start[1]))
+        end = (int(end[0]), int(end[1]))
+        for label, position in (("início", start), ("fim", end)):
+            if maze.is_obstacle(position):
+                raise ValueError(f"Consulta {number}: posição de {label} {position} "
+                                 "fora do labirinto ou sobre um obstáculo")
+        validated.append((start, end))
+    return validated
+
+
+def load_queries(file_path: str) -> List[Query]:
+    """
+    Lê consultas de um arquivo texto.
+    
+    Cada linha não vazia contém quatro inteiros separados por espaços ou vírgulas:
+    linha e coluna do início, linha e coluna do fim. Linhas iniciadas por '#' são
+    ignoradas.
+    
+    Args:
+        file_path: Caminho do arquivo
+    
+    Returns:
+        Lista de pares ((linha, coluna), (linha, coluna))
+    
+    Raises:
+        ValueError: Se alguma linha não tiver quatro inteiros
+    """
+    queries = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            fields = line.replace(',', ' ').split()
+            try:
+                values = [int(field) for field in fields]
+            except ValueError:
+                values = []
+            if len(values) != 4:
+                raise ValueError(f"Linha {line_number}: esperados 4 inteiros "
+                                 f"(linha_início coluna_início linha_fim coluna_fim)")
+            queries.append(((values[0], values[1]), (values[2], values[3])))
+    return queries
+
+
+def solve_many(maze: Maze, pairs: Iterable[Query], allow_diagonal: bool = False,
+               use_euclidean: bool = False) -> List[SearchResult]:
+    """
+    Resolve vários pares (início, fim) sobre o mesmo labirinto.
+    
+    O grid é convertido uma única vez para o formato plano com borda, e todas as
+    consultas compartilham os mesmos vetores de custos, pais e carimbos (veja
+    SearchSpace), sem realocar dicionários ou conjuntos a cada busca. Pares em
+    componentes conexas diferentes (veja Maze.component_labels) são respondidos
+    sem busca. O início e o fim próprios do labirinto ('S' e 'E') são ignorados.
+    
+    Args:
+        maze: Labirinto a ser consultado
+        pairs: Pares ((linha, coluna), (linha, coluna)) de início e fim
+        allow_diagonal: Se True, permite movimentos diagonais
+        use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+    
+    Returns:
+        Lista de SearchResult na mesma ordem dos pares
+    
+    Raises:
+        ValueError: Se algum ponto estiver fora do labirinto ou sobre um obstáculo
+    """
+    pairs = validate_pairs(maze, pairs)
+    space = SearchSpace.from_grid(maze.grid, allow_diagonal)
+    labels = maze.component_labels(allow_diagonal)
+    return [SearchResult(None, None) if _in_different_components(labels, maze.cols, start, end)
+            else space.search(start, end, use_euclidean)
+            for start, end in pairs]
+
+
+def _init_worker(memory_name: str, size: int, width: int, allow_diagonal: bool,
+                 use_euclidean: bool) -> None:
+    """Anexa o processo trabalhador ao grid em memória compartilhada."""
+    global _worker_memory, _worker_space, _worker_euclidean
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    weights = _worker_memory.buf[:size * array('i').itemsize].cast('i')
+    _worker_space = SearchSpace(weights, width, allow_diagonal)
+    _worker_euclidean = use_euclidean
+
+
+def _solve_chunk(chunk: List[Tuple[int, Tuple[int, int], Tuple[int, int]]]
+                 ) -> List[Tuple[int, SearchResult]]:
+    """Resolve um bloco de consultas (índice, início, fim) no processo trabalhador."""
+    return [(index, _worker_space.search(start, end, _worker_euclidean))
+            for index, start, end in chunk]
+
+
+def solve_many_parallel(maze: Maze, pairs: Iterable[Query], allow_diagonal: bool = False,
+                        use_euclidean: bool = False, workers: Optional[int] = None,
+                        chunk_size: int = 64,
+                        ordered: bool = True) -> Iterator[Tuple[int, SearchResult]]:
+    """
+    Resolve vários pares (início, fim) em paralelo, com um pool de processos.
+    
+    Os pesos com borda são copiados uma única vez para um bloco de memória
+    compartilhada; cada trabalhador se anexa a ele ao iniciar e monta seu próprio
+    SearchSpace por cima, então o grid nunca é serializado por tarefa. As consultas
+    são enviadas em blocos de chunk_size e os resultados são devolvidos à medida
+    que ficam prontos. Pares sem caminho (componentes conexas diferentes) são
+    respondidos no próprio processo, sem ocupar os trabalhadores.
+    
+    Args:
+        maze: Labirinto a ser consultado
+        pairs: Pares ((linha, coluna), (linha, coluna)) de início e fim
+        allow_diagonal: Se True, permite movimentos diagonais
+        use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+        workers: Número de processos (padrão: número de CPUs); com 1, resolve no
+            próprio processo
+        chunk_size: Número de consultas por tarefa enviada ao pool
+        ordered: Se True, devolve na ordem dos pares; caso contrário, na ordem de
+            conclusão dos blocos
+    
+    Yields:
+        Tuplas (índice_da_consulta, SearchResult)
+    
+    Raises:
+        ValueError: Se algum ponto estiver fora do labirinto ou sobre um obstáculo,
+            ou se workers/chunk_size não forem positivos
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers e chunk_size devem ser positivos")
+    pairs = validate_pairs(maze, pairs)
+    labels = maze.component_labels(allow_diagonal)
+    
+    if workers == 1:
+        space = SearchSpace.from_grid(maze.grid, allow_diagonal)
+        for index, (start, end) in enumerate(pairs):
+            if _in_different_components(labels, maze.cols, start, end):
+                yield index, SearchResult(None, None)
+            else:
+                yield index, space.search(start, end, use_euclidean)
+        return
+    
+    tasks = []
+    unreachable = []
+    for index, (start, end) in enumerate(pairs):
+        if _in_different_components(labels, maze.cols, start, end):
+            unreachable.append(index)
+        else:
+            tasks.append((index, start, end))
+    if not ordered:
+        for index in unreachable:
+            yield index, SearchResult(None, None)
+        unreachable = []
+    
+    weights, width = _pad_weights(maze.grid)
+    packed = array('i', weights)
+    size = len(packed)
+    memory = shared_memory.SharedMemory(create=True, size=size * packed.itemsize)
+    try:
+        memory.buf[:size * packed.itemsize] = packed.tobytes()
+        del packed, weights
+        
+        chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+        pending = 0  # Próximo índice de `unreachable` ainda não devolvido
+        with multiprocessing.Pool(workers, initializer=_init_worker,
+                                  initargs=(memory.name, size, width,
+                                            allow_diagonal, use_euclidean)) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            for chunk_results in imap(_solve_chunk, chunks):
+                for index, result in chunk_results:
+                    # Na ordem de envio, intercala as respostas imediatas anteriores
+                    while pending < len(unreachable) and unreachable[pending] < index:
+                        yield unreachable[pending], SearchResult(None, None)
+                        pending += 1
+                    yield index, result
+            for index in unreachable[pending:]:
+                yield index, SearchResult(None, None)
+    finally:
+        memory.close()
+        memory.unlink()
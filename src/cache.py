@@ -0,0 +1,189 @@
+"""
+Cache de caminhos do PathFinder
+Descrição: Cache LRU de resultados do A* indexado pela identidade e pela versão
+           do labirinto e pelos parâmetros da consulta, com limite de entradas e
+           de células armazenadas. Alterações feitas com set_cell/set_region (ou
+           avisadas com notify_changed) descartam as entradas antigas.
+"""
+
+import itertools
+import weakref
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from src.maze import Maze
+from src.pathfinder import SearchResult, a_star
+
+CacheKey = Tuple[int, int, Tuple[int, int], Tuple[int, int], bool, str, str]
+
+
+class PathCache:
+    """
+    Cache LRU de caminhos na frente do a_star.
+    
+    A chave é (labirinto, maze.version, início, fim, diagonais, heurística, motor).
+    O labirinto é identificado por um número atribuído pelo cache na primeira
+    consulta, não pelo conteúdo: dois objetos Maze iguais não compartilham
+    entradas. Quando maze.version muda (set_cell/set_region incrementam a versão),
+    as entradas das versões antigas desse labirinto são descartadas na próxima
+    consulta, sem recalcular hash nenhum. Alterações diretas em maze.grid só são
+    percebidas depois de maze.notify_changed().
+    
+    O motor faz parte da chave porque nem todos garantem o mesmo caminho: com
+    diagonais, a heurística Manhattan não é admissível e os motores podem devolver
+    custos diferentes para a mesma consulta.
+    
+    Atributos:
+        max_entries (int): Número máximo de caminhos guardados
+        max_cells (int): Soma máxima dos comprimentos dos caminhos guardados
+        hits (int): Consultas respondidas pelo cache
+        misses (int): Consultas que executaram o a_star
+        evictions (int): Entradas removidas por falta de espaço
+    """
+    
+    def __init__(self, max_entries: int = 1024, max_cells: int = 1_000_000):
+        """
+        Inicializa o cache.
+        
+        Args:
+            max_entries: Número máximo de caminhos guardados
+            max_cells: Limite de memória, em células somadas de todos os caminhos
+        
+        Raises:
+            ValueError: Se algum limite não for positivo
+        """
+        if max_entries < 1 or max_cells < 1:
+            raise ValueError("max_entries e max_cells devem ser positivos")
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[CacheKey, SearchResult]' = OrderedDict()
+        self._cells = 0
+        self._mazes = weakref.WeakKeyDictionary()  # Maze -> (número, versão conhecida)
+        self._maze_ids = itertools.count(1)
+    
+    @staticmethod
+    def _size(result: SearchResult) -> int:
+        """Células ocupadas por um resultado (sem caminho conta como 1)."""
+        return len(result.path) if result.path else 1
+    
+    def _check_maze(self, maze: Maze) -> Tuple[int, int]:
+        """Retorna (número, versão) do labirinto e descarta entradas de versões antigas."""
+        known = self._mazes.get(maze)
+        if known is None:
+            known = (next(self._maze_ids), maze.version)
+        elif known[1] != maze.version:
+            self._drop(known[0])
+            known = (known[0], maze.version)
+        self._mazes[maze] = known
+        return known
+    
+    def _drop(self, maze_id: int) -> int:
+        """Remove as entradas de um número de labirinto."""
+        stale = [key for key in self._entries if key[0] == maze_id]
+        for key in stale:
+            self._cells -= self._size(self._entries.pop(key))
+        return len(stale)
+    
+    def invalidate(self, maze: Maze) -> int:
+        """
+        Remove todas as entradas de um labirinto.
+        
+        Args:
+            maze: Objeto Maze
+        
+        Returns:
+            Número de entradas removidas
+        """
+        known = self._mazes.get(maze)
+        return self._drop(known[0]) if known is not None else 0
+    
+    def _store(self, key: CacheKey, result: SearchResult) -> None:
+        """Guarda um resultado, removendo os menos usados se necessário."""
+        size = self._size(result)
+        if size > self.max_cells:
+            return  # Maior que o cache inteiro: não vale a pena guardar
+        self._entries[key] = result
+        self._cells += size
+        while len(self._entries) > self.max_entries or self._cells > self.max_cells:
+            _, evicted = self._entries.popitem(last=False)
+            self._cells -= self._size(evicted)
+            self.evictions += 1
+    
+    def find_path(self, maze: Maze, start: Tuple[int, int], end: Tuple[int, int],
+                  allow_diagonal: bool = False, use_euclidean: bool = False,
+                  engine: str = 'flat') -> SearchResult:
+        """
+        Retorna o caminho de start até end, consultando o cache antes do a_star.
+        
+        Em um acerto, é devolvida uma cópia do resultado guardado (com as
+        estatísticas da busca original).
+        
+        Args:
+            maze: Objeto Maze
+            start: Posição inicial (linha, coluna)
+            end: Posição objetivo (linha, coluna)
+            allow_diagonal: Se True, permite movimentos diagonais
+            use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+            engine: Motor do a_star usado nas falhas ('node', 'flat' ou 'jps')
+        
+        Returns:
+            SearchResult com o caminho (ou None) e as estatísticas da busca
+        """
+        start = (int(start[0]), int(start[1]))
+        end = (int(end[0]), int(end[1]))
+        maze_id, version = self._check_maze(maze)
+        key = (maze_id, version, start, end, bool(allow_diagonal),
+               'euclidean' if use_euclidean else 'manhattan', engine)
+        
+        result = self._entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return SearchResult(list(result.path) if result.path else None, result.cost,
+                                result.nodes_explored, result.nodes_generated,
+                                result.max_open_size, result.elapsed_ns, result.stale_pops)
+        
+        self.misses += 1
+        labels = maze.component_labels(allow_diagonal, build=False)
+        result = a_star(maze.grid, start, end, allow_diagonal=allow_diagonal,
+                        use_euclidean=use_euclidean, engine=engine,
+                        component_labels=labels)
+        if not result and labels is None:
+            # Só depois de uma busca sem solução vale rotular o grid inteiro: as
+            # próximas consultas sem solução nesta versão terminam sem busca
+            maze.component_labels(allow_diagonal)
+        self._store(key, result)
+        return result
+    
+    def clear(self) -> None:
+        """Remove todas as entradas (os contadores são mantidos)."""
+        self._entries.clear()
+        self._cells = 0
+    
+    def get_statistics(self) -> Dict:
+        """
+        Retorna estatísticas de uso do cache.
+        
+        Returns:
+            Dicionário com entradas, células, acertos, falhas, taxa de acerto e remoções
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'cells': self._cells,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) * 100 if lookups else 0.0,
+            'evictions': self.evictions
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        """Representação técnica do cache."""
+        return (f"PathCache(entries={len(self._entries)}/{self.max_entries}, "
+                f"cells={self._cells}/{self.max_cells}, hits={self.hits}, misses={self.misses})")
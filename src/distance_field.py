@@ -0,0 +1,313 @@
+"""
+Campo de distâncias até um objetivo (Dijkstra reverso de um-para-todos)
+Descrição: Calcula, com uma única busca a partir do objetivo, o custo mínimo de
+           todas as células até ele e o próximo passo de cada célula, de modo que
+           o caminho de qualquer início é lido em O(comprimento do caminho).
+"""
+
+import heapq
+import math
+import struct
+import sys
+import time
+from array import array
+from typing import Optional, Tuple
+
+from src.maze import Maze
+from src.pathfinder import (SearchResult, _DIAGONAL_MOVES, _ORTHOGONAL_MOVES,
+                            _neighbor_table, _pad_weights)
+
+
+# Formato em disco (.pfdf): cabeçalho fixo de 40 bytes, little-endian, seguido das
+# distâncias (float64, inf = inalcançável) e das direções (int8, -1 = nenhuma).
+#   magic(4s) versão(H) diagonal(B) pad(1) linhas(I) colunas(I) objetivo(ii)
+#   fingerprint(16s) - Maze.fingerprint() do grid usado no cálculo (zeros se desconhecido)
+FIELD_MAGIC = b'PFDF'
+FIELD_VERSION = 2
+_FIELD_HEADER = struct.Struct('<4sHBxIIii16s')
+_NO_FINGERPRINT = bytes(16)
+
+# Direção k = índice do movimento em _neighbor_table (ortogonais, depois diagonais)
+_MOVES = _ORTHOGONAL_MOVES + _DIAGONAL_MOVES
+
+
+class DistanceField:
+    """
+    Distâncias de todas as células até um objetivo fixo, com o próximo passo de cada uma.
+    
+    O custo segue a mesma convenção do a_star: entrar em uma célula custa o custo do
+    movimento (1 ou √2) vezes o peso da célula de destino.
+    
+    O campo reflete o grid no momento do cálculo: depois de alterar o labirinto
+    (ou ao carregar um arquivo salvo), verifique is_current e recalcule. O vínculo
+    é o fingerprint do conteúdo, que também é gravado em disco por save().
+    
+    Atributos:
+        goal (Tuple[int, int]): Posição do objetivo (linha, coluna)
+        rows (int): Número de linhas
+        cols (int): Número de colunas
+        allow_diagonal (bool): Se o campo foi calculado com movimentos diagonais
+        distances (array): Custo até o objetivo por célula (linha * colunas + coluna);
+            math.inf para células inalcançáveis ou obstáculos
+        directions (array): Índice do movimento em direção ao objetivo por célula;
+            -1 para o objetivo e para células inalcançáveis
+        nodes_settled (int): Número de células fechadas pelo Dijkstra
+        elapsed_ns (int): Tempo de cálculo em nanossegundos
+        fingerprint (Optional[str]): Maze.fingerprint() do grid usado no cálculo
+            (None se o campo foi calculado a partir de um grid sem Maze)
+    """
+    
+    def __init__(self, goal: Tuple[int, int], rows: int, cols: int, allow_diagonal: bool,
+                 distances: array, directions: array):
+        """
+        Inicializa o campo a partir de vetores já calculados.
+        
+        Args:
+            goal: Posição do objetivo (linha, coluna)
+            rows: Número de linhas
+            cols: Número de colunas
+            allow_diagonal: Se o campo usa movimentos diagonais
+            distances: Vetor 'd' com rows * cols distâncias
+            directions: Vetor 'b' com rows * cols direções
+        """
+        self.goal = goal
+        self.rows = rows
+        self.cols = cols
+        self.allow_diagonal = allow_diagonal
+        self.distances = distances
+        self.directions = directions
+        self.nodes_settled = 0
+        self.elapsed_ns = 0
+        self.fingerprint: Optional[str] = None
+    
+    @staticmethod
+    def compute(maze_grid, goal: Tuple[int, int],
+                allow_diagonal: bool = False) -> 'DistanceField':
+        """
+        Executa o Dijkstra reverso a partir do objetivo sobre o grid inteiro.
+        
+        Args:
+            maze_grid: Grid numérico (lista de listas ou array NumPy)
+            goal: Posição do objetivo (linha, coluna)
+            allow_diagonal: Se True, permite movimentos diagonais
+        
+        Returns:
+            Objeto DistanceField
+        
+        Raises:
+            ValueError: Se o objetivo estiver fora do grid ou sobre um obstáculo
+        """
+        started_ns = time.perf_counter_ns()
+        rows = len(maze_grid)
+        cols = len(maze_grid[0]) if rows > 0 else 0
+        goal = (int(goal[0]), int(goal[1]))
+        if (not (0 <= goal[0] < rows and 0 <= goal[1] < cols)
+                or maze_grid[goal[0]][goal[1]] == -1):
+            raise ValueError(f"Objetivo {goal} fora do labirinto ou sobre um obstáculo")
+        
+        weights, width = _pad_weights(maze_grid)
+        table = list(enumerate(_neighbor_table(width, allow_diagonal)))
+        distances = array('d', [math.inf]) * len(weights)
+        directions = array('b', [-1]) * len(weights)
+        
+        goal_index = (goal[0] + 1) * width + goal[1] + 1
+        distances[goal_index] = 0.0
+        heap = [(0.0, goal_index)]
+        nodes_settled = 0
+        
+        while heap:
+            distance, current = heapq.heappop(heap)
+            if distance > distances[current]:
+                continue  # Entrada obsoleta
+            nodes_settled += 1
+            
+            # Quem entra em `current` paga o peso de `current`
+            current_weight = weights[current]
+            for direction, (delta, move_cost) in table:
+                neighbor = current - delta
+                if weights[neighbor] == -1:
+                    continue
+                candidate = distance + move_cost * current_weight
+                if candidate < distances[neighbor]:
+                    distances[neighbor] = candidate
+                    directions[neighbor] = direction
+                    heapq.heappush(heap, (candidate, neighbor))
+        
+        # Remove a borda: as direções são relativas, então basta copiar as fatias
+        compact_distances = array('d')
+        compact_directions = array('b')
+        for row in range(rows):
+            offset = (row + 1) * width + 1
+            compact_distances.extend(distances[offset:offset + cols])
+            compact_directions.extend(directions[offset:offset + cols])
+        
+        field = DistanceField(goal, rows, cols, allow_diagonal,
+                              compact_distances, compact_directions)
+        field.nodes_settled = nodes_settled
+        field.elapsed_ns = time.perf_counter_ns() - started_ns
+        return field
+    
+    @staticmethod
+    def from_maze(maze: Maze, allow_diagonal: bool = False,
+                  goal: Optional[Tuple[int, int]] = None) -> 'DistanceField':
+        """
+        Calcula o campo de um labirinto (por padrão, até maze.end).
+        
+        Args:
+            maze: Objeto Maze
+            allow_diagonal: Se True, permite movimentos diagonais
+            goal: Objetivo alternativo (padrão: maze.end)
+        
+        Returns:
+            Objeto DistanceField
+        """
+        field = DistanceField.compute(maze.grid, goal or maze.end, allow_diagonal)
+        field.fingerprint = maze.fingerprint()
+        return field
+    
+    def is_current(self, maze: Maze) -> bool:
+        """Verifica se o campo ainda corresponde ao conteúdo do labirinto."""
+        return (self.fingerprint is not None and
+                (self.rows, self.cols) == (maze.rows, maze.cols) and
+                self.fingerprint == maze.fingerprint())
+    
+    def _index(self, position: Tuple[int, int]) -> int:
+        """Converte (linha, coluna) em índice, validando os limites."""
+        row, col = position
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Posição {position} fora do labirinto")
+        return row * self.cols + col
+    
+    def distance(self, position: Tuple[int, int]) -> float:
+        """
+        Retorna o custo mínimo da posição até o objetivo.
+        
+        Args:
+            position: Tupla (linha, coluna)
+        
+        Returns:
+            Custo até o objetivo, ou math.inf se a posição não alcança o objetivo
+        """
+        return self.distances[self._index(position)]
+    
+    def next_step(self, position: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Retorna a próxima célula no caminho ótimo até o objetivo.
+        
+        Args:
+            position: Tupla (linha, coluna)
+        
+        Returns:
+            Próxima posição, ou None no objetivo e em células inalcançáveis
+        """
+        direction = self.directions[self._index(position)]
+        if direction < 0:
+            return None
+        dr, dc = _MOVES[direction]
+        return position[0] + dr, position[1] + dc
+    
+    def path_from(self, start: Tuple[int, int], maze: Optional[Maze] = None) -> SearchResult:
+        """
+        Lê o caminho ótimo de start até o objetivo seguindo as direções.
+        
+        Sem maze, o resultado vale para o grid do cálculo, que pode já ter mudado.
+        
+        Args:
+            start: Posição inicial (linha, coluna)
+            maze: Labirinto a consultar (opcional); se informado, o campo precisa
+                estar atualizado (is_current)
+        
+        Returns:
+            SearchResult com o caminho e o custo (caminho None se inalcançável)
+        
+        Raises:
+            ValueError: Se maze for informado e o campo estiver desatualizado
+        """
+        if maze is not None and not self.is_current(maze):
+            raise ValueError("Campo de distâncias desatualizado: o labirinto mudou "
+                             "desde o cálculo. Recalcule com DistanceField.from_maze.")
+        started_ns = time.perf_counter_ns()
+        index = self._index(start)
+        cost = self.distances[index]
+        if cost == math.inf:
+            return SearchResult(None, None, elapsed_ns=time.perf_counter_ns() - started_ns)
+        
+        cols = self.cols
+        directions = self.directions
+        row, col = start
+        path = [(row, col)]
+        direction = directions[index]
+        while direction >= 0:
+            dr, dc = _MOVES[direction]
+            row += dr
+            col += dc
+            path.append((row, col))
+            direction = directions[row * cols + col]
+        return SearchResult(path, cost, elapsed_ns=time.perf_counter_ns() - started_ns)
+    
+    def save(self, file_path: str) -> None:
+        """
+        Salva o campo em disco para reutilização.
+        
+        Args:
+            file_path: Caminho do arquivo de destino
+        """
+        fingerprint = (bytes.fromhex(self.fingerprint) if self.fingerprint is not None
+                       else _NO_FINGERPRINT)
+        header = _FIELD_HEADER.pack(FIELD_MAGIC, FIELD_VERSION, int(self.allow_diagonal),
+                                    self.rows, self.cols, *self.goal, fingerprint)
+        distances = array('d', self.distances)
+        if sys.byteorder == 'big':
+            distances.byteswap()
+        with open(file_path, 'wb') as f:
+            f.write(header)
+            f.write(distances.tobytes())
+            f.write(self.directions.tobytes())
+    
+    @staticmethod
+    def load(file_path: str) -> 'DistanceField':
+        """
+        Carrega um campo salvo com save().
+        
+        Args:
+            file_path: Caminho do arquivo .pfdf
+        
+        Returns:
+            Objeto DistanceField
+        
+        Raises:
+            ValueError: Se o arquivo não estiver no formato esperado
+        """
+        with open(file_path, 'rb') as f:
+            raw_header = f.read(_FIELD_HEADER.size)
+            if len(raw_header) < _FIELD_HEADER.size or raw_header[:4] != FIELD_MAGIC:
+                raise ValueError(f"'{file_path}' não é um campo de distâncias válido.")
+            
+            _, version, diagonal, rows, cols, goal_row, goal_col, fingerprint = \
+                _FIELD_HEADER.unpack(raw_header)
+            if version != FIELD_VERSION:
+                raise ValueError(f"Versão {version} do campo de distâncias não suportada.")
+            
+            cells = rows * cols
+            distances = array('d')
+            directions = array('b')
+            try:
+                distances.fromfile(f, cells)
+                directions.fromfile(f, cells)
+            except EOFError:
+                raise ValueError("Arquivo truncado: tamanho não confere com o cabeçalho.")
+            if f.read(1):
+                raise ValueError("Tamanho do arquivo não confere com o cabeçalho.")
+        
+        if sys.byteorder == 'big':
+            distances.byteswap()
+        field = DistanceField((goal_row, goal_col), rows, cols, bool(diagonal),
+                              distances, directions)
+        if fingerprint != _NO_FINGERPRINT:
+            field.fingerprint = fingerprint.hex()
+        return field
+    
+    def __repr__(self) -> str:
+        """Representação técnica do campo."""
+        return (f"DistanceField(goal={self.goal}, rows={self.rows}, cols={self.cols}, "
+                f"allow_diagonal={self.allow_diagonal})")
@@ -0,0 +1,387 @@
+"""
+Replanejamento incremental com D* Lite
+Descrição: Planejador que mantém o estado da busca entre chamadas e aceita
+           alterações de células (pesos e obstáculos), reparando apenas a parte
+           afetada da busca em vez de recomeçar o A* do zero.
+"""
+
+import heapq
+import math
+import time
+from typing import Optional, Tuple
+
+from src.maze import Maze
+from src.pathfinder import SearchResult, _DIAGONAL_COST, _neighbor_table, _pad_weights
+
+
+class DStarLite:
+    """
+    Planejador D* Lite (Koenig e Likhachev, versão otimizada) sobre o grid com borda.
+    
+    A busca é feita do objetivo para o início: g(s) é o custo de s até o objetivo e
+    rhs(s) é a estimativa de um passo, min(custo(s, s') + g(s')). As células com
+    g != rhs ficam na fila de prioridade, e cada alteração de peso só recoloca na
+    fila a célula alterada e seus vizinhos. O custo da aresta s -> s' segue a
+    convenção do a_star (custo do movimento vezes o peso de s'), então as arestas
+    são direcionadas.
+    
+    Atributos:
+        start (Tuple[int, int]): Posição atual do início (linha, coluna)
+        end (Tuple[int, int]): Posição do objetivo (linha, coluna)
+        rows (int): Número de linhas
+        cols (int): Número de colunas
+        allow_diagonal (bool): Se movimentos diagonais são permitidos
+        use_euclidean (bool): Se a heurística é a distância Euclidiana
+        synced_version (int): Versão do Maze já aplicada (veja sync)
+    """
+    
+    def __init__(self, maze_grid, start: Tuple[int, int], end: Tuple[int, int],
+                 allow_diagonal: bool = False, use_euclidean: bool = False):
+        """
+        Inicializa o planejador (a primeira busca acontece em plan()).
+        
+        Args:
+            maze_grid: Grid numérico (lista de listas ou array NumPy); é copiado
+            start: Posição inicial (linha, coluna)
+            end: Posição objetivo (linha, coluna)
+            allow_diagonal: Se True, permite movimentos diagonais
+            use_euclidean: Se True, usa distância Euclidiana; caso contrário, octil
+                (com diagonais) ou Manhattan
+        
+        Raises:
+            ValueError: Se o início ou o fim estiverem fora do grid ou sobre obstáculos
+        """
+        self.allow_diagonal = allow_diagonal
+        self.use_euclidean = use_euclidean
+        self.synced_version = 0
+        self._reset(maze_grid, start, end)
+    
+    def _reset(self, maze_grid, start: Tuple[int, int], end: Tuple[int, int]) -> None:
+        """Copia o grid e reinicia todo o estado da busca."""
+        self.rows = len(maze_grid)
+        self.cols = len(maze_grid[0]) if self.rows > 0 else 0
+        self._weights, self._width = _pad_weights(maze_grid)
+        self._table = _neighbor_table(self._width, self.allow_diagonal)
+        
+        for label, position in (("início", start), ("fim", end)):
+            if not self._is_free(position):
+                raise ValueError(f"Posição de {label} {position} fora do labirinto "
+                                 "ou sobre um obstáculo")
+        self.start = (int(start[0]), int(start[1]))
+        self.end = (int(end[0]), int(end[1]))
+        
+        size = len(self._weights)
+        self._g = [math.inf] * size
+        self._rhs = [math.inf] * size
+        self._start_index = self._index(self.start)
+        self._goal_index = self._index(self.end)
+        self._last_start_index = self._start_index
+        self._km = 0.0
+        
+        # Fila com remoção preguiçosa: uma entrada só vale se a chave for a de _open
+        self._heap = []
+        self._open = {}
+        
+        # Estatísticas da chamada atual de plan()
+        self._expanded = 0
+        self._generated = 0
+        self._stale_pops = 0
+        self._max_open_size = 0
+        
+        self._rhs[self._goal_index] = 0.0
+        self._push(self._goal_index)
+    
+    @staticmethod
+    def from_maze(maze: Maze, allow_diagonal: bool = False,
+                  use_euclidean: bool = False) -> 'DStarLite':
+        """
+        Cria o planejador para maze.start -> maze.end.
+        
+        Args:
+            maze: Objeto Maze
+            allow_diagonal: Se True, permite movimentos diagonais
+            use_euclidean: Se True, usa distância Euclidiana
+        
+        Returns:
+            Objeto DStarLite
+        """
+        planner = DStarLite(maze.grid, maze.start, maze.end, allow_diagonal, use_euclidean)
+        planner.synced_version = maze.version
+        return planner
+    
+    def _index(self, position: Tuple[int, int]) -> int:
+        """Converte (linha, coluna) para o índice no grid com borda."""
+        return (position[0] + 1) * self._width + position[1] + 1
+    
+    def _position(self, index: int) -> Tuple[int, int]:
+        """Converte um índice do grid com borda para (linha, coluna)."""
+        row, col = divmod(index, self._width)
+        return row - 1, col - 1
+    
+    def _is_free(self, position: Tuple[int, int]) -> bool:
+        """Verifica se a posição está dentro do grid e não é obstáculo."""
+        row, col = position
+        return (0 <= row < self.rows and 0 <= col < self.cols and
+                self._weights[self._index(position)] != -1)
+    
+    def _heuristic(self, index: int) -> float:
+        """Estimativa consistente do custo entre o início atual e a célula."""
+        row, col = divmod(index, self._width)
+        start_row, start_col = divmod(self._start_index, self._width)
+        d_row, d_col = abs(row - start_row), abs(col - start_col)
+        if self.use_euclidean:
+            return math.sqrt(d_row ** 2 + d_col ** 2)
+        if self.allow_diagonal:
+            return (_DIAGONAL_COST - 1) * min(d_row, d_col) + max(d_row, d_col)
+        return d_row + d_col
+    
+    def _key(self, index: int) -> Tuple[float, float]:
+        """Chave de prioridade [min(g, rhs) + h + km; min(g, rhs)]."""
+        best = min(self._g[index], self._rhs[index])
+        return best + self._heuristic(index) + self._km, best
+    
+    def _push(self, index: int) -> None:
+        """Insere ou atualiza a célula na fila com a chave atual."""
+        key = self._key(index)
+        if index not in self._open:
+            if len(self._open) + 1 > self._max_open_size:
+                self._max_open_size = len(self._open) + 1
+        self._open[index] = key
+        self._generated += 1
+        heapq.heappush(self._heap, (key[0], key[1], index))
+    
+    def _top(self) -> Optional[Tuple[float, float, int]]:
+        """Retorna a entrada válida de menor chave, descartando as obsoletas."""
+        heap = self._heap
+        while heap:
+            k1, k2, index = heap[0]
+            if self._open.get(index) == (k1, k2):
+                return heap[0]
+            heapq.heappop(heap)
+            self._stale_pops += 1
+        return None
+    
+    def _best_successor_cost(self, index: int) -> float:
+        """Calcula rhs: min(custo(s, s') + g(s')) sobre os sucessores de s."""
+        weights = self._weights
+        if weights[index] == -1:
+            return math.inf
+        g = self._g
+        best = math.inf
+        for delta, move_cost in self._table:
+            neighbor = index + delta
+            weight = weights[neighbor]
+            if weight != -1:
+                candidate = g[neighbor] + move_cost * weight
+                if candidate < best:
+                    best = candidate
+        return best
+    
+    def _update_vertex(self, index: int) -> None:
+        """Recoloca a célula na fila se estiver inconsistente (g != rhs)."""
+        if self._g[index] != self._rhs[index]:
+            self._push(index)
+        elif index in self._open:
+            del self._open[index]  # A entrada no heap fica obsoleta
+    
+    def _compute_shortest_path(self) -> None:
+        """Expande células inconsistentes até o início ficar consistente."""
+        g = self._g
+        rhs = self._rhs
+        weights = self._weights
+        table = self._table
+        start_index = self._start_index
+        goal_index = self._goal_index
+        
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            k1, k2, current = top
+            start_key = self._key(start_index)
+            if (k1, k2) >= start_key and rhs[start_index] <= g[start_index]:
+                break
+            
+            new_key = self._key(current)
+            if (k1, k2) < new_key:
+                # Chave desatualizada (km ou heurística mudaram): reinsere
+                self._push(current)
+                continue
+            
+            heapq.heappop(self._heap)
+            del self._open[current]
+            self._expanded += 1
+            current_weight = weights[current]
+            
+            if g[current] > rhs[current]:
+                # Sobreconsistente: fixa g e relaxa os predecessores
+                g[current] = rhs[current]
+                if current_weight == -1:
+                    continue
+                current_g = g[current]
+                for delta, move_cost in table:
+                    predecessor = current - delta
+                    if predecessor == goal_index or weights[predecessor] == -1:
+                        continue
+                    candidate = current_g + move_cost * current_weight
+                    if candidate < rhs[predecessor]:
+                        rhs[predecessor] = candidate
+                        self._update_vertex(predecessor)
+            else:
+                # Subconsistente: invalida g e recalcula quem dependia dela
+                old_g = g[current]
+                g[current] = math.inf
+                if current != goal_index:
+                    rhs[current] = self._best_successor_cost(current)
+                self._update_vertex(current)
+                if current_weight == -1:
+                    continue
+                for delta, move_cost in table:
+                    predecessor = current - delta
+                    if predecessor == goal_index or weights[predecessor] == -1:
+                        continue
+                    if rhs[predecessor] == old_g + move_cost * current_weight:
+                        rhs[predecessor] = self._best_successor_cost(predecessor)
+                        self._update_vertex(predecessor)
+    
+    def get_cell_weight(self, position: Tuple[int, int]) -> int:
+        """
+        Retorna o peso atual de uma célula no planejador.
+        
+        Args:
+            position: Tupla (linha, coluna)
+        
+        Returns:
+            Peso da célula (-1 para obstáculo ou fora dos limites)
+        """
+        row, col = position
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return -1
+        return self._weights[self._index(position)]
+    
+    def set_cell_weight(self, position: Tuple[int, int], weight: int) -> None:
+        """
+        Altera o peso de uma célula (use -1 para criar um obstáculo).
+        
+        Apenas a célula e seus vizinhos têm o rhs recalculado; o reparo da busca
+        acontece na próxima chamada de plan().
+        
+        Args:
+            position: Tupla (linha, coluna)
+            weight: Novo peso (>= 1) ou -1 para obstáculo
+        
+        Raises:
+            ValueError: Se a posição estiver fora do grid, o peso for inválido ou se
+                a alteração transformar o início ou o fim em obstáculo
+        """
+        row, col = position
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"Posição {position} fora do labirinto")
+        if weight != -1 and weight < 1:
+            raise ValueError(f"Peso inválido: {weight} (use -1 para obstáculo ou >= 1)")
+        index = self._index(position)
+        if weight == -1 and index in (self._start_index, self._goal_index):
+            raise ValueError("Não é possível transformar o início ou o fim em obstáculo")
+        if self._weights[index] == weight:
+            return
+        
+        self._weights[index] = weight
+        # Mudam as arestas que entram na célula e, se ela virou/deixou de ser
+        # obstáculo, também as que saem dela: basta recalcular rhs da célula e
+        # de todos os vizinhos
+        rhs = self._rhs
+        for affected in [index] + [index - delta for delta, _ in self._table]:
+            if affected != self._goal_index:
+                rhs[affected] = self._best_successor_cost(affected)
+                self._update_vertex(affected)
+    
+    def sync(self, maze: Maze) -> int:
+        """
+        Aplica ao planejador as alterações feitas no Maze desde a última sincronização.
+        
+        As alterações vêm do diário do labirinto (Maze.changes_since). Se o diário
+        não cobrir mais a versão sincronizada, o estado da busca é reconstruído a
+        partir do grid atual, mantendo o início.
+        
+        Args:
+            maze: Labirinto de origem do planejador (o mesmo de from_maze)
+        
+        Returns:
+            Número de alterações de célula aplicadas (-1 se houve reconstrução)
+        """
+        changes = maze.changes_since(self.synced_version)
+        if changes is None:
+            self._reset(maze.grid, self.start, self.end)
+            self.synced_version = maze.version
+            return -1
+        for row, col, _, new in changes:
+            self.set_cell_weight((row, col), new)
+        self.synced_version = maze.version
+        return len(changes)
+    
+    def move_start(self, position: Tuple[int, int]) -> None:
+        """
+        Move o início (por exemplo, após o robô andar ao longo do caminho).
+        
+        Args:
+            position: Nova posição inicial (linha, coluna)
+        
+        Raises:
+            ValueError: Se a posição estiver fora do grid ou sobre um obstáculo
+        """
+        if not self._is_free(position):
+            raise ValueError(f"Posição de início {position} fora do labirinto "
+                             "ou sobre um obstáculo")
+        self.start = (int(position[0]), int(position[1]))
+        self._start_index = self._index(self.start)
+        # km compensa a mudança da heurística sem reordenar a fila
+        self._km += self._heuristic(self._last_start_index)
+        self._last_start_index = self._start_index
+    
+    def plan(self) -> SearchResult:
+        """
+        Repara a busca e retorna o caminho atual do início até o objetivo.
+        
+        A primeira chamada equivale a um A* reverso completo; as seguintes só
+        reexpandem as células afetadas pelas alterações desde a chamada anterior.
+        
+        Returns:
+            SearchResult com o caminho (ou None) e as estatísticas desta chamada
+        """
+        started_ns = time.perf_counter_ns()
+        self._expanded = 0
+        self._generated = 0
+        self._stale_pops = 0
+        self._max_open_size = len(self._open)
+        self._compute_shortest_path()
+        
+        path = None
+        cost = self._rhs[self._start_index]
+        if cost != math.inf:
+            g = self._g
+            weights = self._weights
+            current = self._start_index
+            path = [self._position(current)]
+            # Segue o sucessor de menor custo(s, s') + g(s') até o objetivo
+            for _ in range(len(weights)):
+                if current == self._goal_index:
+                    break
+                best, best_cost = -1, math.inf
+                for delta, move_cost in self._table:
+                    neighbor = current + delta
+                    weight = weights[neighbor]
+                    if weight != -1:
+                        candidate = g[neighbor] + move_cost * weight
+                        if candidate < best_cost:
+                            best, best_cost = neighbor, candidate
+                if best == -1:
+                    path = None
+                    break
+                current = best
+                path.append(self._position(current))
+            else:
+                path = None
+        
+        return SearchResult(path, cost if path else None, self._expanded, self._generated,
+                            self._max_open_size, time.perf_counter_ns() - started_ns,
+                            self._stale_pops)
@@ -2,20 +2,48 @@
 Módulo para interface gráfica do PathFinder usando Pygame.
 Autor: Guilherme Martini
 Branch: feature/gui-pygame
-"""import pygame
+"""
+
+import pygame
 import sys
 import time
-from typing import List, Tuple, Optional, Set
+from typing import Dict, List, Tuple, Optional, Set
 from src.maze import Maze
+from src.pathfinder import SearchResult, SearchSpace, _in_different_components
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional (quadros montados com pygame.surfarray)
+    np = None
 
 
 class MazeGUI:
     """
     Interface gráfica para visualização de labirintos e algoritmo A*.
     
+    O labirinto aparece em uma janela de visualização (viewport) com rolagem e
+    zoom, e só as células visíveis são desenhadas. O terreno é guardado como um
+    código por célula (peso, obstáculo, início, fim) e o estado da busca em uma
+    camada de estado (um byte por célula). Com NumPy, o redesenho completo é
+    montado de uma vez com pygame.surfarray; sem NumPy, a partir de uma superfície
+    de fundo em cache. Nos demais quadros só as células cujo estado mudou e o
+    painel de informações são redesenhados e enviados à tela com
+    pygame.display.update(rects).
+    
+    Em zoom baixo (menos de um pixel por célula, apenas com NumPy) a janela mostra
+    uma visão geral: cada pixel resume um bloco de células pelo código de maior
+    prioridade (fim > início > caminho > atual > explorado > obstáculo > peso).
+    Bordas e rótulos só são desenhados quando as células são grandes o bastante.
+    
+    Controles: roda do mouse ou +/- para zoom, setas ou arrastar com o mouse para
+    mover, Home para enquadrar o labirinto inteiro.
+    
     Atributos:
-        cell_size (int): Tamanho de cada célula em pixels
-        margin (int): Margem entre células em pixels
+        cell_size (int): Tamanho de cada célula em pixels no zoom atual
+        margin (int): Margem entre células em pixels no zoom atual
+        pool (int): Lado do bloco de células por pixel na visão geral (1 = células)
+        view_x (int): Deslocamento horizontal da visualização, em pixels
+        view_y (int): Deslocamento vertical da visualização, em pixels
         fps (int): Frames por segundo para animação
     """
     
@@ -45,28 +73,70 @@ class MazeGUI:
         10: (139, 0, 0)       # Vermelho escuro - custo alto
     }
     
-    def __init__(self, maze: Maze, cell_size: int = 40, margin: int = 2, fps: int = 30):
+    # Códigos da camada de estado (maior código = maior prioridade)
+    STATE_NONE = 0
+    STATE_EXPLORED = 1
+    STATE_CURRENT = 2
+    STATE_PATH = 3
+    
+    # Códigos de célula (índices de CODE_COLORS): 0-10 peso do terreno (limitado a
+    # 10), 11 obstáculo, 12-14 estados (CODE_STATE + estado), 15 início e 16 fim
+    CODE_WALL = 11
+    CODE_STATE = 11
+    CODE_START = 15
+    CODE_END = 16
+    CODE_COLORS = ((COLOR_FREE,) + tuple(TERRAIN_COLORS.values()) +
+                   (COLOR_WALL, COLOR_EXPLORED, COLOR_CURRENT, COLOR_PATH, COLOR_START, COLOR_END))
+    
+    # Níveis de zoom: tamanhos de célula e, abaixo de 1 pixel, lados dos blocos
+    # da visão geral
+    CELL_SIZES = (1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 40, 48, 64)
+    OVERVIEW_POOLS = (64, 32, 16, 8, 4, 2)
+    MIN_BORDER_SIZE = 4   # Bordas a partir deste tamanho de célula
+    MIN_MARGIN_SIZE = 8   # Margem entre células a partir deste tamanho
+    MIN_LABEL_SIZE = 14   # Pesos e letras S/E a partir deste tamanho
+    
+    def __init__(self, maze: Maze, cell_size: int = 40, margin: int = 2, fps: int = 30,
+                 max_view_size: Tuple[int, int] = (1000, 760)):
         """
         Inicializa a interface gráfica.
         
         Args:
             maze: Objeto Maze a ser visualizado
-            cell_size: Tamanho de cada célula em pixels
+            cell_size: Tamanho de cada célula em pixels (zoom inicial; é reduzido
+                se o labirinto não couber em max_view_size)
             margin: Espaçamento entre células
             fps: Frames por segundo para animação
+            max_view_size: Tamanho máximo (largura, altura) da área do labirinto
         """
         self.maze = maze
-        self.cell_size = cell_size
-        self.margin = margin
+        self.base_margin = margin
         self.fps = fps
         
-        # Calcula dimensões da janela
+        # Níveis de zoom (tamanho da célula, lado do bloco); a visão geral precisa de NumPy
+        self.zoom_levels: List[Tuple[int, int]] = []
+        if np is not None:
+            self.zoom_levels += [(1, pool) for pool in self.OVERVIEW_POOLS]
+        self.zoom_levels += [(size, 1) for size in sorted(set(self.CELL_SIZES) | {cell_size})]
+        
+        # Zoom inicial: o tamanho pedido ou o maior nível menor em que o labirinto cabe
+        max_width, max_height = max_view_size
+        requested = self.zoom_levels.index((cell_size, 1))
+        fitting = [index for index in range(requested + 1)
+                   if self._grid_size(index)[0] <= max_width
+                   and self._grid_size(index)[1] <= max_height]
+        self._apply_zoom(fitting[-1] if fitting else 0)
+        
+        # Calcula dimensões da janela (a área do labirinto não muda com o zoom)
+        grid_width, grid_height = self._grid_size(self.zoom_index)
+        self.view_width = max(1, min(grid_width, max_width))
+        self.view_height = max(1, min(grid_height, max_height))
+        self.view_x = 0
+        self.view_y = 0
         self.info_panel_width = 300
-        self.info_panel_height = 150
-        self.grid_width = maze.cols * (cell_size + margin) + margin
-        self.grid_height = maze.rows * (cell_size + margin) + margin
-        self.window_width = self.grid_width + self.info_panel_width
-        self.window_height = max(self.grid_height, self.info_panel_height) + 100
+        self.info_panel_height = 350
+        self.window_width = self.view_width + self.info_panel_width
+        self.window_height = max(self.view_height, self.info_panel_height) + 100
         
         # Estado da visualização
         self.explored_cells: Set[Tuple[int, int]] = set()
@@ -75,6 +145,24 @@ class MazeGUI:
         self.cost: float = 0.0
         self.is_complete: bool = False
         self.animation_speed: float = 0.05  # segundos entre frames
+        self._path_cells: Set[Tuple[int, int]] = set()
+        
+        # Renderização incremental
+        self._dirty_cells: Set[Tuple[int, int]] = set()
+        self._panel_dirty: bool = True
+        self._needs_full_redraw: bool = True
+        self._state = bytearray(maze.rows * maze.cols)
+        self._state_stale: bool = False
+        self._terrain = None          # Código de cada célula (bytearray ou array NumPy)
+        self._terrain_version: Optional[int] = None
+        self._code_pixels = None      # CODE_COLORS no formato de pixel (apenas com NumPy)
+        self._background: Optional[pygame.Surface] = None  # Apenas sem NumPy
+        self._background_key: Optional[tuple] = None
+        
+        # Cache de textos renderizados: textos fixos por conteúdo e linhas
+        # variáveis do painel por posição (re-renderizadas só quando mudam)
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+        self._slot_cache: Dict[str, Tuple[tuple, pygame.Surface]] = {}
         
         # Pygame
         pygame.init()
@@ -84,6 +172,122 @@ class MazeGUI:
         self.font = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 18)
         self.font_large = pygame.font.Font(None, 36)
+        self.build_terrain()
+    
+    @property
+    def view_rect(self) -> pygame.Rect:
+        """Retângulo da área do labirinto na tela."""
+        return pygame.Rect(0, 0, self.view_width, self.view_height)
+    
+    def _margin_for(self, size: int) -> int:
+        """Margem usada para um tamanho de célula (células pequenas ficam coladas)."""
+        return self.base_margin if size >= self.MIN_MARGIN_SIZE else 0
+    
+    def _grid_size(self, zoom_index: int) -> Tuple[int, int]:
+        """Tamanho em pixels do labirinto inteiro em um nível de zoom."""
+        size, pool = self.zoom_levels[zoom_index]
+        if pool > 1:
+            return -(-self.maze.cols // pool), -(-self.maze.rows // pool)
+        margin = self._margin_for(size)
+        step = size + margin
+        return self.maze.cols * step + margin, self.maze.rows * step + margin
+    
+    def _apply_zoom(self, zoom_index: int) -> None:
+        """Ajusta cell_size, margin e pool para um nível de zoom."""
+        self.zoom_index = zoom_index
+        self.cell_size, self.pool = self.zoom_levels[zoom_index]
+        self.margin = self._margin_for(self.cell_size) if self.pool == 1 else 0
+    
+    def _pixels_per_cell(self) -> float:
+        """Escala do zoom atual em pixels por célula."""
+        if self.pool > 1:
+            return 1.0 / self.pool
+        return self.cell_size + self.margin
+    
+    def _clamp_view(self) -> None:
+        """Mantém o deslocamento da visualização dentro do labirinto."""
+        grid_width, grid_height = self._grid_size(self.zoom_index)
+        self.view_x = max(0, min(self.view_x, grid_width - self.view_width))
+        self.view_y = max(0, min(self.view_y, grid_height - self.view_height))
+    
+    def set_zoom(self, zoom_index: int, anchor: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Muda o nível de zoom mantendo fixo o ponto do labirinto sob anchor.
+        
+        Args:
+            zoom_index: Índice em zoom_levels (limitado aos níveis existentes)
+            anchor: Ponto da área do labirinto na tela (padrão: centro)
+        """
+        zoom_index = max(0, min(len(self.zoom_levels) - 1, zoom_index))
+        if zoom_index == self.zoom_index:
+            return
+        if anchor is None:
+            anchor = (self.view_width // 2, self.view_height // 2)
+        
+        old_scale = self._pixels_per_cell()
+        cell_x = (self.view_x + anchor[0]) / old_scale
+        cell_y = (self.view_y + anchor[1]) / old_scale
+        self._apply_zoom(zoom_index)
+        new_scale = self._pixels_per_cell()
+        self.view_x = int(cell_x * new_scale) - anchor[0]
+        self.view_y = int(cell_y * new_scale) - anchor[1]
+        self._clamp_view()
+        self._panel_dirty = True
+        self.invalidate()
+    
+    def zoom_to_fit(self) -> None:
+        """Escolhe o maior zoom em que o labirinto inteiro cabe na visualização."""
+        fitting = [index for index in range(len(self.zoom_levels))
+                   if self._grid_size(index)[0] <= self.view_width
+                   and self._grid_size(index)[1] <= self.view_height]
+        self._apply_zoom(fitting[-1] if fitting else 0)
+        self.view_x = self.view_y = 0
+        self._panel_dirty = True
+        self.invalidate()
+    
+    def scroll(self, dx: int, dy: int) -> None:
+        """
+        Desloca a visualização.
+        
+        Args:
+            dx: Deslocamento horizontal em pixels
+            dy: Deslocamento vertical em pixels
+        """
+        old_view = (self.view_x, self.view_y)
+        self.view_x += dx
+        self.view_y += dy
+        self._clamp_view()
+        if (self.view_x, self.view_y) != old_view:
+            self.invalidate()
+    
+    def render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+                    slot: Optional[str] = None) -> pygame.Surface:
+        """
+        Renderiza um texto reaproveitando superfícies já renderizadas.
+        
+        Args:
+            font: Fonte usada
+            text: Texto a renderizar
+            color: Cor do texto
+            slot: Para textos que mudam (contadores do painel), nome da posição
+                onde o texto aparece; só a última versão de cada posição é guardada
+        
+        Returns:
+            Superfície com o texto
+        """
+        key = (font, text, color)
+        if slot is not None:
+            cached = self._slot_cache.get(slot)
+            if cached is None or cached[0] != key:
+                cached = (key, font.render(text, True, color))
+                self._slot_cache[slot] = cached
+            return cached[1]
+        
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
     
     def get_cell_color(self, row: int, col: int) -> Tuple[int, int, int]:
         """
@@ -96,76 +300,330 @@ class MazeGUI:
         Returns:
             Tupla RGB da cor
         """
-        pos = (row, col)
-        cell_value = self.maze.grid[row][col]
-        
-        # Prioridade: caminho > atual > explorado > especiais > terreno
-        if self.path and pos in self.path:
-            return self.COLOR_PATH
+        index = row * self.maze.cols + col
+        state = self._state[index]
+        if state:
+            return self.CODE_COLORS[self.CODE_STATE + state]
+        return self.CODE_COLORS[self._terrain[index]]
+    
+    def _cell_state(self, pos: Tuple[int, int]) -> int:
+        """Calcula o código de estado de uma célula a partir do estado da busca."""
+        # Prioridade: caminho > atual > explorado > terreno
+        if pos in self._path_cells:
+            return self.STATE_PATH
         elif pos == self.current_cell and not self.is_complete:
-            return self.COLOR_CURRENT
+            return self.STATE_CURRENT
         elif pos in self.explored_cells:
-            return self.COLOR_EXPLORED
-        elif pos == self.maze.start:
-            return self.COLOR_START
+            return self.STATE_EXPLORED
+        return self.STATE_NONE
+    
+    def _rebuild_state(self) -> None:
+        """Reconstrói a camada de estado inteira a partir dos conjuntos."""
+        cols = self.maze.cols
+        state = bytearray(self.maze.rows * cols)
+        current = set()
+        if self.current_cell is not None and not self.is_complete:
+            current.add(self.current_cell)
+        for cells, code in ((self.explored_cells, self.STATE_EXPLORED),
+                            (current, self.STATE_CURRENT),
+                            (self._path_cells, self.STATE_PATH)):
+            for row, col in cells:
+                state[row * cols + col] = code
+        self._state = state
+        self._state_stale = False
+    
+    def build_terrain(self) -> None:
+        """Calcula o código de terreno de cada célula (refeito se o labirinto mudar)."""
+        rows, cols = self.maze.rows, self.maze.cols
+        if np is not None:
+            grid = np.asarray(self.maze.grid).reshape(rows, cols)
+            terrain = np.clip(grid, 0, 10).astype(np.uint8)
+            terrain[grid == -1] = self.CODE_WALL
+            terrain = terrain.reshape(-1)
+            self._code_pixels = np.array([self.screen.map_rgb(color)
+                                          for color in self.CODE_COLORS], dtype=np.uint32)
+        else:
+            terrain = bytearray()
+            for row in self.maze.grid:
+                terrain.extend(self.CODE_WALL if value == -1 else min(max(value, 0), 10)
+                               for value in row)
+        
+        for position, code in ((self.maze.start, self.CODE_START), (self.maze.end, self.CODE_END)):
+            if position is not None:
+                terrain[position[0] * cols + position[1]] = code
+        self._terrain = terrain
+        self._terrain_version = self.maze.version
+        self.invalidate()
+    
+    def _visible_cells(self) -> Tuple[int, int, int, int]:
+        """
+        Retorna o intervalo de células visíveis no zoom e deslocamento atuais.
+        
+        Returns:
+            Tupla (primeira linha, linha final, primeira coluna, coluna final), com
+            os finais exclusivos; na visão geral, os inícios são múltiplos de pool
+        """
+        rows, cols = self.maze.rows, self.maze.cols
+        if self.pool > 1:
+            pool = self.pool
+            return (self.view_y * pool, min(rows, (self.view_y + self.view_height) * pool),
+                    self.view_x * pool, min(cols, (self.view_x + self.view_width) * pool))
+        step = self.cell_size + self.margin
+        return (max(0, (self.view_y - self.margin) // step),
+                min(rows, (self.view_y + self.view_height) // step + 1),
+                max(0, (self.view_x - self.margin) // step),
+                min(cols, (self.view_x + self.view_width) // step + 1))
+    
+    def cell_rect(self, row: int, col: int) -> pygame.Rect:
+        """
+        Retorna o retângulo de uma célula na tela (na visão geral, o pixel do bloco).
+        
+        Args:
+            row: Linha da célula
+            col: Coluna da célula
+        
+        Returns:
+            pygame.Rect da célula
+        """
+        if self.pool > 1:
+            return pygame.Rect(col // self.pool - self.view_x, row // self.pool - self.view_y, 1, 1)
+        x = col * (self.cell_size + self.margin) + self.margin - self.view_x
+        y = row * (self.cell_size + self.margin) + self.margin - self.view_y
+        return pygame.Rect(x, y, self.cell_size, self.cell_size)
+    
+    def _blit_label(self, surface: pygame.Surface, row: int, col: int,
+                    rect: pygame.Rect) -> None:
+        """Desenha o peso ou a letra S/E de uma célula, se o zoom permitir."""
+        if self.cell_size < self.MIN_LABEL_SIZE:
+            return
+        pos = (row, col)
+        cell_value = self.maze.grid[row][col]
+        if pos == self.maze.start:
+            text = self.render_text(self.font, 'S', (255, 255, 255))
         elif pos == self.maze.end:
-            return self.COLOR_END
-        elif cell_value == -1:
-            return self.COLOR_WALL
+            text = self.render_text(self.font, 'E', (255, 255, 255))
+        elif cell_value > 1:
+            text = self.render_text(self.font_small, str(cell_value), self.COLOR_TEXT)
         else:
-            # Retorna cor baseada no peso do terreno
-            if cell_value in self.TERRAIN_COLORS:
-                return self.TERRAIN_COLORS[cell_value]
-            elif cell_value > 10:
-                return self.TERRAIN_COLORS[10]
-            else:
-                return self.COLOR_FREE
+            return
+        surface.blit(text, text.get_rect(center=rect.center))
+    
+    def draw_cell(self, surface: pygame.Surface, row: int, col: int,
+                  color: Tuple[int, int, int]) -> pygame.Rect:
+        """
+        Desenha uma célula (fundo, borda e rótulo) em uma superfície.
+        
+        Args:
+            surface: Superfície de destino (tela ou fundo em cache)
+            row: Linha da célula
+            col: Coluna da célula
+            color: Cor de preenchimento
+        
+        Returns:
+            Parte visível do retângulo da célula (vazio se estiver fora da tela)
+        """
+        rect = self.cell_rect(row, col)
+        visible = rect.clip(self.view_rect)
+        if not visible:
+            return visible
+        
+        # Rótulos não podem vazar para as vizinhas (ficariam fora da região atualizada)
+        previous_clip = surface.get_clip()
+        surface.set_clip(visible)
+        surface.fill(color, rect)
+        if self.cell_size >= self.MIN_BORDER_SIZE:
+            # Contorno em quatro faixas: pygame.draw.rect recorta o retângulo antes
+            # de desenhar o contorno e poria a borda na linha de corte da tela
+            x, y, width, height = rect
+            for edge in ((x, y, width, 1), (x, y + height - 1, width, 1),
+                         (x, y, 1, height), (x + width - 1, y, 1, height)):
+                surface.fill(self.COLOR_GRID, edge)
+        self._blit_label(surface, row, col, rect)
+        surface.set_clip(previous_clip)
+        return visible
+    
+    def _layers(self, first_row: int, end_row: int, first_col: int, end_col: int):
+        """Recorta as camadas de terreno e de estado (NumPy) para um bloco de células."""
+        shape = (self.maze.rows, self.maze.cols)
+        state = np.frombuffer(self._state, dtype=np.uint8).reshape(shape)
+        terrain = self._terrain.reshape(shape)
+        return (terrain[first_row:end_row, first_col:end_col],
+                state[first_row:end_row, first_col:end_col])
+    
+    def _pooled_codes(self, first_row: int, end_row: int, first_col: int, end_col: int):
+        """
+        Reduz um bloco de células para a visão geral (max-pooling em blocos de pool).
+        
+        O código de cada célula é o de estado se houver um, exceto início e fim,
+        que ficam sempre por cima; o pixel recebe o maior código do seu bloco.
+        
+        Returns:
+            Array (linhas, colunas) de códigos, um por pixel da visão geral
+        """
+        pool = self.pool
+        terrain, state = self._layers(first_row, end_row, first_col, end_col)
+        codes = np.maximum(terrain, np.where(state > 0, self.CODE_STATE + state, 0))
+        height, width = codes.shape
+        codes = np.pad(codes, ((0, -height % pool), (0, -width % pool)))
+        return codes.reshape(codes.shape[0] // pool, pool,
+                             codes.shape[1] // pool, pool).max(axis=(1, 3))
+    
+    def _compose_overview(self, first_row: int, end_row: int,
+                          first_col: int, end_col: int) -> pygame.Surface:
+        """Monta a visão geral visível com NumPy (um pixel por bloco de células)."""
+        surface = pygame.Surface((self.view_width, self.view_height))
+        surface.fill(self.COLOR_BACKGROUND)
+        codes = self._pooled_codes(first_row, end_row, first_col, end_col)
+        if codes.size:
+            blocks = pygame.Surface((codes.shape[1], codes.shape[0]))
+            pygame.surfarray.blit_array(blocks, self._code_pixels[codes].T)
+            surface.blit(blocks, (0, 0))
+        return surface
+    
+    def _compose_cells(self, first_row: int, end_row: int,
+                       first_col: int, end_col: int) -> pygame.Surface:
+        """
+        Monta as células visíveis com NumPy: a cor de cada célula (terreno ou
+        estado) é expandida para pixels por um mapa pixel -> célula, com bordas e
+        margens, e os rótulos são desenhados por cima.
+        
+        Returns:
+            Superfície com a área do labirinto desenhada
+        """
+        step = self.cell_size + self.margin
+        draw_borders = self.cell_size >= self.MIN_BORDER_SIZE
+        
+        def axis_map(first: int, count: int, view_start: int, length: int):
+            # Índice local da célula e tipo do pixel: 0 = margem, 1 = borda, 2 = interior
+            offsets = np.arange(view_start, view_start + length) - self.margin
+            index, offset = np.divmod(offsets, step)
+            kind = np.full(length, 2, dtype=np.int8)
+            if draw_borders:
+                kind[(offset == 0) | (offset == self.cell_size - 1)] = 1
+            kind[(offsets < 0) | (offset >= self.cell_size) | (index >= first + count)] = 0
+            return index - first, kind
+        
+        width = end_col - first_col
+        col_of_x, kind_x = axis_map(first_col, width, self.view_x, self.view_width)
+        row_of_y, kind_y = axis_map(first_row, end_row - first_row, self.view_y, self.view_height)
+        cells = row_of_y[np.newaxis, :] * width + col_of_x[:, np.newaxis]
+        kind = np.minimum(kind_x[:, np.newaxis], kind_y[np.newaxis, :])
+        cells[kind == 1] = -2
+        cells[kind == 0] = -1
+        
+        # Pixel de cada célula visível, seguido dos pixels de borda (-2) e margem (-1)
+        terrain, state = self._layers(first_row, end_row, first_col, end_col)
+        codes = np.where(state > 0, self.CODE_STATE + state, terrain)
+        cell_pixels = np.concatenate([
+            self._code_pixels[codes].reshape(-1),
+            np.array([self.screen.map_rgb(self.COLOR_GRID),
+                      self.screen.map_rgb(self.COLOR_BACKGROUND)], dtype=np.uint32)])
+        
+        surface = pygame.Surface((self.view_width, self.view_height))
+        pygame.surfarray.blit_array(surface, np.take(cell_pixels, cells))
+        
+        if self.cell_size >= self.MIN_LABEL_SIZE:
+            labeled = ((terrain >= 2) & (terrain <= 10)) | (terrain >= self.CODE_START)
+            for row, col in zip(*np.nonzero(labeled)):
+                row, col = int(row) + first_row, int(col) + first_col
+                rect = self.cell_rect(row, col)
+                surface.set_clip(rect.clip(self.view_rect))
+                self._blit_label(surface, row, col, rect)
+            surface.set_clip(None)
+        return surface
+    
+    def _view_background(self, first_row: int, end_row: int,
+                         first_col: int, end_col: int) -> pygame.Surface:
+        """Terreno visível em cache (sem NumPy), refeito quando a visualização muda."""
+        key = (self.zoom_index, self.view_x, self.view_y, self._terrain_version)
+        if self._background_key != key:
+            self._background = pygame.Surface((self.view_width, self.view_height))
+            self._background.fill(self.COLOR_BACKGROUND)
+            cols = self.maze.cols
+            for row in range(first_row, end_row):
+                for col in range(first_col, end_col):
+                    self.draw_cell(self._background, row, col,
+                                   self.CODE_COLORS[self._terrain[row * cols + col]])
+            self._background_key = key
+        return self._background
+    
+    def mark_dirty(self, position: Optional[Tuple[int, int]]) -> None:
+        """
+        Agenda o redesenho de uma célula no próximo quadro.
+        
+        Args:
+            position: Posição da célula (None é ignorado)
+        """
+        if position is not None:
+            row, col = position
+            self._state[row * self.maze.cols + col] = self._cell_state(position)
+            self._dirty_cells.add(position)
+    
+    def invalidate(self) -> None:
+        """Força o redesenho completo da tela no próximo quadro."""
+        self._needs_full_redraw = True
+    
+    def set_explored(self, cells: Set[Tuple[int, int]]) -> None:
+        """
+        Substitui o conjunto de células exploradas.
+        
+        Args:
+            cells: Células exploradas
+        """
+        self.explored_cells = cells
+        self._state_stale = True
+        self._panel_dirty = True
+        self.invalidate()
     
     def draw_grid(self) -> None:
-        """Desenha o grid do labirinto."""
-        for row in range(self.maze.rows):
-            for col in range(self.maze.cols):
-                # Calcula posição do retângulo
-                x = col * (self.cell_size + self.margin) + self.margin
-                y = row * (self.cell_size + self.margin) + self.margin
-                
-                # Desenha célula
-                color = self.get_cell_color(row, col)
-                pygame.draw.rect(self.screen, color, 
-                               (x, y, self.cell_size, self.cell_size))
-                
-                # Desenha borda
-                pygame.draw.rect(self.screen, self.COLOR_GRID,
-                               (x, y, self.cell_size, self.cell_size), 1)
-                
-                # Desenha peso da célula (se > 1 e não for obstáculo)
-                pos = (row, col)
-                cell_value = self.maze.grid[row][col]
-                if cell_value > 1 and pos != self.maze.start and pos != self.maze.end:
-                    weight_text = self.font_small.render(str(cell_value), True, self.COLOR_TEXT)
-                    text_rect = weight_text.get_rect(center=(x + self.cell_size // 2, 
-                                                             y + self.cell_size // 2))
-                    self.screen.blit(weight_text, text_rect)
-                
-                # Desenha S ou E
-                if pos == self.maze.start:
-                    text = self.font.render('S', True, (255, 255, 255))
-                    text_rect = text.get_rect(center=(x + self.cell_size // 2, 
-                                                     y + self.cell_size // 2))
-                    self.screen.blit(text, text_rect)
-                elif pos == self.maze.end:
-                    text = self.font.render('E', True, (255, 255, 255))
-                    text_rect = text.get_rect(center=(x + self.cell_size // 2, 
-                                                     y + self.cell_size // 2))
-                    self.screen.blit(text, text_rect)
+        """Desenha as células visíveis do labirinto (terreno e camada de estado)."""
+        if self._state_stale:
+            self._rebuild_state()
+        visible = self._visible_cells()
+        
+        if np is not None:
+            compose = self._compose_overview if self.pool > 1 else self._compose_cells
+            self.screen.blit(compose(*visible), (0, 0))
+            return
+        
+        self.screen.blit(self._view_background(*visible), (0, 0))
+        first_row, end_row, first_col, end_col = visible
+        cols = self.maze.cols
+        for row in range(first_row, end_row):
+            for col in range(first_col, end_col):
+                state = self._state[row * cols + col]
+                if state:
+                    self.draw_cell(self.screen, row, col,
+                                   self.CODE_COLORS[self.CODE_STATE + state])
+    
+    def _draw_dirty_cells(self) -> List[pygame.Rect]:
+        """Redesenha as células marcadas que estão visíveis; retorna as regiões alteradas."""
+        if self.pool == 1:
+            dirty_rects = [self.draw_cell(self.screen, row, col, self.get_cell_color(row, col))
+                           for row, col in self._dirty_cells]
+            return [rect for rect in dirty_rects if rect]
+        
+        # Visão geral: recalcula o pixel de cada bloco afetado
+        pool = self.pool
+        dirty_rects = []
+        for block_row, block_col in {(row // pool, col // pool) for row, col in self._dirty_cells}:
+            rect = pygame.Rect(block_col - self.view_x, block_row - self.view_y, 1, 1)
+            if not self.view_rect.contains(rect):
+                continue
+            first_row, first_col = block_row * pool, block_col * pool
+            code = self._pooled_codes(first_row, min(self.maze.rows, first_row + pool),
+                                      first_col, min(self.maze.cols, first_col + pool))[0, 0]
+            self.screen.fill(self.CODE_COLORS[code], rect)
+            dirty_rects.append(rect)
+        return dirty_rects
     
     def draw_info_panel(self) -> None:
         """Desenha painel de informações."""
-        panel_x = self.grid_width + 10
+        panel_x = self.view_width + 10
         panel_y = 10
         
         # Título
-        title = self.font_large.render("PathFinder A*", True, self.COLOR_TEXT)
+        title = self.render_text(self.font_large, "PathFinder A*", self.COLOR_TEXT)
         self.screen.blit(title, (panel_x, panel_y))
         
         y_offset = panel_y + 50
@@ -177,6 +635,8 @@ class MazeGUI:
             f"Fim: {self.maze.end}",
             "",
             f"Células exploradas: {len(self.explored_cells)}",
+            self._zoom_text(),
+            "Zoom: roda/+/-   Mover: setas/arrastar",
         ]
         
         if self.path:
@@ -191,18 +651,18 @@ class MazeGUI:
                 status_text = "✗ Sem solução"
                 status_color = (244, 67, 54)
             
-            status = self.font.render(status_text, True, status_color)
+            status = self.render_text(self.font, status_text, status_color)
             self.screen.blit(status, (panel_x, y_offset))
             y_offset += 35
         
-        for text in info_texts:
-            rendered = self.font_small.render(text, True, self.COLOR_TEXT)
+        for line, text in enumerate(info_texts):
+            rendered = self.render_text(self.font_small, text, self.COLOR_TEXT, slot=f"info{line}")
             self.screen.blit(rendered, (panel_x, y_offset))
             y_offset += 25
         
         # Legenda
         legend_y = self.window_height - 150
-        legend_title = self.font.render("Legenda:", True, self.COLOR_TEXT)
+        legend_title = self.render_text(self.font, "Legenda:", self.COLOR_TEXT)
         self.screen.blit(legend_title, (panel_x, legend_y))
         
         legend_items = [
@@ -216,10 +676,16 @@ class MazeGUI:
         legend_y += 30
         for color, label in legend_items:
             pygame.draw.rect(self.screen, color, (panel_x, legend_y, 15, 15))
-            text = self.font_small.render(label, True, self.COLOR_TEXT)
+            text = self.render_text(self.font_small, label, self.COLOR_TEXT)
             self.screen.blit(text, (panel_x + 20, legend_y))
             legend_y += 20
     
+    def _zoom_text(self) -> str:
+        """Descrição do zoom atual para o painel."""
+        if self.pool > 1:
+            return f"Visão geral: 1 pixel = {self.pool}x{self.pool} células"
+        return f"Zoom: {self.cell_size} px por célula"
+    
     def update_exploration(self, position: Tuple[int, int]) -> None:
         """
         Atualiza a visualização com uma nova célula explorada.
@@ -227,10 +693,26 @@ class MazeGUI:
         Args:
             position: Posição da célula sendo explorada
         """
-        self.explored_cells.add(position)
-        self.current_cell = position
+        self.mark_explored([position])
         self.draw()
     
+    def mark_explored(self, positions: List[Tuple[int, int]]) -> None:
+        """
+        Marca células como exploradas sem redesenhar (a última passa a ser a atual).
+        
+        Args:
+            positions: Posições expandidas, na ordem da busca
+        """
+        if not positions:
+            return
+        previous = self.current_cell
+        self.explored_cells.update(positions)
+        self.current_cell = positions[-1]
+        self.mark_dirty(previous)
+        for position in positions:
+            self.mark_dirty(position)
+        self._panel_dirty = True
+    
     def set_path(self, path: List[Tuple[int, int]], cost: float) -> None:
         """
         Define o caminho encontrado.
@@ -239,22 +721,53 @@ class MazeGUI:
             path: Lista de posições formando o caminho
             cost: Custo total do caminho
         """
+        previous = self.current_cell
         self.path = path
+        self._path_cells = set(path)
         self.cost = cost
         self.is_complete = True
         self.current_cell = None
+        self.mark_dirty(previous)
+        for position in self._path_cells:
+            self.mark_dirty(position)
+        self._panel_dirty = True
     
     def set_no_solution(self) -> None:
         """Marca que não há solução."""
+        previous = self.current_cell
         self.is_complete = True
         self.current_cell = None
+        self.mark_dirty(previous)
+        self._panel_dirty = True
     
     def draw(self) -> None:
-        """Redesenha toda a tela."""
-        self.screen.fill(self.COLOR_BACKGROUND)
-        self.draw_grid()
-        self.draw_info_panel()
-        pygame.display.flip()
+        """
+        Atualiza a tela. O primeiro quadro (ou após invalidate, zoom, rolagem ou
+        alteração do labirinto) redesenha a área visível inteira; os demais
+        redesenham só as células marcadas e o painel, atualizando apenas essas
+        regiões.
+        """
+        if self._terrain_version != self.maze.version:
+            self.build_terrain()
+        if self._needs_full_redraw:
+            self.screen.fill(self.COLOR_BACKGROUND)
+            self.draw_grid()
+            self.draw_info_panel()
+            pygame.display.flip()
+            self._needs_full_redraw = False
+            self._panel_dirty = False
+        else:
+            dirty_rects = self._draw_dirty_cells()
+            if self._panel_dirty:
+                panel = pygame.Rect(self.view_width, 0, self.window_width - self.view_width,
+                                    self.window_height)
+                self.screen.fill(self.COLOR_BACKGROUND, panel)
+                self.draw_info_panel()
+                dirty_rects.append(panel)
+                self._panel_dirty = False
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        self._dirty_cells.clear()
         self.clock.tick(self.fps)
     
     def handle_events(self) -> bool:
@@ -267,11 +780,39 @@ class MazeGUI:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # O conteúdo da janela pode ter sido perdido
+                self.invalidate()
+            elif event.type == pygame.MOUSEWHEEL and event.y:
+                self.set_zoom(self.zoom_index + (1 if event.y > 0 else -1),
+                              self._mouse_anchor())
+            elif event.type == pygame.MOUSEMOTION and (event.buttons[0] or event.buttons[2]):
+                self.scroll(-event.rel[0], -event.rel[1])
             elif event.type == pygame.KEYDOWN:
+                scroll_step = max(self.view_width, self.view_height) // 8
                 if event.key == pygame.K_ESCAPE:
                     return False
+                elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    self.set_zoom(self.zoom_index + 1)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    self.set_zoom(self.zoom_index - 1)
+                elif event.key == pygame.K_HOME:
+                    self.zoom_to_fit()
+                elif event.key == pygame.K_LEFT:
+                    self.scroll(-scroll_step, 0)
+                elif event.key == pygame.K_RIGHT:
+                    self.scroll(scroll_step, 0)
+                elif event.key == pygame.K_UP:
+                    self.scroll(0, -scroll_step)
+                elif event.key == pygame.K_DOWN:
+                    self.scroll(0, scroll_step)
         return True
     
+    def _mouse_anchor(self) -> Optional[Tuple[int, int]]:
+        """Posição do mouse, se estiver sobre a área do labirinto."""
+        position = pygame.mouse.get_pos()
+        return position if self.view_rect.collidepoint(position) else None
+    
     def run_animation(self, path: Optional[List[Tuple[int, int]]] = None,
                      cost: Optional[float] = None) -> None:
         """
@@ -281,7 +822,7 @@ class MazeGUI:
             path: Caminho final (opcional)
             cost: Custo do caminho (opcional)
         """
-        running = Truex
+        running = True
         
         # Animação inicial
         self.draw()
@@ -301,6 +842,76 @@ class MazeGUI:
         
         pygame.quit()
     
+    def animate_search(self, allow_diagonal: bool = False, use_euclidean: bool = False,
+                       landmarks=None, expansions_per_frame: Optional[int] = None,
+                       frame_budget_ms: Optional[float] = None) -> Optional[SearchResult]:
+        """
+        Executa o A* ao vivo na janela, avançando a busca a cada quadro.
+        
+        Cada quadro expande até expansions_per_frame nós (em lotes do gerador
+        SearchSpace.search_steps), mas para antes se o tempo gasto na busca passar
+        de frame_budget_ms; assim a animação mantém a taxa de quadros mesmo em
+        labirintos grandes. Ao terminar, mostra o caminho ou a ausência de solução.
+        Se os rótulos de componentes do labirinto já estiverem prontos (veja
+        Maze.component_labels) e o início e o fim estiverem em componentes
+        diferentes, a busca nem é executada.
+        
+        Args:
+            allow_diagonal: Se True, permite movimentos diagonais
+            use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+            landmarks: LandmarkHeuristic opcional (heurística ALT)
+            expansions_per_frame: Nós expandidos por quadro (padrão: o suficiente
+                para percorrer o labirinto inteiro em cerca de 5 segundos)
+            frame_budget_ms: Tempo máximo de busca por quadro (padrão: metade do
+                intervalo entre quadros)
+        
+        Returns:
+            SearchResult da busca (elapsed_ns conta só o tempo gasto na busca, sem
+            as pausas entre quadros), ou None se a janela foi fechada antes do fim
+        """
+        fps = self.fps or 60
+        if expansions_per_frame is None:
+            expansions_per_frame = max(1, self.maze.rows * self.maze.cols // (fps * 5))
+        if frame_budget_ms is None:
+            frame_budget_ms = 500.0 / fps
+        frame_budget = frame_budget_ms / 1000.0
+        
+        # Sem caminho possível (componentes diferentes): nada a animar
+        labels = self.maze.component_labels(allow_diagonal, build=False)
+        if labels is not None and _in_different_components(labels, self.maze.cols,
+                                                            self.maze.start, self.maze.end):
+            self.set_no_solution()
+            self.draw()
+            return SearchResult(None, None)
+        
+        space = SearchSpace.from_grid(self.maze.grid, allow_diagonal)
+        steps = space.search_steps(self.maze.start, self.maze.end, use_euclidean, landmarks,
+                                   batch_size=min(expansions_per_frame, 64))
+        search_ns = 0
+        self.draw()
+        while self.handle_events():
+            frame_start = time.perf_counter()
+            expanded = 0
+            while expanded < expansions_per_frame and \
+                    time.perf_counter() - frame_start < frame_budget:
+                step_start_ns = time.perf_counter_ns()
+                try:
+                    batch = next(steps)
+                except StopIteration as finished:
+                    result = finished.value
+                    result.elapsed_ns = search_ns + time.perf_counter_ns() - step_start_ns
+                    if result:
+                        self.set_path(result.path, result.cost)
+                    else:
+                        self.set_no_solution()
+                    self.draw()
+                    return result
+                search_ns += time.perf_counter_ns() - step_start_ns
+                self.mark_explored(batch)
+                expanded += len(batch)
+            self.draw()
+        return None
+    
     def wait_for_close(self) -> None:
         """Mantém a janela aberta até o usuário fechar."""
         running = True
@@ -313,7 +924,8 @@ class MazeGUI:
 def visualize_maze_gui(maze: Maze, path: Optional[List[Tuple[int, int]]] = None,
                        cost: Optional[float] = None, 
                        explored: Optional[Set[Tuple[int, int]]] = None,
-                       animate: bool = True) -> None:
+                       animate: bool = False, allow_diagonal: bool = False,
+                       use_euclidean: bool = False, landmarks=None) -> Optional[SearchResult]:
     """
     Função auxiliar para visualizar um labirinto com GUI.
     
@@ -321,21 +933,44 @@ def visualize_maze_gui(maze: Maze, path: Optional[List[Tuple[int, int]]] = None,
         maze: Objeto Maze
         path: Caminho encontrado (opcional)
         cost: Custo do caminho (opcional)
-        explored: Células exploradas (opcional)
-        animate: Se True, anima a exploração
+        explored: Células exploradas (opcional; um conjunto vazio sem path indica
+            busca sem solução)
+        animate: Se True, executa a busca ao vivo na janela (veja
+            MazeGUI.animate_search) em vez de mostrar um resultado pronto
+        allow_diagonal: Movimentos diagonais na busca animada
+        use_euclidean: Heurística Euclidiana na busca animada
+        landmarks: LandmarkHeuristic para a busca animada (opcional)
+    
+    Returns:
+        SearchResult da busca animada, ou None sem animação ou se a janela for
+        fechada antes do fim da busca
+    
+    Raises:
+        ValueError: Se animate for combinado com path, cost ou explored
     """
+    if animate and (path is not None or cost is not None or explored is not None):
+        raise ValueError("animate executa a própria busca: não informe path, cost "
+                         "nem explored")
     gui = MazeGUI(maze)
+    result = None
     
-    if explored:
-        gui.explored_cells = explored
-    
-    if path:
-        gui.set_path(path, cost or 0.0)
-    elif explored:
-        gui.set_no_solution()
+    if animate:
+        result = gui.animate_search(allow_diagonal, use_euclidean, landmarks)
+        if result is None:
+            pygame.quit()  # Janela fechada durante a animação
+            return None
+    else:
+        if explored:
+            gui.set_explored(explored)
+        
+        if path:
+            gui.set_path(path, cost or 0.0)
+        elif explored is not None:
+            gui.set_no_solution()
     
     gui.draw()
     gui.wait_for_close()
+    return result
 
 
 # Função auxiliar para testes
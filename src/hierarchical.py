@@ -0,0 +1,553 @@
+"""
+Busca hierárquica (HPA*) com abstração por clusters
+Descrição: Divide o grid em clusters quadrados, pré-calcula as entradas entre
+           clusters vizinhos e os custos entre entradas de um mesmo cluster, e
+           responde consultas no grafo abstrato, refinando para células apenas os
+           trechos do caminho escolhido. Após uma alteração, basta reconstruir os
+           clusters afetados.
+"""
+
+import heapq
+import math
+import time
+from typing import Dict, List, Set, Tuple
+
+from src.maze import Maze
+from src.pathfinder import SearchResult, _DIAGONAL_COST, _neighbor_table, _pad_weights
+
+Cluster = Tuple[int, int]
+
+# Entradas com pelo menos esta largura ganham duas transições (uma em cada ponta)
+ENTRANCE_SPLIT = 6
+
+# Vizinhos de um cluster com id maior (cada fronteira é guardada uma única vez)
+_FORWARD_NEIGHBORS = ((0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class HierarchicalPlanner:
+    """
+    Planejador HPA* (Botea, Müller e Schaeffer) sobre o grid com borda.
+    
+    Cada fronteira entre clusters vizinhos é dividida em trechos contínuos de pares
+    de células livres; cada trecho gera uma ou duas transições, cujas células são
+    os nós do grafo abstrato. Dentro de cada cluster, um Dijkstra a partir de cada
+    entrada fornece as arestas entre entradas, com o mesmo modelo de custos do
+    a_star (custo do movimento vezes o peso da célula de destino). Com diagonais,
+    passagens diagonais que não podem ser feitas por dois passos ortogonais
+    (cantos com os dois vizinhos bloqueados) também viram transições, então toda
+    rota do grid tem uma rota correspondente no grafo abstrato.
+    
+    Os caminhos são válidos e completos, mas não são ótimos e não há limite para o
+    desvio: o caminho é obrigado a passar pelas células de transição escolhidas nas
+    fronteiras. Em mapas de peso uniforme e clusters grandes a diferença costuma ser
+    pequena; com pesos variados, diagonais ou clusters pequenos, o custo pode ficar
+    bem acima do ótimo (mais que o dobro em casos isolados). Quando o custo exato
+    importa, use a_star.
+    
+    Atributos:
+        maze (Maze): Labirinto de origem
+        cluster_size (int): Lado dos clusters, em células
+        allow_diagonal (bool): Se movimentos diagonais são permitidos
+        synced_version (int): Versão do Maze já incorporada (veja sync)
+    """
+    
+    def __init__(self, maze: Maze, cluster_size: int = 16, allow_diagonal: bool = False):
+        """
+        Constrói a abstração completa do labirinto.
+        
+        Args:
+            maze: Objeto Maze
+            cluster_size: Lado dos clusters, em células
+            allow_diagonal: Se True, permite movimentos diagonais
+        
+        Raises:
+            ValueError: Se cluster_size for menor que 2
+        """
+        if cluster_size < 2:
+            raise ValueError("cluster_size deve ser pelo menos 2")
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.allow_diagonal = allow_diagonal
+        self._build()
+    
+    def _build(self) -> None:
+        """Constrói (ou refaz) a abstração inteira a partir do grid do Maze."""
+        started_ns = time.perf_counter_ns()
+        self.synced_version = self.maze.version
+        self.rows, self.cols = self.maze.rows, self.maze.cols
+        self._weights, self._width = _pad_weights(self.maze.grid)
+        self._table = _neighbor_table(self._width, self.allow_diagonal)
+        self.cluster_rows = -(-self.rows // self.cluster_size)
+        self.cluster_cols = -(-self.cols // self.cluster_size)
+        
+        # Fronteira (c1, c2), c1 < c2 -> transições (célula em c1, célula em c2, custo do movimento)
+        self._borders: Dict[Tuple[Cluster, Cluster], List[Tuple[int, int, float]]] = {}
+        # Célula de entrada -> {célula vizinha em outro cluster: custo da travessia}
+        self._inter: Dict[int, Dict[int, float]] = {}
+        # Cluster -> entradas; entrada -> {outra entrada do cluster: custo interno}
+        self._entrances: Dict[Cluster, Set[int]] = {}
+        self._intra: Dict[int, Dict[int, float]] = {}
+        
+        for cluster in self.clusters():
+            for neighbor in self._forward_neighbors(cluster):
+                self._set_border(cluster, neighbor)
+        for cluster in self.clusters():
+            self._update_entrances(cluster)
+            self._connect_entrances(cluster)
+        self.build_time_ns = time.perf_counter_ns() - started_ns
+    
+    def clusters(self) -> List[Cluster]:
+        """Retorna todos os clusters (linha_do_cluster, coluna_do_cluster)."""
+        return [(cr, cc) for cr in range(self.cluster_rows) for cc in range(self.cluster_cols)]
+    
+    def cluster_of(self, position: Tuple[int, int]) -> Cluster:
+        """Retorna o cluster que contém a posição (linha, coluna)."""
+        return position[0] // self.cluster_size, position[1] // self.cluster_size
+    
+    def _bounds(self, cluster: Cluster) -> Tuple[int, int, int, int]:
+        """Limites (linha0, linha1, coluna0, coluna1) do cluster, com o fim exclusivo."""
+        row0 = cluster[0] * self.cluster_size
+        col0 = cluster[1] * self.cluster_size
+        return (row0, min(row0 + self.cluster_size, self.rows),
+                col0, min(col0 + self.cluster_size, self.cols))
+    
+    def _forward_neighbors(self, cluster: Cluster) -> List[Cluster]:
+        """Vizinhos com id maior que o do cluster (direita e linha de baixo)."""
+        neighbors = []
+        for dr, dc in _FORWARD_NEIGHBORS:
+            if dr and dc and not self.allow_diagonal:
+                continue
+            cr, cc = cluster[0] + dr, cluster[1] + dc
+            if 0 <= cr < self.cluster_rows and 0 <= cc < self.cluster_cols:
+                neighbors.append((cr, cc))
+        return neighbors
+    
+    def _adjacent_clusters(self, cluster: Cluster) -> List[Cluster]:
+        """Todos os clusters que compartilham fronteira ou canto com o cluster."""
+        adjacent = []
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                if (dr or dc) and (self.allow_diagonal or not (dr and dc)):
+                    cr, cc = cluster[0] + dr, cluster[1] + dc
+                    if 0 <= cr < self.cluster_rows and 0 <= cc < self.cluster_cols:
+                        adjacent.append((cr, cc))
+        return adjacent
+    
+    def _index(self, row: int, col: int) -> int:
+        """Converte (linha, coluna) para o índice no grid com borda."""
+        return (row + 1) * self._width + col + 1
+    
+    def _position(self, index: int) -> Tuple[int, int]:
+        """Converte um índice do grid com borda para (linha, coluna)."""
+        row, col = divmod(index, self._width)
+        return row - 1, col - 1
+    
+    def _border_pairs(self, first: Cluster, second: Cluster) -> List[Tuple[int, int]]:
+        """Pares ortogonais (célula em first, célula em second) ao longo da fronteira."""
+        row0, row1, col0, col1 = self._bounds(first)
+        if second[0] == first[0]:  # Vizinho à direita
+            return [(self._index(r, col1 - 1), self._index(r, col1)) for r in range(row0, row1)]
+        if second[1] == first[1]:  # Vizinho abaixo
+            return [(self._index(row1 - 1, c), self._index(row1, c)) for c in range(col0, col1)]
+        return []
+    
+    def _compute_border(self, first: Cluster, second: Cluster) -> List[Tuple[int, int, float]]:
+        """Calcula as transições da fronteira entre dois clusters (first < second)."""
+        weights = self._weights
+        transitions = []
+        
+        def free(index: int) -> bool:
+            return weights[index] != -1
+        
+        pairs = self._border_pairs(first, second)
+        if pairs:
+            # Trechos contínuos de pares livres: as células de cada lado de um
+            # trecho são vizinhas entre si, então uma transição representa o trecho
+            run: List[Tuple[int, int]] = []
+            for a, b in pairs + [(-1, -1)]:
+                if a != -1 and free(a) and free(b):
+                    run.append((a, b))
+                    continue
+                if run:
+                    if len(run) >= ENTRANCE_SPLIT:
+                        transitions.append((run[0][0], run[0][1], 1.0))
+                        transitions.append((run[-1][0], run[-1][1], 1.0))
+                    else:
+                        middle = run[len(run) // 2]
+                        transitions.append((middle[0], middle[1], 1.0))
+                    run = []
+            diagonal_pairs = []
+            if self.allow_diagonal:
+                for (a0, b0), (a1, b1) in zip(pairs, pairs[1:]):
+                    # a0 -> b1 passa por a1 ou b0; a1 -> b0 passa por a0 ou b1
+                    diagonal_pairs.append((a0, b1, a1, b0))
+                    diagonal_pairs.append((a1, b0, a0, b1))
+        else:
+            # Clusters ligados apenas pelo canto
+            row0, row1, col0, col1 = self._bounds(first)
+            if second[1] > first[1]:
+                a, b = self._index(row1 - 1, col1 - 1), self._index(row1, col1)
+                diagonal_pairs = [(a, b, self._index(row1 - 1, col1), self._index(row1, col1 - 1))]
+            else:
+                a, b = self._index(row1 - 1, col0), self._index(row1, col0 - 1)
+                diagonal_pairs = [(a, b, self._index(row1 - 1, col0 - 1), self._index(row1, col0))]
+        
+        # Passagens diagonais só precisam de transição própria quando não há um
+        # caminho de dois passos ortogonais equivalente
+        for a, b, via1, via2 in diagonal_pairs:
+            if free(a) and free(b) and not free(via1) and not free(via2):
+                transitions.append((a, b, _DIAGONAL_COST))
+        return transitions
+    
+    def _set_border(self, first: Cluster, second: Cluster) -> None:
+        """Recalcula uma fronteira e atualiza as arestas de travessia."""
+        key = (first, second) if first < second else (second, first)
+        inter = self._inter
+        for a, b, _ in self._borders.pop(key, []):
+            for source, target in ((a, b), (b, a)):
+                edges = inter.get(source)
+                if edges is not None:
+                    edges.pop(target, None)
+                    if not edges:
+                        del inter[source]
+        
+        transitions = self._compute_border(*key)
+        if transitions:
+            self._borders[key] = transitions
+        weights = self._weights
+        for a, b, move_cost in transitions:
+            inter.setdefault(a, {})[b] = move_cost * weights[b]
+            inter.setdefault(b, {})[a] = move_cost * weights[a]
+    
+    def _update_entrances(self, cluster: Cluster) -> bool:
+        """Recalcula as entradas do cluster; retorna True se mudaram."""
+        row0, row1, col0, col1 = self._bounds(cluster)
+        entrances = set()
+        for neighbor in self._adjacent_clusters(cluster):
+            key = (cluster, neighbor) if cluster < neighbor else (neighbor, cluster)
+            for a, b, _ in self._borders.get(key, []):
+                for index in (a, b):
+                    row, col = self._position(index)
+                    if row0 <= row < row1 and col0 <= col < col1:
+                        entrances.add(index)
+        previous = self._entrances.get(cluster, set())
+        for index in previous - entrances:
+            self._intra.pop(index, None)
+        self._entrances[cluster] = entrances
+        return entrances != previous
+    
+    def _connect_entrances(self, cluster: Cluster) -> None:
+        """Calcula os custos internos entre todas as entradas do cluster."""
+        entrances = self._entrances[cluster]
+        for entrance in entrances:
+            distances, _, _ = self._local_search(entrance, self._bounds(cluster))
+            self._intra[entrance] = {other: distances[other] for other in entrances
+                                     if other != entrance and other in distances}
+    
+    def _local_search(self, source: int, bounds: Tuple[int, int, int, int], target: int = -1,
+                      reverse: bool = False) -> Tuple[Dict[int, float], Dict[int, int], int]:
+        """
+        Dijkstra restrito a um retângulo do grid (em geral, um cluster).
+        
+        Args:
+            source: Índice inicial (no modo reverso, a célula de chegada)
+            bounds: Limites (linha0, linha1, coluna0, coluna1), com o fim exclusivo
+            target: Se informado, a busca para ao fechar esta célula
+            reverse: Se True, calcula o custo de cada célula ATÉ source
+        
+        Returns:
+            Tupla (distâncias, pais, nós_explorados); no modo reverso o "pai" de
+            uma célula é o próximo passo em direção a source
+        """
+        row0, row1, col0, col1 = bounds
+        weights = self._weights
+        width = self._width
+        distances = {source: 0.0}
+        parents = {source: -1}
+        closed = set()
+        heap = [(0.0, source)]
+        explored = 0
+        
+        while heap:
+            distance, current = heapq.heappop(heap)
+            if current in closed:
+                continue
+            closed.add(current)
+            explored += 1
+            if current == target:
+                break
+            
+            current_weight = weights[current]
+            for delta, move_cost in self._table:
+                neighbor = current - delta if reverse else current + delta
+                weight = weights[neighbor]
+                if weight == -1 or neighbor in closed:
+                    continue
+                row, col = divmod(neighbor, width)
+                if not (row0 < row <= row1 and col0 < col <= col1):
+                    continue  # Fora dos limites (o grid com borda desloca em +1)
+                candidate = distance + move_cost * (current_weight if reverse else weight)
+                if candidate < distances.get(neighbor, math.inf):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = current
+                    heapq.heappush(heap, (candidate, neighbor))
+        return distances, parents, explored
+    
+    def rebuild_cluster(self, cluster: Cluster) -> None:
+        """
+        Relê do Maze as células de um cluster e reconstrói só o que depende dele.
+        
+        São recalculadas as fronteiras do cluster, as entradas dele e dos
+        vizinhos, e os custos internos do cluster e dos vizinhos cujas entradas
+        mudaram.
+        
+        Args:
+            cluster: Cluster (linha_do_cluster, coluna_do_cluster)
+        
+        Raises:
+            ValueError: Se o cluster não existir
+        """
+        if not (0 <= cluster[0] < self.cluster_rows and 0 <= cluster[1] < self.cluster_cols):
+            raise ValueError(f"Cluster {cluster} não existe")
+        row0, row1, col0, col1 = self._bounds(cluster)
+        grid = self.maze.grid
+        for row in range(row0, row1):
+            offset = self._index(row, 0)
+            self._weights[offset + col0:offset + col1] = [int(cell) for cell in grid[row][col0:col1]]
+        self._rebuild([cluster])
+    
+    def _rebuild(self, clusters: List[Cluster]) -> None:
+        """Reconstrói as fronteiras e as arestas internas a partir dos pesos atuais."""
+        affected = set()
+        for cluster in clusters:
+            # Com diagonais, as células de canto também decidem as transições entre
+            # dois vizinhos do cluster: refaz todas as fronteiras do bloco 3x3
+            block = set(self._adjacent_clusters(cluster))
+            block.add(cluster)
+            for first in block:
+                for second in self._forward_neighbors(first):
+                    if second in block:
+                        self._set_border(first, second)
+            affected |= block
+        for cluster in affected:
+            # O conteúdo dos clusters alterados mudou; nos vizinhos, só as entradas
+            if self._update_entrances(cluster) or cluster in clusters:
+                self._connect_entrances(cluster)
+    
+    def sync(self) -> int:
+        """
+        Incorpora as alterações feitas no Maze desde a última sincronização.
+        
+        As células alteradas vêm do diário do labirinto (Maze.changes_since) e só
+        os clusters que as contêm são reconstruídos. Se o diário não cobrir mais
+        a versão sincronizada, toda a abstração é refeita.
+        
+        Returns:
+            Número de clusters reconstruídos
+        """
+        changes = self.maze.changes_since(self.synced_version)
+        if changes is None:
+            self._build()
+            return len(self._entrances)
+        
+        clusters = set()
+        for row, col, _, new in changes:
+            self._weights[self._index(row, col)] = new
+            clusters.add(self.cluster_of((row, col)))
+        if clusters:
+            self._rebuild(sorted(clusters))
+        self.synced_version = self.maze.version
+        return len(clusters)
+    
+    def _heuristic(self, index: int, end_row: int, end_col: int) -> float:
+        """Limite inferior do custo até o fim (pesos >= 1)."""
+        row, col = divmod(index, self._width)
+        d_row, d_col = abs(row - end_row), abs(col - end_col)
+        if self.allow_diagonal:
+            return (_DIAGONAL_COST - 1) * min(d_row, d_col) + max(d_row, d_col)
+        return d_row + d_col
+    
+    def find_path(self, start: Tuple[int, int], end: Tuple[int, int],
+                  refine: bool = True) -> SearchResult:
+        """
+        Encontra um caminho de start até end pelo grafo abstrato.
+        
+        O início e o fim são ligados às entradas dos seus clusters por buscas
+        locais; o A* roda no grafo de entradas e, com refine=True, cada trecho
+        interno do caminho abstrato é expandido para células com uma busca
+        restrita ao cluster.
+        
+        Args:
+            start: Posição inicial (linha, coluna)
+            end: Posição objetivo (linha, coluna)
+            refine: Se False, o caminho contém apenas os pontos de passagem
+                (início, entradas usadas e fim)
+        
+        Returns:
+            SearchResult com o caminho (ou None) e as estatísticas da busca
+        
+        Raises:
+            ValueError: Se start ou end estiverem fora do labirinto ou sobre obstáculos
+        """
+        started_ns = time.perf_counter_ns()
+        for label, (row, col) in (("início", start), ("fim", end)):
+            if (not (0 <= row < self.rows and 0 <= col < self.cols)
+                    or self._weights[self._index(row, col)] == -1):
+                raise ValueError(f"Posição de {label} {(row, col)} fora do labirinto "
+                                 "ou sobre um obstáculo")
+        
+        start_index = self._index(*start)
+        end_index = self._index(*end)
+        start_cluster = self.cluster_of(start)
+        end_cluster = self.cluster_of(end)
+        end_row, end_col = divmod(end_index, self._width)
+        
+        # Liga o início às entradas do seu cluster e as entradas do cluster final ao fim
+        from_start, start_parents, explored = self._local_search(
+            start_index, self._bounds(start_cluster))
+        to_end, end_parents, end_explored = self._local_search(
+            end_index, self._bounds(end_cluster), reverse=True)
+        explored += end_explored
+        
+        # Nós virtuais: -2 = início, -1 = fim. Com início e fim no mesmo cluster ou
+        # em clusters vizinhos, o caminho direto pela união dos dois também é um
+        # candidato (evita desvios até uma entrada distante em rotas curtas)
+        best: Dict[int, float] = {}
+        parents: Dict[int, int] = {}
+        heap = []
+        direct_parents = start_parents
+        if start_cluster != end_cluster and (abs(start_cluster[0] - end_cluster[0]) <= 1 and
+                                             abs(start_cluster[1] - end_cluster[1]) <= 1):
+            (row0, row1, col0, col1), other = self._bounds(start_cluster), self._bounds(end_cluster)
+            union = (min(row0, other[0]), max(row1, other[1]),
+                     min(col0, other[2]), max(col1, other[3]))
+            direct, direct_parents, direct_explored = self._local_search(
+                start_index, union, target=end_index)
+            explored += direct_explored
+        else:
+            direct = from_start
+        if end_index in direct:
+            best[-1] = direct[end_index]
+            parents[-1] = -3
+            heap.append((best[-1], best[-1], -1))
+        for entrance in self._entrances.get(start_cluster, ()):
+            if entrance in from_start:
+                g = from_start[entrance]
+                best[entrance] = g
+                parents[entrance] = -2
+                heap.append((g + self._heuristic(entrance, end_row, end_col), g, entrance))
+        heapq.heapify(heap)
+        
+        generated = len(heap)
+        max_open_size = len(heap)
+        closed = set()
+        found = False
+        while heap:
+            _, g, node = heapq.heappop(heap)
+            if node in closed or g > best.get(node, math.inf):
+                continue
+            if node == -1:
+                found = True
+                break
+            closed.add(node)
+            explored += 1
+            
+            successors = list(self._intra.get(node, {}).items())
+            successors += self._inter.get(node, {}).items()
+            if node in to_end:
+                successors.append((-1, to_end[node]))
+            for neighbor, edge_cost in successors:
+                candidate = g + edge_cost
+                if neighbor not in closed and candidate < best.get(neighbor, math.inf):
+                    best[neighbor] = candidate
+                    parents[neighbor] = node
+                    h = 0.0 if neighbor == -1 else self._heuristic(neighbor, end_row, end_col)
+                    heapq.heappush(heap, (candidate + h, candidate, neighbor))
+                    generated += 1
+            if len(heap) > max_open_size:
+                max_open_size = len(heap)
+        
+        if not found:
+            return SearchResult(None, None, explored, generated, max_open_size,
+                                time.perf_counter_ns() - started_ns)
+        
+        # Pontos de passagem: início, entradas usadas e fim
+        if parents[-1] == -3:
+            # Caminho direto, sem passar pelo grafo abstrato
+            cells = [end_index]
+            while cells[-1] != start_index:
+                cells.append(direct_parents[cells[-1]])
+            cells.reverse()
+            path = [self._position(index) for index in cells]
+            if not refine:
+                path = [path[0], path[-1]] if len(path) > 1 else path
+            return SearchResult(path, best[-1], explored, generated, max_open_size,
+                                time.perf_counter_ns() - started_ns)
+        
+        waypoints = [end_index]
+        node = parents[-1]
+        while node != -2:
+            waypoints.append(node)
+            node = parents[node]
+        waypoints.append(start_index)
+        waypoints.reverse()
+        
+        if refine:
+            path, refine_explored = self._refine(waypoints, start_parents, end_parents)
+            explored += refine_explored
+        else:
+            path = [self._position(index) for index in waypoints]
+        return SearchResult(path, best[-1], explored, generated, max_open_size,
+                            time.perf_counter_ns() - started_ns)
+    
+    def _refine(self, waypoints: List[int], start_parents: Dict[int, int],
+                end_parents: Dict[int, int]) -> Tuple[List[Tuple[int, int]], int]:
+        """Expande os pontos de passagem para o caminho célula a célula."""
+        explored = 0
+        cells = [waypoints[0]]
+        last = len(waypoints) - 2
+        for number, (source, target) in enumerate(zip(waypoints, waypoints[1:])):
+            if number == 0:
+                # Trecho do início: reaproveita os pais da busca local do início
+                segment = [target]
+                while segment[-1] != source:
+                    segment.append(start_parents[segment[-1]])
+                segment.pop()
+                segment.reverse()
+            elif number == last:
+                # Trecho final: os "pais" da busca reversa apontam para o fim
+                segment = []
+                index = source
+                while index != target:
+                    index = end_parents[index]
+                    segment.append(index)
+            elif target in self._inter.get(source, {}):
+                segment = [target]  # Travessia entre clusters vizinhos
+            else:
+                cluster = self.cluster_of(self._position(source))
+                _, parents, local_explored = self._local_search(source, self._bounds(cluster),
+                                                                target)
+                explored += local_explored
+                segment = [target]
+                while segment[-1] != source:
+                    segment.append(parents[segment[-1]])
+                segment.pop()
+                segment.reverse()
+            cells.extend(segment)
+        return [self._position(index) for index in cells], explored
+    
+    def get_statistics(self) -> Dict:
+        """
+        Retorna o tamanho da abstração.
+        
+        Returns:
+            Dicionário com clusters, entradas, arestas internas e de travessia e
+            tempo de construção
+        """
+        return {
+            'clusters': len(self._entrances),
+            'entrances': sum(len(entrances) for entrances in self._entrances.values()),
+            'intra_edges': sum(len(edges) for edges in self._intra.values()),
+            'inter_edges': sum(len(edges) for edges in self._inter.values()),
+            'build_time_ms': self.build_time_ns / 1e6
+        }
@@ -0,0 +1,237 @@
+"""
+Heurística ALT (A*, landmarks e desigualdade triangular)
+Descrição: Pré-calcula as distâncias exatas de/para alguns pontos de referência
+           (landmarks) sobre o grid com pesos e usa a desigualdade triangular como
+           limite inferior do custo até o objetivo, muito mais justo que Manhattan
+           ou Euclidiana em mapas com células pesadas.
+"""
+
+import heapq
+import math
+import time
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+from src.maze import Maze
+from src.pathfinder import _DIAGONAL_COST, _neighbor_table, _pad_weights
+
+
+# Distância guardada para células inalcançáveis (finita, para que as diferenças
+# nunca resultem em inf - inf) e folga relativa do arredondamento para float32
+_UNREACHABLE = 1e30
+_FLOAT32_SLACK = 2.0 ** -22
+
+
+def _dijkstra(weights, width: int, table, source: int, reverse: bool) -> array:
+    """
+    Dijkstra de um-para-todos sobre o grid com borda.
+    
+    Args:
+        weights: Pesos com borda (veja _pad_weights)
+        width: Largura do grid com borda
+        table: Tabela de vizinhança (veja _neighbor_table)
+        source: Índice de origem
+        reverse: Se True, calcula o custo de cada célula ATÉ source
+    
+    Returns:
+        Vetor 'd' com a distância de cada índice (math.inf se inalcançável)
+    """
+    distances = array('d', [math.inf]) * len(weights)
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        distance, current = heapq.heappop(heap)
+        if distance > distances[current]:
+            continue
+        current_weight = weights[current]
+        for delta, move_cost in table:
+            neighbor = current - delta if reverse else current + delta
+            weight = weights[neighbor]
+            if weight == -1:
+                continue
+            candidate = distance + move_cost * (current_weight if reverse else weight)
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                heapq.heappush(heap, (candidate, neighbor))
+    return distances
+
+
+class LandmarkHeuristic:
+    """
+    Tabelas de distâncias de/para landmarks e a heurística ALT derivada delas.
+    
+    Como o custo de um movimento depende do peso da célula de destino, o grafo é
+    direcionado e cada landmark L guarda duas tabelas: d(L, v) e d(v, L). Para um
+    objetivo t, valem h(v) >= d(L, t) - d(L, v) e h(v) >= d(v, L) - d(t, L); a
+    heurística é o maior desses limites (e do limite octil/Manhattan, válido
+    porque todo peso é >= 1). As tabelas são guardadas em float32, e uma pequena
+    folga relativa compensa o arredondamento para manter a heurística admissível.
+    
+    As tabelas refletem o grid no momento da construção: depois de alterar o
+    labirinto, reconstrua o objeto (veja is_current).
+    
+    Atributos:
+        landmarks (List[Tuple[int, int]]): Posições dos landmarks (linha, coluna)
+        allow_diagonal (bool): Se as distâncias consideram movimentos diagonais
+        width (int): Largura do grid com borda (colunas + 2)
+        version (Optional[int]): Versão do Maze usada na construção
+        build_time_ns (int): Tempo de pré-processamento em nanossegundos
+    """
+    
+    def __init__(self, maze_grid, landmarks: Optional[List[Tuple[int, int]]] = None,
+                 count: int = 4, allow_diagonal: bool = False,
+                 seed: Optional[Tuple[int, int]] = None):
+        """
+        Escolhe os landmarks (se não informados) e calcula as tabelas de distâncias.
+        
+        Args:
+            maze_grid: Grid numérico (lista de listas ou array NumPy)
+            landmarks: Posições dos landmarks; se None, são escolhidos count
+                landmarks por seleção do ponto mais distante
+            count: Número de landmarks a escolher (ignorado se landmarks for dado)
+            allow_diagonal: Se True, considera movimentos diagonais
+            seed: Célula livre de onde parte a seleção (padrão: primeira livre)
+        
+        Raises:
+            ValueError: Se um landmark for inválido, count < 1 ou o grid não tiver
+                células livres
+        """
+        started_ns = time.perf_counter_ns()
+        if count < 1:
+            raise ValueError("count deve ser pelo menos 1")
+        self.rows = len(maze_grid)
+        self.cols = len(maze_grid[0]) if self.rows > 0 else 0
+        self.allow_diagonal = allow_diagonal
+        self.version: Optional[int] = None
+        self._weights, self.width = _pad_weights(maze_grid)
+        self._table = _neighbor_table(self.width, allow_diagonal)
+        self._forward: List[array] = []   # d(L, v) por landmark
+        self._backward: List[array] = []  # d(v, L) por landmark
+        self.landmarks: List[Tuple[int, int]] = []
+        
+        if landmarks is not None:
+            for position in landmarks:
+                self._add_landmark(self._checked_index(position))
+        else:
+            self._select_landmarks(count, seed)
+        
+        # Depois da construção só as tabelas float32 são usadas: o grid com borda
+        # (uma lista de ints do tamanho do labirinto) não é retido
+        del self._weights, self._table
+        self.build_time_ns = time.perf_counter_ns() - started_ns
+    
+    @staticmethod
+    def from_maze(maze: Maze, count: int = 4, allow_diagonal: bool = False,
+                  landmarks: Optional[List[Tuple[int, int]]] = None) -> 'LandmarkHeuristic':
+        """
+        Constrói a heurística para um labirinto, partindo a seleção de maze.start.
+        
+        Args:
+            maze: Objeto Maze
+            count: Número de landmarks a escolher
+            allow_diagonal: Se True, considera movimentos diagonais
+            landmarks: Posições fixas dos landmarks (opcional)
+        
+        Returns:
+            Objeto LandmarkHeuristic
+        """
+        heuristic = LandmarkHeuristic(maze.grid, landmarks, count, allow_diagonal,
+                                      seed=maze.start)
+        heuristic.version = maze.version
+        return heuristic
+    
+    def is_current(self, maze: Maze) -> bool:
+        """Verifica se as tabelas ainda correspondem ao conteúdo do labirinto."""
+        return self.version == maze.version
+    
+    def _checked_index(self, position: Tuple[int, int]) -> int:
+        """Converte uma posição livre em índice no grid com borda."""
+        row, col = position
+        index = (row + 1) * self.width + col + 1
+        if not (0 <= row < self.rows and 0 <= col < self.cols) or self._weights[index] == -1:
+            raise ValueError(f"Landmark {position} fora do labirinto ou sobre um obstáculo")
+        return index
+    
+    def _compact(self, distances: array) -> array:
+        """Converte distâncias para float32, com inalcançável como valor finito."""
+        return array('f', [_UNREACHABLE if distance == math.inf else distance
+                           for distance in distances])
+    
+    def _add_landmark(self, index: int) -> array:
+        """Calcula as tabelas de um landmark; retorna as distâncias d(L, v) completas."""
+        forward = _dijkstra(self._weights, self.width, self._table, index, reverse=False)
+        backward = _dijkstra(self._weights, self.width, self._table, index, reverse=True)
+        self._forward.append(self._compact(forward))
+        self._backward.append(self._compact(backward))
+        row, col = divmod(index, self.width)
+        self.landmarks.append((row - 1, col - 1))
+        return forward
+    
+    def _select_landmarks(self, count: int, seed: Optional[Tuple[int, int]]) -> None:
+        """
+        Seleção do ponto mais distante: cada novo landmark é a célula alcançável
+        cuja menor distância aos landmarks já escolhidos é a maior.
+        """
+        if seed is not None:
+            current = self._checked_index(seed)
+        else:
+            current = next((index for index, weight in enumerate(self._weights)
+                            if weight != -1), -1)
+            if current == -1:
+                raise ValueError("O grid não tem células livres")
+        
+        # O primeiro landmark é o ponto mais distante da semente
+        nearest = _dijkstra(self._weights, self.width, self._table, current, reverse=False)
+        for number in range(count):
+            farthest, farthest_distance = -1, 0.0
+            for index, distance in enumerate(nearest):
+                if farthest_distance < distance < math.inf:
+                    farthest, farthest_distance = index, distance
+            if farthest == -1:
+                break  # Todas as células alcançáveis já são landmarks
+            distances = self._add_landmark(farthest)
+            nearest = distances if number == 0 else array('d', map(min, nearest, distances))
+    
+    def heuristic_to(self, end_index: int) -> Callable[[int], float]:
+        """
+        Retorna a função heurística h(índice) para um objetivo.
+        
+        Args:
+            end_index: Índice do objetivo no grid com borda
+        
+        Returns:
+            Função que recebe um índice do grid com borda e devolve o limite inferior
+        """
+        width = self.width
+        end_row, end_col = divmod(end_index, width)
+        allow_diagonal = self.allow_diagonal
+        diagonal_extra = _DIAGONAL_COST - 1
+        tables = [(forward, backward, forward[end_index], backward[end_index])
+                  for forward, backward in zip(self._forward, self._backward)]
+        
+        def heuristic(index: int) -> float:
+            row, col = divmod(index, width)
+            d_row, d_col = abs(row - end_row), abs(col - end_col)
+            if allow_diagonal:
+                best = diagonal_extra * min(d_row, d_col) + max(d_row, d_col)
+            else:
+                best = d_row + d_col
+            for forward, backward, forward_end, backward_end in tables:
+                to_index = forward[index]
+                bound = forward_end - to_index
+                slack = (forward_end + to_index) * _FLOAT32_SLACK
+                if bound - slack > best:
+                    best = bound - slack
+                from_index = backward[index]
+                bound = from_index - backward_end
+                slack = (from_index + backward_end) * _FLOAT32_SLACK
+                if bound - slack > best:
+                    best = bound - slack
+            return best
+        
+        return heuristic
+    
+    def __repr__(self) -> str:
+        """Representação técnica da heurística."""
+        return (f"LandmarkHeuristic(landmarks={self.landmarks}, "
+                f"allow_diagonal={self.allow_diagonal})")
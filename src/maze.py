@@ -5,8 +5,151 @@ Descrição: Classe para representar labirintos 2D, incluindo parsing de entrada
            validação de estrutura e conversão entre diferentes formatos.
 """
 
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain, repeat
 from typing import List, Tuple, Optional, Dict
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional (apenas para Maze(use_numpy=True))
+    np = None
+
+
+# Formato binário (.pfmz): cabeçalho fixo de 32 bytes, little-endian, seguido do
+# corpo com os pesos internos (-1 = obstáculo) linha a linha.
+#   magic(4s) versão(H) dtype(c) pad(1) linhas(I) colunas(I) início(ii) fim(ii)
+BINARY_MAGIC = b'PFMZ'
+BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct('<4sHcxIIiiii')
+_BINARY_DTYPES = {b'b': 1, b'h': 2, b'i': 4}  # Código do array -> bytes por célula
+
+# Número máximo de alterações de célula guardadas no diário (veja Maze.changes_since)
+DEFAULT_JOURNAL_LIMIT = 100_000
+
+
+def _parse_weight(cell: str) -> int:
+    """
+    Converte um token numérico para a convenção interna de pesos.
+    
+    Args:
+        cell: Token já normalizado (sem espaços, em maiúsculas)
+    
+    Returns:
+        -1 para negativos ou tokens desconhecidos, 1 para zero, o próprio valor caso contrário
+    """
+    try:
+        value = int(cell)
+    except ValueError:
+        # Caractere desconhecido, trata como obstáculo
+        return -1
+    if value < 0:
+        # Valores negativos são obstáculos
+        return -1
+    if value == 0:
+        # Zero tratado como célula livre peso 1
+        return 1
+    # Valor positivo é o peso da célula
+    return value
+
+
+# Valor interno dos tokens mais comuns, consultado sem normalizar o token. Os demais
+# (S/E, minúsculas, espaços, pesos grandes, texto desconhecido) dão 0 na consulta e
+# são resolvidos um a um por _resolve_token.
+_TOKEN_VALUES = {'0': 1, '1': -1, **{str(weight): weight for weight in range(2, 100)}}
+
+
+def _resolve_token(cell, position: Tuple[int, int], starts: List[Tuple[int, int]],
+                   ends: List[Tuple[int, int]]) -> int:
+    """
+    Converte um token fora de _TOKEN_VALUES, registrando as posições de S e E.
+    
+    Args:
+        cell: Token original (qualquer valor; é normalizado com str().strip().upper())
+        position: Posição (linha, coluna) do token
+        starts: Lista onde a posição é acrescentada se o token for 'S'
+        ends: Lista onde a posição é acrescentada se o token for 'E'
+    
+    Returns:
+        Valor interno da célula
+    """
+    cell = str(cell).strip().upper()
+    if cell == 'S':
+        starts.append(position)
+        return 1
+    if cell == 'E':
+        ends.append(position)
+        return 1
+    value = _TOKEN_VALUES.get(cell)
+    return value if value is not None else _parse_weight(cell)
+
+
+def _pick_start_end(starts: List[Tuple[int, int]],
+                    ends: List[Tuple[int, int]]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Valida as posições de S e E encontradas (em ordem de varredura).
+    
+    Args:
+        starts: Posições dos tokens 'S'
+        ends: Posições dos tokens 'E'
+    
+    Returns:
+        Tupla (início, fim)
+    
+    Raises:
+        ValueError: Se S ou E não forem encontrados ou houver duplicatas
+    """
+    # Com S e E duplicados, reporta a duplicata que aparece primeiro na varredura
+    if len(starts) > 1 and (len(ends) < 2 or starts[1] < ends[1]):
+        raise ValueError(
+            f"Múltiplos pontos de início encontrados! "
+            f"Apenas um 'S' deve estar presente no labirinto."
+        )
+    if len(ends) > 1:
+        raise ValueError(
+            f"Múltiplos pontos de fim encontrados! "
+            f"Apenas um 'E' deve estar presente no labirinto."
+        )
+    if not starts:
+        raise ValueError(
+            "Ponto de início 'S' não encontrado! "
+            "O labirinto deve conter exatamente um 'S'."
+        )
+    if not ends:
+        raise ValueError(
+            "Ponto de fim 'E' não encontrado! "
+            "O labirinto deve conter exatamente um 'E'."
+        )
+    return starts[0], ends[0]
+
+
+def _convert_row(row: List[str], i: int, starts: List[Tuple[int, int]],
+                 ends: List[Tuple[int, int]]) -> List[int]:
+    """
+    Converte uma linha de tokens para valores internos.
+    
+    Os tokens comuns são mapeados por _TOKEN_VALUES em uma única passada; só os
+    que ficam com 0 (S/E e formatos raros) passam por _resolve_token.
+    
+    Args:
+        row: Tokens da linha
+        i: Índice da linha
+        starts: Lista que recebe as posições de 'S'
+        ends: Lista que recebe as posições de 'E'
+    
+    Returns:
+        Lista de valores internos da linha
+    """
+    values = list(map(_TOKEN_VALUES.get, row, repeat(0)))
+    if 0 in values:
+        for j, value in enumerate(values):
+            if value == 0:
+                values[j] = _resolve_token(row[j], (i, j), starts, ends)
+    return values
+
 
 class Maze:
     """
@@ -20,40 +163,84 @@ class Maze:
         - Pesos: valores numéricos indicam custo de travessia
     
     Atributos:
-        grid (List[List[int]]): Matriz numérica do labirinto
+        grid (List[List[int]] ou numpy.ndarray): Matriz numérica do labirinto
+            (array int32 contíguo quando use_numpy=True; grid[r][c] funciona em ambos)
         rows (int): Número de linhas
         cols (int): Número de colunas
         start (Tuple[int, int]): Posição inicial (linha, coluna)
         end (Tuple[int, int]): Posição final (linha, coluna)
-        original_grid (List[List[str]]): Grid original antes da conversão
+        original_grid (List[List[str]]): Grid em texto; o original só é mantido com
+            keep_original=True, caso contrário é regenerado a partir do grid numérico
     """
     
-    def __init__(self, input_maze: List[List[str]]):
+    def __init__(self, input_maze: List[List[str]], use_numpy: bool = False,
+                 keep_original: bool = False):
         """
         Inicializa um labirinto a partir de uma matriz de strings.
         
         Args:
             input_maze: Matriz de strings representando o labirinto
+            use_numpy: Se True, armazena o grid como array NumPy int32 e faz a
+                       conversão de forma vetorizada
+            keep_original: Se True, guarda uma cópia da matriz de strings de entrada
         
         Raises:
             ValueError: Se o labirinto for inválido (formato, sem S/E, etc.)
+            ImportError: Se use_numpy=True e o NumPy não estiver instalado
         """
-        self.original_grid = [row[:] for row in input_maze]  # Cópia profunda
+        if use_numpy and np is None:
+            raise ImportError("NumPy não está instalado! Instale com 'pip install numpy' "
+                              "ou use Maze(..., use_numpy=False).")
+        
+        self._original_grid = None
         self.rows = len(input_maze)
         self.cols = len(input_maze[0]) if self.rows > 0 else 0
         self.start: Optional[Tuple[int, int]] = None
         self.end: Optional[Tuple[int, int]] = None
         self.grid: List[List[int]] = []
+        self._init_tracking()
         
         # Valida e converte o labirinto
-        self._validate_structure()
-        self._find_start_end()
-        self._convert_to_numeric()
+        self._validate_structure(input_maze)
+        if use_numpy:
+            self._convert_vectorized(input_maze)
+        else:
+            self._convert_to_numeric(input_maze)
+        
+        # O texto de entrada só é retido sob demanda (é o maior objeto em mapas grandes)
+        self._original_grid = [row[:] for row in input_maze] if keep_original else None
+    
+    def _init_tracking(self) -> None:
+        """Inicializa o estado derivado do grid (fingerprint, contadores e diário)."""
+        self._fingerprint: Optional[str] = None
+        self._obstacle_count: Optional[int] = None  # None = contadores ainda não calculados
+        self._weight_total = 0
+        self.version = 0
+        self.journal_limit = DEFAULT_JOURNAL_LIMIT
+        self._journal: List[Tuple[int, int, int, int, int]] = []
+        self._journal_base = 0  # Versões <= base não estão mais no diário
+        self._component_labels: Dict[bool, array] = {}  # Diagonais? -> rótulos
+    
+    @property
+    def original_grid(self) -> List[List[str]]:
+        """
+        Grid em texto do labirinto.
+        
+        Retorna a cópia da entrada quando o labirinto foi criado com
+        keep_original=True; caso contrário, regenera a matriz a partir do grid
+        numérico e de start/end a cada acesso (sem guardá-la).
+        """
+        if self._original_grid is not None:
+            return self._original_grid
+        return [[self._cell_token(i, j) for j in range(self.cols)] for i in range(self.rows)]
     
-    def _validate_structure(self) -> None:
+    def _validate_structure(self, input_maze: List[List[str]]) -> None:
         """
         Valida a estrutura básica do labirinto.
         
+        Args:
+            input_maze: Matriz de strings de entrada
+        
         Raises:
             ValueError: Se o labirinto tiver formato inválido
         """
@@ -64,107 +251,70 @@ class Maze:
             raise ValueError("Labirinto sem colunas! Cada linha deve ter ao menos uma célula.")
         
         # Verifica se todas as linhas têm o mesmo número de colunas
-        for i, row in enumerate(self.original_grid):
+        for i, row in enumerate(input_maze):
             if len(row) != self.cols:
                 raise ValueError(
                     f"Linha {i} tem {len(row)} colunas, mas esperava-se {self.cols} colunas. "
                     f"Todas as linhas devem ter o mesmo tamanho."
                 )
     
-    def _find_start_end(self) -> None:
+    def _convert_to_numeric(self, input_maze: List[List[str]]) -> None:
         """
-        Encontra as posições de início (S) e fim (E) no labirinto.
+        Localiza S/E e converte o labirinto de strings para valores numéricos.
+        
+        Convenção interna:
+            -1: Obstáculo (célula bloqueada)
+            >= 1: Célula livre (valor indica peso/custo de travessia)
+        
+        Args:
+            input_maze: Matriz de strings de entrada
         
         Raises:
             ValueError: Se S ou E não forem encontrados ou houver duplicatas
         """
-        start_found = False
-        end_found = False
+        starts: List[Tuple[int, int]] = []
+        ends: List[Tuple[int, int]] = []
+        self.grid = [_convert_row(row, i, starts, ends) for i, row in enumerate(input_maze)]
+        self.start, self.end = _pick_start_end(starts, ends)
+    
+    def _convert_vectorized(self, input_maze: List[List[str]]) -> None:
+        """
+        Localiza S/E e converte o labirinto para um array NumPy int32 em lote.
         
-        for i in range(self.rows):
-            for j in range(self.cols):
-                cell = str(self.original_grid[i][j]).strip().upper()
-                
-                if cell == 'S':
-                    if start_found:
-                        raise ValueError(
-                            f"Múltiplos pontos de início encontrados! "
-                            f"Apenas um 'S' deve estar presente no labirinto."
-                        )
-                    self.start = (i, j)
-                    start_found = True
-                
-                elif cell == 'E':
-                    if end_found:
-                        raise ValueError(
-                            f"Múltiplos pontos de fim encontrados! "
-                            f"Apenas um 'E' deve estar presente no labirinto."
-                        )
-                    self.end = (i, j)
-                    end_found = True
-        
-        if not start_found:
-            raise ValueError(
-                "Ponto de início 'S' não encontrado! "
-                "O labirinto deve conter exatamente um 'S'."
-            )
-        
-        if not end_found:
-            raise ValueError(
-                "Ponto de fim 'E' não encontrado! "
-                "O labirinto deve conter exatamente um 'E'."
-            )
-    
-    def _convert_to_numeric(self) -> None:
-        """
-        Converte o labirinto de strings para valores numéricos.
+        Os tokens são mapeados por _TOKEN_VALUES direto para o buffer do array
+        (numpy.fromiter), sem montar listas intermediárias; só os tokens que ficam
+        com 0 (S/E e formatos raros) são resolvidos um a um, com as mesmas regras
+        de _convert_to_numeric.
         
-        Convenção interna:
-            -1: Obstáculo (célula bloqueada)
-            >= 1: Célula livre (valor indica peso/custo de travessia)
+        Args:
+            input_maze: Matriz de strings de entrada
+        
+        Raises:
+            ValueError: Se S ou E não forem encontrados ou houver duplicatas
         """
-        self.grid = []
+        cols = self.cols
+        grid = np.fromiter(map(_TOKEN_VALUES.get, chain.from_iterable(input_maze), repeat(0)),
+                           dtype=np.int32, count=self.rows * cols)
         
-        for i in range(self.rows):
-            row = []
-            for j in range(self.cols):
-                cell = str(self.original_grid[i][j]).strip().upper()
-                
-                if cell == 'S' or cell == 'E':
-                    # Início e fim são células livres com peso 1
-                    row.append(1)
-                elif cell == '0':
-                    # Célula livre padrão com peso 1
-                    row.append(1)
-                elif cell == '1':
-                    # Obstáculo (na notação do projeto, '1' é obstáculo)
-                    row.append(-1)
-                else:
-                    # Tenta converter para número (pode ser peso customizado)
-                    try:
-                        value = int(cell)
-                        if value < 0:
-                            # Valores negativos são obstáculos
-                            row.append(-1)
-                        elif value == 0:
-                            # Zero tratado como célula livre peso 1
-                            row.append(1)
-                        else:
-                            # Valor positivo é o peso da célula
-                            row.append(value)
-                    except ValueError:
-                        # Caractere desconhecido, trata como obstáculo
-                        row.append(-1)
-            
-            self.grid.append(row)
+        starts: List[Tuple[int, int]] = []
+        ends: List[Tuple[int, int]] = []
+        for index in np.flatnonzero(grid == 0).tolist():
+            i, j = divmod(index, cols)
+            grid[index] = _resolve_token(input_maze[i][j], (i, j), starts, ends)
+        
+        self.start, self.end = _pick_start_end(starts, ends)
+        self.grid = grid.reshape(self.rows, cols)
     
     @staticmethod
-    def from_string(maze_string: str) -> 'Maze':
+    def from_string(maze_string: str, use_numpy: bool = False,
+                    keep_original: bool = False) -> 'Maze':
         """
         Cria um labirinto a partir de uma string multi-linha.
         
         Args:
             maze_string: String representando o labirinto (linhas separadas por \\n)
+            use_numpy: Se True, armazena o grid como array NumPy int32
+            keep_original: Se True, mantém a matriz de strings original
         
         Returns:
             Objeto Maze
@@ -180,21 +330,231 @@ class Maze:
         """
         lines = maze_string.strip().split('\n')
         maze_grid = [line.split() for line in lines if line.strip()]
-        return Maze(maze_grid)
+        return Maze(maze_grid, use_numpy=use_numpy, keep_original=keep_original)
     
     @staticmethod
-    def from_array(maze_array: List[List]) -> 'Maze':
+    def from_file(file_path: str, use_numpy: bool = False,
+                  keep_original: bool = False) -> 'Maze':
+        """
+        Lê um labirinto de um arquivo texto linha a linha (streaming).
+        
+        Cada linha é tokenizada e convertida diretamente para o grid numérico,
+        validando a largura das linhas durante a leitura (os pontos S/E são
+        validados ao final). Nem o texto completo nem a matriz de strings são
+        mantidos em memória.
+        
+        Args:
+            file_path: Caminho do arquivo texto
+            use_numpy: Se True, armazena o grid como array NumPy int32
+            keep_original: Se True, mantém original_grid (matriz de strings)
+        
+        Returns:
+            Objeto Maze
+        
+        Raises:
+            ValueError: Se o labirinto for inválido (formato, sem S/E, etc.)
+            ImportError: Se use_numpy=True e o NumPy não estiver instalado
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy não está instalado! Instale com 'pip install numpy' "
+                              "ou use Maze.from_file(..., use_numpy=False).")
+        
+        # Com NumPy, as linhas vão para um buffer int32 plano (4 bytes por célula)
+        flat = array('i') if use_numpy else None
+        grid: List[List[int]] = []
+        original_grid: Optional[List[List[str]]] = [] if keep_original else None
+        starts: List[Tuple[int, int]] = []
+        ends: List[Tuple[int, int]] = []
+        cols = 0
+        i = 0
+        obstacles = 0
+        weight_total = 0
+        
+        with open(file_path, 'r') as f:
+            for line in f:
+                tokens = line.split()
+                if not tokens:
+                    continue
+                
+                if i == 0:
+                    cols = len(tokens)
+                elif len(tokens) != cols:
+                    raise ValueError(
+                        f"Linha {i} tem {len(tokens)} colunas, mas esperava-se {cols} colunas. "
+                        f"Todas as linhas devem ter o mesmo tamanho."
+                    )
+                
+                row = _convert_row(tokens, i, starts, ends)
+                
+                row_obstacles = row.count(-1)
+                obstacles += row_obstacles
+                weight_total += sum(row) + row_obstacles  # Desconta os -1 da soma
+                
+                if flat is not None:
+                    flat.extend(row)
+                else:
+                    grid.append(row)
+                if original_grid is not None:
+                    original_grid.append(tokens)
+                i += 1
+        
+        if i == 0:
+            raise ValueError("Labirinto vazio! O labirinto deve ter ao menos uma célula.")
+        start, end = _pick_start_end(starts, ends)
+        
+        if flat is not None:
+            grid = np.frombuffer(flat, dtype=np.intc).astype(np.int32, copy=False)
+            grid = grid.reshape(i, cols)
+        
+        maze = Maze._from_numeric(grid, start, end)
+        maze._original_grid = original_grid
+        maze._obstacle_count = obstacles
+        maze._weight_total = weight_total
+        return maze
+    
+    @staticmethod
+    def from_array(maze_array: List[List], use_numpy: bool = False,
+                   keep_original: bool = False) -> 'Maze':
         """
         Cria um labirinto a partir de uma matriz (lista de listas).
         
         Args:
             maze_array: Matriz representando o labirinto
+            use_numpy: Se True, armazena o grid como array NumPy int32
+            keep_original: Se True, mantém a matriz de strings original
         
         Returns:
             Objeto Maze
         """
         maze_grid = [[str(cell) for cell in row] for row in maze_array]
-        return Maze(maze_grid)
+        return Maze(maze_grid, use_numpy=use_numpy, keep_original=keep_original)
+    
+    @staticmethod
+    def _from_numeric(grid, start: Tuple[int, int], end: Tuple[int, int]) -> 'Maze':
+        """
+        Cria um labirinto a partir de um grid já numérico, sem reparsing.
+        
+        Args:
+            grid: Grid na convenção interna (indexável como grid[r][c])
+            start: Posição inicial (linha, coluna)
+            end: Posição final (linha, coluna)
+        
+        Returns:
+            Objeto Maze (sem o texto original; original_grid é regenerado)
+        """
+        maze = Maze.__new__(Maze)
+        maze._original_grid = None
+        maze._init_tracking()
+        maze.grid = grid
+        maze.rows = len(grid)
+        maze.cols = len(grid[0]) if maze.rows > 0 else 0
+        maze.start = start
+        maze.end = end
+        return maze
+    
+    def save_binary(self, file_path: str) -> None:
+        """
+        Salva o labirinto no formato binário compacto.
+        
+        O tipo das células é o menor inteiro com sinal que comporta o maior peso
+        (int8, int16 ou int32).
+        
+        Args:
+            file_path: Caminho do arquivo de destino
+        """
+        max_weight = max((max(row) for row in self.grid), default=1)
+        if max_weight <= 127:
+            dtype = b'b'
+        elif max_weight <= 32767:
+            dtype = b'h'
+        else:
+            dtype = b'i'
+        
+        header = _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, dtype,
+                                     self.rows, self.cols, *self.start, *self.end)
+        with open(file_path, 'wb') as f:
+            f.write(header)
+            if np is not None and isinstance(self.grid, np.ndarray):
+                np.asarray(self.grid, dtype=f'<{dtype.decode()}').tofile(f)
+            else:
+                for row in self.grid:
+                    body = array(dtype.decode(), row)
+                    if sys.byteorder == 'big':
+                        body.byteswap()
+                    f.write(body.tobytes())
+    
+    @staticmethod
+    def load_binary(file_path: str) -> 'Maze':
+        """
+        Abre um labirinto no formato binário mapeando o corpo em memória.
+        
+        O arquivo não é lido de uma vez: as páginas são carregadas sob demanda.
+        Com NumPy o grid é um numpy.memmap (linhas x colunas); sem NumPy, cada
+        linha é uma memoryview sobre o mmap. O mapeamento é copy-on-write, então
+        alterações no grid nunca são gravadas no arquivo.
+        
+        Args:
+            file_path: Caminho do arquivo .pfmz
+        
+        Returns:
+            Objeto Maze
+        
+        Raises:
+            ValueError: Se o arquivo não estiver no formato esperado
+        """
+        with open(file_path, 'rb') as f:
+            raw_header = f.read(_BINARY_HEADER.size)
+            if len(raw_header) < _BINARY_HEADER.size or raw_header[:4] != BINARY_MAGIC:
+                raise ValueError(f"'{file_path}' não é um labirinto binário válido.")
+            
+            (_, version, dtype, rows, cols,
+             start_row, start_col, end_row, end_col) = _BINARY_HEADER.unpack(raw_header)
+            if version != BINARY_VERSION:
+                raise ValueError(f"Versão {version} do formato binário não suportada.")
+            if dtype not in _BINARY_DTYPES:
+                raise ValueError(f"Tipo de célula desconhecido no cabeçalho: {dtype!r}.")
+            if rows == 0 or cols == 0:
+                raise ValueError("Labirinto vazio! O labirinto deve ter ao menos uma célula.")
+            
+            expected_size = _BINARY_HEADER.size + rows * cols * _BINARY_DTYPES[dtype]
+            f.seek(0, 2)
+            if f.tell() != expected_size:
+                raise ValueError(
+                    f"Tamanho do arquivo ({f.tell()} bytes) não confere com o cabeçalho "
+                    f"({expected_size} bytes esperados)."
+                )
+            
+            if np is not None:
+                grid = np.memmap(f, dtype=f'<{dtype.decode()}', mode='c',
+                                 offset=_BINARY_HEADER.size, shape=(rows, cols))
+            else:
+                if sys.byteorder == 'big':
+                    raise ValueError("Leitura sem NumPy requer uma máquina little-endian.")
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                body = memoryview(mapped)[_BINARY_HEADER.size:].cast(dtype.decode())
+                grid = [body[r * cols:(r + 1) * cols] for r in range(rows)]
+        
+        start = (start_row, start_col)
+        end = (end_row, end_col)
+        for label, (row, col) in (('início', start), ('fim', end)):
+            if not (0 <= row < rows and 0 <= col < cols) or grid[row][col] == -1:
+                raise ValueError(f"Ponto de {label} inválido no cabeçalho: {(row, col)}.")
+        
+        return Maze._from_numeric(grid, start, end)
+    
+    @staticmethod
+    def is_binary_file(file_path: str) -> bool:
+        """
+        Verifica se um arquivo está no formato binário de labirinto.
+        
+        Args:
+            file_path: Caminho do arquivo
+        
+        Returns:
+            True se o arquivo começa com a assinatura do formato binário
+        """
+        with open(file_path, 'rb') as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
     
     def get_dimensions(self) -> Tuple[int, int]:
         """Retorna as dimensões do labirinto (linhas, colunas)."""
@@ -243,20 +603,348 @@ class Maze:
         row, col = position
         return self.grid[row][col]
     
+    def _check_new_weight(self, weight: int) -> int:
+        """
+        Valida um peso para escrita no grid.
+        
+        Raises:
+            ValueError: Se o peso não for -1 ou >= 1, ou não couber no tipo do grid
+                (ex: grid int8 aberto de um arquivo binário)
+        """
+        weight = int(weight)
+        if weight != -1 and weight < 1:
+            raise ValueError(f"Peso inválido: {weight} (use -1 para obstáculo ou >= 1)")
+        if np is not None and isinstance(self.grid, np.ndarray):
+            limit = np.iinfo(self.grid.dtype).max
+        elif self.rows > 0 and isinstance(self.grid[0], memoryview):
+            limit = (1 << (8 * self.grid[0].itemsize - 1)) - 1
+        else:
+            limit = None
+        if limit is not None and weight > limit:
+            raise ValueError(f"Peso {weight} excede o máximo suportado pelo grid ({limit})")
+        return weight
+    
+    def _record_change(self, row: int, col: int, old: int, new: int) -> None:
+        """Atualiza contadores e diário para uma célula já escrita no grid."""
+        if (old == -1) != (new == -1):
+            self._component_labels.clear()  # Só obstáculos mudam a conectividade
+        if self._obstacle_count is not None:
+            if old == -1:
+                self._obstacle_count -= 1
+            else:
+                self._weight_total -= old
+            if new == -1:
+                self._obstacle_count += 1
+            else:
+                self._weight_total += new
+        self._journal.append((self.version, row, col, old, new))
+    
+    def _finish_edit(self) -> None:
+        """Invalida os dados derivados do conteúdo e limita o tamanho do diário."""
+        self._fingerprint = None
+        self._original_grid = None  # O texto passa a ser regenerado do grid
+        excess = len(self._journal) - self.journal_limit
+        if excess > 0:
+            # Descarta versões inteiras, para que changes_since nunca devolva metade de uma
+            cut = self._journal[excess - 1][0]
+            while excess < len(self._journal) and self._journal[excess][0] == cut:
+                excess += 1
+            del self._journal[:excess]
+            self._journal_base = cut
+    
+    def set_cell(self, position: Tuple[int, int], weight: int) -> bool:
+        """
+        Altera o peso de uma célula no próprio grid, em O(1).
+        
+        Args:
+            position: Tupla (linha, coluna)
+            weight: Novo peso (>= 1) ou -1 para obstáculo
+        
+        Returns:
+            True se a célula mudou (e uma nova versão foi registrada no diário)
+        
+        Raises:
+            ValueError: Se a posição for inválida, o peso for inválido ou se a
+                alteração transformar o início ou o fim em obstáculo
+        """
+        if not self.is_valid_position(position):
+            raise ValueError(f"Posição {position} fora do labirinto")
+        weight = self._check_new_weight(weight)
+        row, col = int(position[0]), int(position[1])
+        if weight == -1 and (row, col) in (self.start, self.end):
+            raise ValueError("Não é possível transformar o início ou o fim em obstáculo")
+        
+        old = int(self.grid[row][col])
+        if old == weight:
+            return False
+        self.grid[row][col] = weight
+        self.version += 1
+        self._record_change(row, col, old, weight)
+        self._finish_edit()
+        return True
+    
+    def set_region(self, top_left: Tuple[int, int], bottom_right: Tuple[int, int],
+                   weight: int) -> int:
+        """
+        Altera o peso de um retângulo de células (cantos inclusivos).
+        
+        O custo é proporcional ao tamanho da região, e todas as células alteradas
+        são registradas no diário sob uma única versão.
+        
+        Args:
+            top_left: Canto superior esquerdo (linha, coluna)
+            bottom_right: Canto inferior direito (linha, coluna)
+            weight: Novo peso (>= 1) ou -1 para obstáculo
+        
+        Returns:
+            Número de células alteradas
+        
+        Raises:
+            ValueError: Se os cantos forem inválidos, o peso for inválido ou se a
+                região transformar o início ou o fim em obstáculo
+        """
+        (row0, col0), (row1, col1) = top_left, bottom_right
+        if not (self.is_valid_position(top_left) and self.is_valid_position(bottom_right)):
+            raise ValueError(f"Região {top_left}-{bottom_right} fora do labirinto")
+        if row0 > row1 or col0 > col1:
+            raise ValueError(f"Região inválida: {top_left} deve estar acima e à esquerda "
+                             f"de {bottom_right}")
+        weight = self._check_new_weight(weight)
+        if weight == -1:
+            for label, (row, col) in (("início", self.start), ("fim", self.end)):
+                if row0 <= row <= row1 and col0 <= col <= col1:
+                    raise ValueError(f"A região inclui o {label} e não pode virar obstáculo")
+        
+        version = self.version + 1
+        changed = 0
+        if np is not None and isinstance(self.grid, np.ndarray):
+            block = self.grid[row0:row1 + 1, col0:col1 + 1]
+            rows, cols = np.nonzero(block != weight)
+            olds = block[rows, cols].tolist()
+            block[rows, cols] = weight
+            self.version = version
+            for row, col, old in zip(rows.tolist(), cols.tolist(), olds):
+                self._record_change(row0 + row, col0 + col, old, weight)
+            changed = len(olds)
+        else:
+            self.version = version
+            for row in range(row0, row1 + 1):
+                grid_row = self.grid[row]
+                for col in range(col0, col1 + 1):
+                    old = grid_row[col]
+                    if old != weight:
+                        grid_row[col] = weight
+                        self._record_change(row, col, old, weight)
+                        changed += 1
+        
+        if changed:
+            self._finish_edit()
+        else:
+            self.version = version - 1  # Nada mudou: não consome uma versão
+        return changed
+    
+    def changes_since(self, version: int) -> Optional[List[Tuple[int, int, int, int]]]:
+        """
+        Retorna as alterações de célula feitas depois de uma versão.
+        
+        Usado por caches e planejadores incrementais para se atualizar sem
+        comparar o grid inteiro (veja DStarLite.sync).
+        
+        Args:
+            version: Versão já conhecida pelo consumidor (ex: maze.version de antes)
+        
+        Returns:
+            Lista de (linha, coluna, peso_antigo, peso_novo) em ordem de aplicação,
+            ou None se o diário não cobre mais essa versão (o consumidor deve
+            reconstruir seu estado a partir do grid)
+        """
+        if version < self._journal_base:
+            return None
+        if version >= self.version:
+            return []
+        # O diário está ordenado por versão: busca binária da primeira entrada nova
+        low, high = 0, len(self._journal)
+        while low < high:
+            middle = (low + high) // 2
+            if self._journal[middle][0] <= version:
+                low = middle + 1
+            else:
+                high = middle
+        return [(row, col, old, new) for _, row, col, old, new in self._journal[low:]]
+    
+    def component_labels(self, allow_diagonal: bool = False,
+                         build: bool = True) -> Optional[array]:
+        """
+        Retorna o rótulo de componente conexa de cada célula.
+        
+        A rotulação (uma busca em largura por componente) é feita uma única vez
+        por tipo de conectividade e reaproveitada até que uma alteração transforme
+        uma célula livre em obstáculo ou vice-versa; mudanças só de peso não a
+        invalidam. Ela percorre o grid inteiro, então só compensa quando várias
+        consultas a reaproveitam; com build=False, quem faz uma única consulta usa
+        os rótulos apenas se já estiverem prontos.
+        
+        Args:
+            allow_diagonal: Se True, usa conectividade-8 (diagonais, como no a_star);
+                caso contrário, conectividade-4
+            build: Se False, retorna None em vez de rotular quando os rótulos não
+                estão prontos
+        
+        Returns:
+            Vetor 'i' com rows * cols rótulos (índice linha * colunas + coluna);
+            0 para obstáculos, 1..k para as componentes (ou None, veja build)
+        """
+        labels = self._component_labels.get(allow_diagonal)
+        if labels is None and build:
+            labels = self._label_components(allow_diagonal)
+            self._component_labels[allow_diagonal] = labels
+        return labels
+    
+    def _label_components(self, allow_diagonal: bool) -> array:
+        """Rotula as componentes conexas sobre um grid de passagem com borda."""
+        rows, cols = self.rows, self.cols
+        width = cols + 2
+        
+        # Grid de passagem com borda de obstáculos: a busca não testa limites
+        if np is not None and isinstance(self.grid, np.ndarray):
+            passable = bytearray(np.pad(np.asarray(self.grid) != -1, 1).tobytes())
+        else:
+            passable = bytearray((rows + 2) * width)
+            for i, row in enumerate(self.grid):
+                offset = (i + 1) * width + 1
+                passable[offset:offset + cols] = bytes(cell != -1 for cell in row)
+        
+        deltas = [-width, width, -1, 1]
+        if allow_diagonal:
+            deltas += [-width - 1, -width + 1, width - 1, width + 1]
+        
+        padded = array('i', bytes(4 * len(passable)))
+        label = 0
+        seed = passable.find(1)
+        while seed != -1:
+            if not padded[seed]:
+                label += 1
+                padded[seed] = label
+                stack = [seed]
+                while stack:
+                    current = stack.pop()
+                    for delta in deltas:
+                        neighbor = current + delta
+                        if passable[neighbor] and not padded[neighbor]:
+                            padded[neighbor] = label
+                            stack.append(neighbor)
+            seed = passable.find(1, seed + 1)
+        
+        labels = array('i')
+        for i in range(rows):
+            offset = (i + 1) * width + 1
+            labels.extend(padded[offset:offset + cols])
+        return labels
+    
+    def is_reachable(self, source: Tuple[int, int], target: Tuple[int, int],
+                     allow_diagonal: bool = False) -> bool:
+        """
+        Verifica em O(1) (após a rotulação) se existe caminho entre duas células.
+        
+        Args:
+            source: Posição de origem (linha, coluna)
+            target: Posição de destino (linha, coluna)
+            allow_diagonal: Se True, considera movimentos diagonais
+        
+        Returns:
+            True se as duas células são livres e estão na mesma componente
+        """
+        if self.is_obstacle(source) or self.is_obstacle(target):
+            return False
+        labels = self.component_labels(allow_diagonal)
+        return (labels[source[0] * self.cols + source[1]] ==
+                labels[target[0] * self.cols + target[1]])
+    
+    def fingerprint(self) -> str:
+        """
+        Retorna um hash do conteúdo do grid (dimensões e pesos).
+        
+        O hash (BLAKE2b de 128 bits) é calculado uma vez e guardado. Dois labirintos
+        com os mesmos pesos têm o mesmo fingerprint, independentemente de início,
+        fim ou formato de armazenamento (listas, NumPy ou mapeamento binário).
+        
+        Returns:
+            Fingerprint em hexadecimal
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(struct.pack('<II', self.rows, self.cols))
+            if np is not None and isinstance(self.grid, np.ndarray):
+                digest.update(np.ascontiguousarray(self.grid, dtype='<i4').tobytes())
+            else:
+                for row in self.grid:
+                    values = array('i', row)
+                    if sys.byteorder == 'big':
+                        values.byteswap()
+                    digest.update(values.tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def notify_changed(self) -> None:
+        """
+        Registra uma alteração feita diretamente em maze.grid.
+        
+        Incrementa a versão e descarta o fingerprint e os dados derivados
+        guardados, para que caches e planejadores baseados na versão (veja
+        cache.PathCache) percebam a mudança. set_cell e set_region já fazem isso.
+        Como alterações diretas não entram no diário, changes_since passa a
+        retornar None para as versões anteriores (o consumidor deve reconstruir
+        seu estado a partir do grid); os contadores de get_statistics são
+        recalculados.
+        """
+        self.version += 1
+        self._journal.clear()
+        self._journal_base = self.version
+        self._fingerprint = None
+        self._obstacle_count = None
+        self._component_labels.clear()
+    
+    def _count_cells(self) -> None:
+        """
+        Conta obstáculos e soma os pesos livres em uma única passada pelo grid.
+        
+        Com NumPy a passada é vetorizada; com listas (ou linhas memoryview) cada
+        linha é contada com list.count/sum, sem montar uma lista de pesos livres.
+        """
+        if np is not None and isinstance(self.grid, np.ndarray):
+            obstacles = int(np.count_nonzero(self.grid == -1))
+            weight_total = int(self.grid.sum(dtype=np.int64)) + obstacles
+        else:
+            obstacles = 0
+            weight_total = 0
+            for row in self.grid:
+                if not isinstance(row, list):
+                    row = row.tolist()
+                row_obstacles = row.count(-1)
+                obstacles += row_obstacles
+                weight_total += sum(row) + row_obstacles  # Desconta os -1 da soma
+        self._obstacle_count = obstacles
+        self._weight_total = weight_total
+    
     def get_statistics(self) -> Dict:
         """
         Retorna estatísticas sobre o labirinto.
         
+        Os contadores são calculados na conversão do labirinto (ou, para grids
+        binários mapeados em memória, na primeira chamada) e mantidos por
+        set_cell/set_region, então a chamada é O(1).
+        
         Returns:
             Dicionário com informações estatísticas
         """
+        if self._obstacle_count is None:
+            self._count_cells()
         total_cells = self.rows * self.cols
-        obstacles = sum(1 for row in self.grid for cell in row if cell == -1)
+        obstacles = self._obstacle_count
         free_cells = total_cells - obstacles
         
-        # Calcula peso médio das células livres
-        free_weights = [cell for row in self.grid for cell in row if cell > 0]
-        avg_weight = sum(free_weights) / len(free_weights) if free_weights else 0
+        # Peso médio das células livres
+        avg_weight = self._weight_total / free_cells if free_cells else 0
         
         return {
             'dimensions': (self.rows, self.cols),
@@ -269,9 +957,26 @@ class Maze:
             'end': self.end
         }
     
+    def _cell_token(self, row: int, col: int) -> str:
+        """Regenera o token de texto de uma célula a partir do grid numérico."""
+        if (row, col) == self.start:
+            return 'S'
+        if (row, col) == self.end:
+            return 'E'
+        value = self.grid[row][col]
+        if value == -1:
+            return '1'
+        if value == 1:
+            return '0'
+        return str(value)
+    
     def __str__(self) -> str:
         """Retorna uma representação em string do labirinto."""
         lines = []
+        if self._original_grid is None:
+            for i in range(self.rows):
+                lines.append(' '.join(self._cell_token(i, j) for j in range(self.cols)))
+            return '\n'.join(lines)
         for i, row in enumerate(self.original_grid):
             lines.append(' '.join(str(cell) for cell in row))
         return '\n'.join(lines)
@@ -6,7 +6,9 @@ Descrição: Contém a implementação central do algoritmo A* com suporte a mov
 """
 
 import heapq
-from typing import List, Tuple, Optional, Set
+import time
+from array import array
+from typing import Any, Dict, Generator, Hashable, List, Tuple, Optional, Set
 import math
 
 
@@ -55,6 +57,161 @@ class Node:
         return f"Node({self.position}, f={self.f_cost:.2f})"
 
 
+class SearchResult:
+    """
+    Resultado estruturado de uma busca (sem nenhuma saída no console).
+    
+    Atributos:
+        path (Optional[List[Tuple[int, int]]]): Caminho do início ao fim (None se não houver)
+        cost (Optional[float]): Custo total do caminho (None se não houver)
+        nodes_explored (int): Nós retirados da lista aberta e expandidos
+        nodes_generated (int): Inserções na lista aberta (inclui o nó inicial)
+        max_open_size (int): Maior número de entradas vivas na lista aberta
+        elapsed_ns (int): Tempo de execução da busca em nanossegundos
+        stale_pops (int): Entradas obsoletas descartadas da lista aberta
+    """
+    
+    def __init__(self, path: Optional[List[Tuple[int, int]]], cost: Optional[float],
+                 nodes_explored: int = 0, nodes_generated: int = 0,
+                 max_open_size: int = 0, elapsed_ns: int = 0, stale_pops: int = 0):
+        """
+        Inicializa o resultado de uma busca.
+        
+        Args:
+            path: Caminho encontrado (None se não houver solução)
+            cost: Custo total do caminho (None se não houver solução)
+            nodes_explored: Nós expandidos
+            nodes_generated: Inserções na lista aberta
+            max_open_size: Tamanho máximo da lista aberta
+            elapsed_ns: Tempo de execução em nanossegundos
+            stale_pops: Entradas obsoletas descartadas
+        """
+        self.path = path
+        self.cost = cost
+        self.nodes_explored = nodes_explored
+        self.nodes_generated = nodes_generated
+        self.max_open_size = max_open_size
+        self.elapsed_ns = elapsed_ns
+        self.stale_pops = stale_pops
+    
+    @property
+    def found(self) -> bool:
+        """Indica se um caminho foi encontrado."""
+        return self.path is not None
+    
+    def as_tuple(self) -> Optional[Tuple[List[Tuple[int, int]], float]]:
+        """Retorna no formato antigo: (caminho, custo) ou None."""
+        if self.path is None:
+            return None
+        return self.path, self.cost
+    
+    def __bool__(self) -> bool:
+        """Verdadeiro se um caminho foi encontrado."""
+        return self.found
+    
+    def __repr__(self) -> str:
+        """Representação em string do resultado."""
+        if not self.found:
+            return f"SearchResult(sem solução, explorados={self.nodes_explored})"
+        return (f"SearchResult(custo={self.cost:.2f}, tamanho={len(self.path)}, "
+                f"explorados={self.nodes_explored})")
+
+
+class BidirectionalSearchResult(SearchResult):
+    """
+    Resultado de bidirectional_a_star, com os nós explorados em cada direção.
+    
+    Atributos:
+        nodes_explored_forward (int): Nós expandidos a partir do início
+        nodes_explored_backward (int): Nós expandidos a partir do fim
+    """
+    
+    def __init__(self, path: Optional[List[Tuple[int, int]]], cost: Optional[float],
+                 nodes_explored_forward: int = 0, nodes_explored_backward: int = 0,
+                 nodes_generated: int = 0, max_open_size: int = 0,
+                 elapsed_ns: int = 0, stale_pops: int = 0):
+        """
+        Inicializa o resultado de uma busca bidirecional.
+        
+        Args:
+            path: Caminho encontrado (None se não houver solução)
+            cost: Custo total do caminho (None se não houver solução)
+            nodes_explored_forward: Nós expandidos pela busca a partir do início
+            nodes_explored_backward: Nós expandidos pela busca a partir do fim
+            nodes_generated: Inserções nas duas listas abertas
+            max_open_size: Maior soma de entradas vivas nas duas listas abertas
+            elapsed_ns: Tempo de execução em nanossegundos
+            stale_pops: Entradas obsoletas descartadas
+        """
+        super().__init__(path, cost, nodes_explored_forward + nodes_explored_backward,
+                         nodes_generated, max_open_size, elapsed_ns, stale_pops)
+        self.nodes_explored_forward = nodes_explored_forward
+        self.nodes_explored_backward = nodes_explored_backward
+
+
+class OpenList:
+    """
+    Lista aberta do A* (heap binário) com invalidação preguiçosa por geração.
+    
+    Cada inserção recebe um carimbo de geração único. Quando uma chave é
+    reinserida com prioridade melhor, apenas o carimbo mais recente fica vivo;
+    as entradas antigas permanecem no heap, mas são descartadas ao serem
+    retiradas, sem nenhuma busca ou reordenação.
+    
+    Atributos:
+        stale_pops (int): Número de entradas obsoletas descartadas em pop()
+    """
+    
+    def __init__(self):
+        """Inicializa uma lista aberta vazia."""
+        self._heap: List[Tuple[float, float, int, Hashable, Any]] = []
+        self._live: Dict[Hashable, int] = {}  # Chave -> carimbo da entrada viva
+        self._generation = 0
+        self.stale_pops = 0
+    
+    def push(self, key: Hashable, priority: float, item: Any = None,
+             tie: float = 0.0) -> None:
+        """
+        Insere (ou melhora) uma chave na lista aberta.
+        
+        Args:
+            key: Identificador do estado (ex: posição)
+            priority: Prioridade (f_cost); menor sai primeiro
+            item: Objeto devolvido por pop() (ex: Node)
+            tie: Critério de desempate para prioridades iguais
+        """
+        self._generation += 1
+        self._live[key] = self._generation
+        heapq.heappush(self._heap, (priority, tie, self._generation, key, item))
+    
+    def pop(self) -> Tuple[Hashable, Any]:
+        """
+        Remove e retorna a entrada viva de menor prioridade.
+        
+        Returns:
+            Tupla (chave, item)
+        
+        Raises:
+            IndexError: Se não houver entradas vivas
+        """
+        while self._heap:
+            _, _, generation, key, item = heapq.heappop(self._heap)
+            if self._live.get(key) != generation:
+                self.stale_pops += 1
+                continue
+            del self._live[key]
+            return key, item
+        raise IndexError("pop de uma lista aberta vazia")
+    
+    def __contains__(self, key: Hashable) -> bool:
+        """Verifica se a chave possui uma entrada viva."""
+        return key in self._live
+    
+    def __len__(self) -> int:
+        """Número de entradas vivas."""
+        return len(self._live)
+
+
 def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     """
     Calcula a distância de Manhattan entre duas posições.
@@ -92,6 +249,12 @@ def euclidean_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     return math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
 
 
+# Deslocamentos calculados uma única vez (ordem: cima, baixo, esquerda, direita)
+_ORTHOGONAL_MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL_MOVES = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+_DIAGONAL_COST = math.sqrt(2)
+
+
 def get_neighbors(position: Tuple[int, int], rows: int, cols: int, 
                   allow_diagonal: bool = False) -> List[Tuple[Tuple[int, int], float]]:
     """
@@ -110,31 +273,17 @@ def get_neighbors(position: Tuple[int, int], rows: int, cols: int,
     neighbors = []
     
     # Movimentos ortogonais (custo 1.0)
-    orthogonal_moves = [
-        (-1, 0),  # Cima
-        (1, 0),   # Baixo
-        (0, -1),  # Esquerda
-        (0, 1)    # Direita
-    ]
-    
-    for dr, dc in orthogonal_moves:
+    for dr, dc in _ORTHOGONAL_MOVES:
         new_row, new_col = row + dr, col + dc
         if 0 <= new_row < rows and 0 <= new_col < cols:
             neighbors.append(((new_row, new_col), 1.0))
     
     # Movimentos diagonais (custo √2 ≈ 1.414)
     if allow_diagonal:
-        diagonal_moves = [
-            (-1, -1),  # Cima-Esquerda
-            (-1, 1),   # Cima-Direita
-            (1, -1),   # Baixo-Esquerda
-            (1, 1)     # Baixo-Direita
-        ]
-        
-        for dr, dc in diagonal_moves:
+        for dr, dc in _DIAGONAL_MOVES:
             new_row, new_col = row + dr, col + dc
             if 0 <= new_row < rows and 0 <= new_col < cols:
-                neighbors.append(((new_row, new_col), math.sqrt(2)))
+                neighbors.append(((new_row, new_col), _DIAGONAL_COST))
     
     return neighbors
 
@@ -157,12 +306,367 @@ def reconstruct_path(node: Node) -> List[Tuple[int, int]]:
     return path[::-1]  # Inverte para obter do início ao fim
 
 
+def _flatten_weights(maze_grid) -> List[int]:
+    """
+    Achata o grid em uma lista de pesos indexada por linha*cols+coluna.
+    
+    Args:
+        maze_grid: Grid em lista de listas ou array NumPy
+    
+    Returns:
+        Lista plana de pesos (-1 para obstáculos)
+    """
+    if hasattr(maze_grid, 'ravel'):
+        return maze_grid.ravel().tolist()  # Grid NumPy (Maze(use_numpy=True))
+    return [cell for row in maze_grid for cell in row]
+
+
+def _pad_weights(maze_grid) -> Tuple[List[int], int]:
+    """
+    Achata o grid e o envolve em uma borda de obstáculos com uma célula de espessura.
+    
+    A célula (linha, coluna) fica no índice (linha+1)*largura + (coluna+1). Como
+    todo vizinho de uma célula interna existe no vetor, a expansão não precisa
+    verificar limites: a borda é simplesmente um obstáculo.
+    
+    Args:
+        maze_grid: Grid em lista de listas ou array NumPy
+    
+    Returns:
+        Tupla (pesos_com_borda, largura) com largura = colunas + 2
+    """
+    rows = len(maze_grid)
+    cols = len(maze_grid[0]) if rows > 0 else 0
+    width = cols + 2
+    flat = _flatten_weights(maze_grid)
+    weights = [-1] * ((rows + 2) * width)
+    for row in range(rows):
+        offset = (row + 1) * width + 1
+        weights[offset:offset + cols] = flat[row * cols:(row + 1) * cols]
+    return weights, width
+
+
+def _neighbor_table(width: int, allow_diagonal: bool) -> List[Tuple[int, float]]:
+    """
+    Tabela de vizinhança (delta de índice, custo do movimento) para o grid com borda.
+    
+    Args:
+        width: Largura do grid com borda (colunas + 2)
+        allow_diagonal: Se True, inclui os movimentos diagonais (custo √2)
+    """
+    table = [(dr * width + dc, 1.0) for dr, dc in _ORTHOGONAL_MOVES]
+    if allow_diagonal:
+        table += [(dr * width + dc, _DIAGONAL_COST) for dr, dc in _DIAGONAL_MOVES]
+    return table
+
+
+class SearchSpace:
+    """
+    Grid pré-processado para buscas A* repetidas sobre o mesmo labirinto.
+    
+    Guarda os pesos com borda de obstáculos (veja _pad_weights), a tabela de
+    vizinhança e os vetores de trabalho (custos g, pais, carimbos). Os vetores são
+    alocados uma única vez e reaproveitados entre consultas: cada busca recebe um
+    número de consulta e uma célula só é considerada visitada se tiver sido marcada
+    com o número atual, então nada precisa ser limpo entre uma busca e outra.
+    
+    Atributos:
+        weights: Pesos com borda (lista ou memoryview), indexados por índice plano
+        width (int): Largura do grid com borda (colunas + 2)
+        rows (int): Número de linhas do labirinto
+        cols (int): Número de colunas do labirinto
+        allow_diagonal (bool): Se movimentos diagonais são permitidos
+    """
+    
+    def __init__(self, weights, width: int, allow_diagonal: bool = False):
+        """
+        Inicializa o espaço de busca a partir de pesos já com borda.
+        
+        Args:
+            weights: Pesos com borda de obstáculos (-1), como retornado por _pad_weights
+            width: Largura do grid com borda (colunas + 2)
+            allow_diagonal: Se True, permite movimentos diagonais
+        """
+        self.weights = weights
+        self.width = width
+        self.rows = len(weights) // width - 2
+        self.cols = width - 2
+        self.allow_diagonal = allow_diagonal
+        self.neighbor_table = _neighbor_table(width, allow_diagonal)
+        
+        size = len(weights)
+        self._g_costs = array('d', [math.inf]) * size
+        self._parents = array('l', [-1]) * size
+        # Geração e consulta só crescem enquanto o espaço é reaproveitado: 'q' (64 bits
+        # em qualquer plataforma), pois 'l' tem 32 bits no Windows
+        self._stamps = array('q', [0]) * size  # Geração viva; -1 = fechado
+        self._visited = array('q', [0]) * size  # Número da consulta que tocou a célula
+        self._query = 0
+        self._generation = 0
+    
+    @staticmethod
+    def from_grid(maze_grid, allow_diagonal: bool = False) -> 'SearchSpace':
+        """
+        Cria o espaço de busca a partir de um grid numérico.
+        
+        Args:
+            maze_grid: Grid em lista de listas ou array NumPy
+            allow_diagonal: Se True, permite movimentos diagonais
+        
+        Returns:
+            Objeto SearchSpace
+        """
+        weights, width = _pad_weights(maze_grid)
+        return SearchSpace(weights, width, allow_diagonal)
+    
+    def index_of(self, position: Tuple[int, int]) -> int:
+        """Converte (linha, coluna) para o índice no grid com borda."""
+        return (position[0] + 1) * self.width + position[1] + 1
+    
+    def position_of(self, index: int) -> Tuple[int, int]:
+        """Converte um índice do grid com borda para (linha, coluna)."""
+        row, col = divmod(index, self.width)
+        return row - 1, col - 1
+    
+    def is_free(self, position: Tuple[int, int]) -> bool:
+        """Verifica se a posição está dentro do labirinto e não é obstáculo."""
+        row, col = position
+        return (0 <= row < self.rows and 0 <= col < self.cols and
+                self.weights[self.index_of(position)] != -1)
+    
+    def search(self, start: Tuple[int, int], end: Tuple[int, int],
+               use_euclidean: bool = False, exploration_callback=None,
+               landmarks=None) -> SearchResult:
+        """
+        Executa o A* de start até end reaproveitando os vetores de trabalho.
+        
+        Args:
+            start: Posição inicial (linha, coluna)
+            end: Posição objetivo (linha, coluna)
+            use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+            exploration_callback: Função chamada a cada nó explorado (para visualização)
+            landmarks: LandmarkHeuristic do mesmo grid; se informado, substitui a
+                heurística por ALT (use_euclidean é ignorado)
+        
+        Returns:
+            SearchResult com o caminho (ou None) e as estatísticas da busca
+        
+        Raises:
+            ValueError: Se os landmarks tiverem sido calculados para outro grid
+        """
+        # Com batch_size=0 o gerador nunca pausa: roda até o fim no primeiro next()
+        steps = self.search_steps(start, end, use_euclidean, landmarks, 0,
+                                  exploration_callback)
+        try:
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+        raise RuntimeError("search_steps pausou com batch_size=0")
+    
+    def search_steps(self, start: Tuple[int, int], end: Tuple[int, int],
+                     use_euclidean: bool = False, landmarks=None, batch_size: int = 64,
+                     exploration_callback=None) -> Generator[List[Tuple[int, int]], None, SearchResult]:
+        """
+        Versão passo a passo do A*: um gerador que pausa a cada batch_size nós
+        expandidos, para que quem chama (por exemplo a GUI) intercale a busca com
+        outras tarefas. O SearchResult final é o valor de retorno do gerador
+        (StopIteration.value, ou o resultado de "yield from").
+        
+        Enquanto o gerador não terminar, não inicie outra busca no mesmo
+        SearchSpace: os vetores de trabalho são compartilhados. O elapsed_ns do
+        resultado inclui o tempo em que o gerador ficou pausado.
+        
+        Args:
+            start: Posição inicial (linha, coluna)
+            end: Posição objetivo (linha, coluna)
+            use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+            landmarks: LandmarkHeuristic do mesmo grid (veja search)
+            batch_size: Nós expandidos por pausa (0 = nunca pausa)
+            exploration_callback: Função chamada a cada nó explorado
+        
+        Yields:
+            Lista com as posições expandidas desde a pausa anterior, em ordem
+        
+        Raises:
+            ValueError: Se os landmarks tiverem sido calculados para outro grid
+                (levantado no primeiro next())
+        """
+        started_ns = time.perf_counter_ns()
+        weights = self.weights
+        width = self.width
+        neighbor_table = self.neighbor_table
+        g_costs = self._g_costs
+        parents = self._parents
+        stamps = self._stamps
+        visited = self._visited
+        self._query += 1
+        query = self._query
+        generation = self._generation
+        
+        end_row, end_col = end[0] + 1, end[1] + 1
+        start_index = self.index_of(start)
+        end_index = end_row * width + end_col
+        
+        def heuristic(index: int) -> float:
+            row, col = divmod(index, width)
+            if use_euclidean:
+                return math.sqrt((row - end_row) ** 2 + (col - end_col) ** 2)
+            return abs(row - end_row) + abs(col - end_col)
+        
+        if landmarks is not None:
+            if landmarks.width != width or landmarks.allow_diagonal != self.allow_diagonal:
+                raise ValueError("Os landmarks foram calculados para outro grid "
+                                 "ou outro tipo de movimento")
+            heuristic = landmarks.heuristic_to(end_index)
+        
+        # Empates em f são desfeitos pelo menor h (nó mais próximo do objetivo)
+        generation += 1
+        visited[start_index] = query
+        g_costs[start_index] = 0.0
+        parents[start_index] = -1
+        stamps[start_index] = generation
+        start_h = heuristic(start_index)
+        open_list = [(start_h, start_h, generation, start_index)]
+        
+        # Estatísticas
+        nodes_explored = 0
+        nodes_generated = 1
+        stale_pops = 0
+        open_size = max_open_size = 1
+        result = None
+        batch: List[Tuple[int, int]] = []
+        
+        while open_list:
+            f_cost, _, entry_generation, current = heapq.heappop(open_list)
+            
+            # Entrada superada por uma reinserção mais barata: descarta
+            if stamps[current] != entry_generation:
+                stale_pops += 1
+                continue
+            stamps[current] = -1
+            open_size -= 1
+            nodes_explored += 1
+            
+            if exploration_callback:
+                exploration_callback(self.position_of(current), f_cost)
+            if batch_size:
+                batch.append(self.position_of(current))
+                if len(batch) >= batch_size:
+                    self._generation = generation
+                    yield batch
+                    batch = []
+            
+            if current == end_index:
+                path = []
+                index = current
+                while index != -1:
+                    path.append(self.position_of(index))
+                    index = parents[index]
+                path.reverse()
+                result = (path, g_costs[current])
+                break
+            
+            current_g = g_costs[current]
+            for delta, move_cost in neighbor_table:
+                neighbor = current + delta
+                cell_weight = weights[neighbor]
+                if cell_weight == -1:
+                    continue
+                
+                tentative_g_cost = current_g + move_cost * cell_weight
+                if visited[neighbor] == query:
+                    # Já tocado nesta consulta: fechado ou sem melhora
+                    if stamps[neighbor] == -1 or tentative_g_cost >= g_costs[neighbor]:
+                        continue
+                    in_open = True
+                else:
+                    visited[neighbor] = query
+                    in_open = False
+                
+                g_costs[neighbor] = tentative_g_cost
+                parents[neighbor] = current
+                h_cost = heuristic(neighbor)
+                if not in_open:
+                    open_size += 1
+                    if open_size > max_open_size:
+                        max_open_size = open_size
+                generation += 1
+                stamps[neighbor] = generation
+                nodes_generated += 1
+                heapq.heappush(open_list,
+                               (tentative_g_cost + h_cost, h_cost, generation, neighbor))
+        
+        self._generation = generation
+        if batch:
+            yield batch
+        path, cost = result if result else (None, None)
+        return SearchResult(path, cost, nodes_explored, nodes_generated, max_open_size,
+                            time.perf_counter_ns() - started_ns, stale_pops)
+
+
+def _a_star_flat(maze_grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, int],
+                 allow_diagonal: bool = False, use_euclidean: bool = False,
+                 exploration_callback=None, landmarks=None) -> SearchResult:
+    """
+    Motor alternativo do A* baseado em vetores planos pré-alocados.
+    
+    Em vez de criar um objeto Node por relaxamento e indexar dicionários/sets por
+    tuplas (linha, coluna), cada célula é identificada por um índice inteiro no grid
+    com borda de obstáculos (veja _pad_weights). Os custos g, os pais e as marcas de
+    "fechado" ficam em arrays contíguos, os vizinhos vêm de uma tabela pré-calculada
+    de (delta, custo) sem testes de limites, e a fila de prioridade guarda apenas
+    tuplas simples (f, desempate, índice). Para várias consultas sobre o mesmo
+    grid, use SearchSpace diretamente (ou batch.solve_many).
+    
+    O contrato de retorno é o mesmo de a_star.
+    
+    Args:
+        maze_grid: Matriz representando o labirinto (valores são pesos das células)
+        start: Posição inicial (linha, coluna)
+        end: Posição objetivo (linha, coluna)
+        allow_diagonal: Se True, permite movimentos diagonais
+        use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+        exploration_callback: Função chamada a cada nó explorado (para visualização)
+        landmarks: LandmarkHeuristic opcional para a heurística ALT
+    
+    Returns:
+        SearchResult com o caminho (ou None) e as estatísticas da busca
+    """
+    started_ns = time.perf_counter_ns()
+    space = SearchSpace.from_grid(maze_grid, allow_diagonal)
+    result = space.search(start, end, use_euclidean, exploration_callback, landmarks)
+    result.elapsed_ns = time.perf_counter_ns() - started_ns  # Inclui o pré-processamento
+    return result
+
+
+def _in_different_components(component_labels, cols: int, start: Tuple[int, int],
+                             end: Tuple[int, int]) -> bool:
+    """
+    Verifica pelos rótulos de componentes (Maze.component_labels) se não há caminho.
+    
+    Args:
+        component_labels: Rótulos por célula (linha * colunas + coluna; 0 = obstáculo)
+        cols: Número de colunas do grid
+        start: Posição inicial (linha, coluna)
+        end: Posição objetivo (linha, coluna)
+    
+    Returns:
+        True se start e end certamente não estão conectados
+    """
+    start_label = component_labels[start[0] * cols + start[1]]
+    return start_label == 0 or start_label != component_labels[end[0] * cols + end[1]]
+
+
 def a_star(maze_grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, int],
            allow_diagonal: bool = False, use_euclidean: bool = False,
-           exploration_callback=None) -> Optional[Tuple[List[Tuple[int, int]], float]]:
+           exploration_callback=None, engine: str = 'node',
+           component_labels=None, landmarks=None) -> SearchResult:
     """
     Implementação do Algoritmo A* para encontrar o menor caminho em um labirinto.
     
+    A função não imprime nada: o resultado e as estatísticas da busca são
+    devolvidos em um SearchResult (veja a_star_with_report para a saída em console).
+    
     O A* combina:
     - g(n): custo real do caminho do início até o nó atual
     - h(n): estimativa heurística do custo do nó atual até o objetivo
@@ -175,12 +679,41 @@ def a_star(maze_grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, i
         allow_diagonal: Se True, permite movimentos diagonais
         use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
         exploration_callback: Função chamada a cada nó explorado (para visualização)
+        engine: Motor de busca: 'node' (objetos Node, padrão), 'flat'
+                (vetores planos pré-alocados, indicado para grids grandes) ou 'jps'
+                (Jump Point Search em mapas de custo uniforme; recai para 'flat')
+        component_labels: Rótulos de componentes conexas do grid, com a mesma
+                conectividade de allow_diagonal (veja Maze.component_labels). Se
+                informados, consultas sem caminho retornam sem explorar nenhum nó
+        landmarks: LandmarkHeuristic do mesmo grid (veja src/landmarks.py). Se
+                informado, a busca usa a heurística ALT no motor 'flat' (engine e
+                use_euclidean são ignorados)
     
     Returns:
-        Tupla (caminho, custo_total) se encontrado, None caso contrário
-        - caminho: Lista de posições do início ao fim
-        - custo_total: Custo total do caminho encontrado
+        SearchResult (verdadeiro em contexto booleano se houver caminho)
+        - path: Lista de posições do início ao fim (None se não houver solução)
+        - cost: Custo total do caminho encontrado
+    
+    Raises:
+        ValueError: Se o motor informado não existir
     """
+    if engine not in ('node', 'flat', 'jps'):
+        raise ValueError(f"Motor de busca desconhecido: '{engine}'. "
+                         f"Use 'node', 'flat' ou 'jps'.")
+    if component_labels is not None:
+        started_ns = time.perf_counter_ns()
+        cols = len(maze_grid[0]) if len(maze_grid) > 0 else 0
+        if _in_different_components(component_labels, cols, start, end):
+            return SearchResult(None, None, elapsed_ns=time.perf_counter_ns() - started_ns)
+    
+    if engine == 'flat' or landmarks is not None:
+        return _a_star_flat(maze_grid, start, end, allow_diagonal, use_euclidean,
+                            exploration_callback, landmarks)
+    if engine == 'jps':
+        return jump_point_search(maze_grid, start, end, allow_diagonal, use_euclidean,
+                                 exploration_callback)
+    
+    started_ns = time.perf_counter_ns()
     rows = len(maze_grid)
     cols = len(maze_grid[0]) if rows > 0 else 0
     
@@ -194,9 +727,8 @@ def a_star(maze_grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, i
     start_node.f_cost = start_node.g_cost + start_node.h_cost
     
     # Listas abertas (a explorar) e fechadas (já exploradas)
-    open_list = []
-    heapq.heappush(open_list, start_node)
-    open_set: Set[Tuple[int, int]] = {start}
+    open_list = OpenList()
+    open_list.push(start, start_node.f_cost, start_node, start_node.h_cost)
     closed_set: Set[Tuple[int, int]] = set()
     
     # Dicionário para rastrear o melhor g_cost para cada posição
@@ -204,18 +736,12 @@ def a_star(maze_grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, i
     
     # Estatísticas
     nodes_explored = 0
+    nodes_generated = 1
+    max_open_size = 1
     
     while open_list:
-        # Pega o nó com menor f_cost
-        current_node = heapq.heappop(open_list)
-        current_pos = current_node.position
-        
-        # Remove da lista aberta
-        open_set.discard(current_pos)
-        
-        # Se já foi explorado com um custo melhor, ignora
-        if current_pos in closed_set:
-            continue
+        # Pega o nó com menor f_cost (entradas obsoletas são puladas pela lista)
+        current_pos, current_node = open_list.pop()
         
         # Marca como explorado
         closed_set.add(current_pos)
@@ -228,11 +754,9 @@ def a_star(maze_grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, i
         # Verifica se chegou ao objetivo
         if current_pos == end:
             path = reconstruct_path(current_node)
-            print(f"\n✓ Caminho encontrado!")
-            print(f"  Nós explorados: {nodes_explored}")
-            print(f"  Custo total: {current_node.g_cost:.2f}")
-            print(f"  Tamanho do caminho: {len(path)} células")
-            return path, current_node.g_cost
+            return SearchResult(path, current_node.g_cost, nodes_explored,
+                                nodes_generated, max_open_size,
+                                time.perf_counter_ns() - started_ns, open_list.stale_pops)
         
         # Explora os vizinhos
         for neighbor_pos, move_cost in get_neighbors(current_pos, rows, cols, allow_diagonal):
@@ -261,15 +785,475 @@ def a_star(maze_grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, i
             # Atualiza o melhor custo conhecido
             g_costs[neighbor_pos] = tentative_g_cost
             
-            # Adiciona à lista aberta
-            if neighbor_pos not in open_set:
-                heapq.heappush(open_list, neighbor_node)
-                open_set.add(neighbor_pos)
+            # Adiciona à lista aberta (ou substitui a entrada pior já existente)
+            open_list.push(neighbor_pos, neighbor_node.f_cost, neighbor_node,
+                           neighbor_node.h_cost)
+            nodes_generated += 1
+            max_open_size = max(max_open_size, len(open_list))
     
     # Não encontrou caminho
-    print(f"\n✗ Sem solução!")
-    print(f"  Nós explorados: {nodes_explored}")
-    return None
+    return SearchResult(None, None, nodes_explored, nodes_generated, max_open_size,
+                        time.perf_counter_ns() - started_ns, open_list.stale_pops)
+
+
+def jump_point_search(maze_grid: List[List[int]], start: Tuple[int, int],
+                      end: Tuple[int, int], allow_diagonal: bool = False,
+                      use_euclidean: bool = False, exploration_callback=None) -> SearchResult:
+    """
+    Jump Point Search (JPS) para grids de custo uniforme.
+    
+    Em regiões onde toda célula livre tem peso 1, há muitos caminhos simétricos de
+    mesmo custo. O JPS "salta" em linha reta (e na diagonal, com 8 direções) até
+    encontrar um ponto de salto — o objetivo ou uma célula com vizinho forçado por
+    um obstáculo — e só esses pontos entram na lista aberta. As regras de poda
+    seguem o mesmo modelo de movimento de a_star (diagonais podem passar entre
+    obstáculos; com 4 direções, saltos verticais verificam saltos horizontais).
+    
+    Se alguma célula livre tiver peso diferente de 1, a busca recai
+    automaticamente para a_star(engine='flat'), que trata os pesos.
+    
+    Heurística: Euclidiana se use_euclidean; caso contrário Manhattan com 4 direções
+    e octil com 8 (Manhattan superestima custos diagonais), garantindo o custo ótimo.
+    
+    Args:
+        maze_grid: Matriz representando o labirinto (valores são pesos das células)
+        start: Posição inicial (linha, coluna)
+        end: Posição objetivo (linha, coluna)
+        allow_diagonal: Se True, permite movimentos diagonais
+        use_euclidean: Se True, usa distância Euclidiana
+        exploration_callback: Função chamada a cada ponto de salto expandido
+    
+    Returns:
+        SearchResult com o caminho completo (célula a célula) ou None
+    """
+    started_ns = time.perf_counter_ns()
+    weights, width = _pad_weights(maze_grid)
+    if not {1, -1}.issuperset(weights):
+        # Pesos variados: mesmo motor de _a_star_flat, sobre os pesos já com borda
+        space = SearchSpace(weights, width, allow_diagonal)
+        result = space.search(start, end, use_euclidean, exploration_callback)
+        result.elapsed_ns = time.perf_counter_ns() - started_ns  # Inclui o pré-processamento
+        return result
+    
+    diagonal_cost = _DIAGONAL_COST
+    
+    # Grid de passagem com borda de obstáculos: os saltos não testam limites
+    passable = bytearray(weight != -1 for weight in weights)
+    
+    end_row, end_col = end[0] + 1, end[1] + 1
+    end_index = end_row * width + end_col
+    
+    def heuristic(index: int) -> float:
+        row, col = divmod(index, width)
+        d_row, d_col = abs(row - end_row), abs(col - end_col)
+        if use_euclidean:
+            return math.sqrt(d_row ** 2 + d_col ** 2)
+        if allow_diagonal:
+            return (diagonal_cost - 1) * min(d_row, d_col) + max(d_row, d_col)
+        return d_row + d_col
+    
+    def jump_horizontal(index: int, dc: int) -> int:
+        """Salta na horizontal e retorna o índice do ponto de salto ou -1."""
+        while passable[index]:
+            if index == end_index:
+                return index
+            if allow_diagonal:
+                # Vizinho forçado: acima/abaixo bloqueado, mas a diagonal à frente livre
+                if ((passable[index + width + dc] and not passable[index + width]) or
+                        (passable[index - width + dc] and not passable[index - width])):
+                    return index
+            elif ((passable[index - width] and not passable[index - width - dc]) or
+                    (passable[index + width] and not passable[index + width - dc])):
+                return index
+            index += dc
+        return -1
+    
+    def jump_vertical(index: int, dr: int) -> int:
+        """Salta na vertical e retorna o índice do ponto de salto ou -1."""
+        step = dr * width
+        while passable[index]:
+            if index == end_index:
+                return index
+            if allow_diagonal:
+                if ((passable[index + step + 1] and not passable[index + 1]) or
+                        (passable[index + step - 1] and not passable[index - 1])):
+                    return index
+            else:
+                if ((passable[index - 1] and not passable[index - step - 1]) or
+                        (passable[index + 1] and not passable[index - step + 1])):
+                    return index
+                # Com 4 direções, um salto vertical para onde um salto horizontal encontra algo
+                if jump_horizontal(index + 1, 1) != -1 or jump_horizontal(index - 1, -1) != -1:
+                    return index
+            index += step
+        return -1
+    
+    def jump_diagonal(index: int, dr: int, dc: int) -> int:
+        """Salta na diagonal e retorna o índice do ponto de salto ou -1."""
+        step_row = dr * width
+        while passable[index]:
+            if index == end_index:
+                return index
+            if ((passable[index + step_row - dc] and not passable[index - dc]) or
+                    (passable[index - step_row + dc] and not passable[index - step_row])):
+                return index
+            if (jump_horizontal(index + dc, dc) != -1 or
+                    jump_vertical(index + step_row, dr) != -1):
+                return index
+            index += step_row + dc
+        return -1
+    
+    def jump(index: int, dr: int, dc: int) -> int:
+        if dr and dc:
+            return jump_diagonal(index, dr, dc)
+        if dc:
+            return jump_horizontal(index, dc)
+        return jump_vertical(index, dr)
+    
+    def pruned_directions(index: int, dr: int, dc: int) -> List[Tuple[int, int]]:
+        """Direções a seguir a partir de um ponto de salto alcançado na direção (dr, dc)."""
+        if not allow_diagonal:
+            return [(-1, 0), (1, 0), (0, dc)] if dc else [(0, -1), (0, 1), (dr, 0)]
+        
+        directions = []
+        if dr and dc:
+            if passable[index + dr * width]:
+                directions.append((dr, 0))
+            if passable[index + dc]:
+                directions.append((0, dc))
+            if passable[index + dr * width + dc]:
+                directions.append((dr, dc))
+            if not passable[index - dc]:
+                directions.append((dr, -dc))
+            if not passable[index - dr * width]:
+                directions.append((-dr, dc))
+        elif dc:
+            if passable[index + dc]:
+                directions.append((0, dc))
+            if not passable[index + width]:
+                directions.append((1, dc))
+            if not passable[index - width]:
+                directions.append((-1, dc))
+        else:
+            if passable[index + dr * width]:
+                directions.append((dr, 0))
+            if not passable[index + 1]:
+                directions.append((dr, 1))
+            if not passable[index - 1]:
+                directions.append((dr, -1))
+        return directions
+    
+    all_directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if allow_diagonal:
+        all_directions += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    
+    size = len(passable)
+    g_costs = array('d', [math.inf]) * size
+    parents = array('l', [-1]) * size
+    stamps = array('l', [0]) * size
+    start_index = (start[0] + 1) * width + start[1] + 1
+    g_costs[start_index] = 0.0
+    start_h = heuristic(start_index)
+    generation = 1
+    stamps[start_index] = generation
+    open_list = [(start_h, start_h, generation, start_index)]
+    
+    # Estatísticas
+    nodes_explored = 0
+    nodes_generated = 1
+    stale_pops = 0
+    open_size = max_open_size = 1
+    
+    while open_list:
+        f_cost, _, entry_generation, current = heapq.heappop(open_list)
+        if stamps[current] != entry_generation:
+            stale_pops += 1
+            continue
+        stamps[current] = -1  # Fechado
+        open_size -= 1
+        nodes_explored += 1
+        
+        row, col = divmod(current, width)
+        if exploration_callback:
+            exploration_callback((row - 1, col - 1), f_cost)
+        
+        if current == end_index:
+            # Reconstrói os pontos de salto e preenche as células entre eles
+            jump_points = []
+            index = current
+            while index != -1:
+                jump_row, jump_col = divmod(index, width)
+                jump_points.append((jump_row - 1, jump_col - 1))
+                index = parents[index]
+            jump_points.reverse()
+            path = [jump_points[0]]
+            for (from_row, from_col), (to_row, to_col) in zip(jump_points, jump_points[1:]):
+                step_row = (to_row > from_row) - (to_row < from_row)
+                step_col = (to_col > from_col) - (to_col < from_col)
+                cell_row, cell_col = from_row, from_col
+                while (cell_row, cell_col) != (to_row, to_col):
+                    cell_row += step_row
+                    cell_col += step_col
+                    path.append((cell_row, cell_col))
+            return SearchResult(path, g_costs[current], nodes_explored, nodes_generated,
+                                max_open_size, time.perf_counter_ns() - started_ns,
+                                stale_pops)
+        
+        parent = parents[current]
+        if parent == -1:
+            directions = all_directions
+        else:
+            parent_row, parent_col = divmod(parent, width)
+            directions = pruned_directions(current,
+                                           (row > parent_row) - (row < parent_row),
+                                           (col > parent_col) - (col < parent_col))
+        
+        current_g = g_costs[current]
+        for dr, dc in directions:
+            jump_point = jump(current + dr * width + dc, dr, dc)
+            if jump_point == -1 or stamps[jump_point] == -1:
+                continue
+            
+            jump_row, jump_col = divmod(jump_point, width)
+            steps = max(abs(jump_row - row), abs(jump_col - col))
+            tentative_g_cost = current_g + steps * (diagonal_cost if dr and dc else 1.0)
+            if tentative_g_cost >= g_costs[jump_point]:
+                continue
+            
+            g_costs[jump_point] = tentative_g_cost
+            parents[jump_point] = current
+            h_cost = heuristic(jump_point)
+            if not stamps[jump_point]:
+                open_size += 1
+                max_open_size = max(max_open_size, open_size)
+            generation += 1
+            stamps[jump_point] = generation
+            nodes_generated += 1
+            heapq.heappush(open_list,
+                           (tentative_g_cost + h_cost, h_cost, generation, jump_point))
+    
+    return SearchResult(None, None, nodes_explored, nodes_generated, max_open_size,
+                        time.perf_counter_ns() - started_ns, stale_pops)
+
+
+def bidirectional_a_star(maze_grid: List[List[int]], start: Tuple[int, int],
+                         end: Tuple[int, int], allow_diagonal: bool = False,
+                         use_euclidean: bool = False,
+                         exploration_callback=None) -> BidirectionalSearchResult:
+    """
+    A* bidirecional: uma busca a partir do início e outra a partir do fim.
+    
+    Como o custo é cobrado ao entrar em uma célula (movimento × peso do destino),
+    a busca reversa, ao andar de v para um vizinho u, soma o peso de v (a aresta
+    original é u -> v). Cada relaxamento que alcança uma célula já vista pela
+    outra direção atualiza mu, o custo do melhor caminho completo conhecido.
+    A busca termina quando o menor f de qualquer uma das listas abertas é >= mu:
+    com heurísticas admissíveis nenhum caminho ainda não visto pode ser mais barato.
+    
+    Em cada iteração é expandida a direção com menos entradas vivas na lista aberta.
+    
+    Args:
+        maze_grid: Matriz representando o labirinto (valores são pesos das células)
+        start: Posição inicial (linha, coluna)
+        end: Posição objetivo (linha, coluna)
+        allow_diagonal: Se True, permite movimentos diagonais
+        use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+        exploration_callback: Função chamada a cada nó explorado (para visualização)
+    
+    Returns:
+        BidirectionalSearchResult com o caminho (ou None) e os nós explorados por direção
+    """
+    started_ns = time.perf_counter_ns()
+    weights, width = _pad_weights(maze_grid)
+    size = len(weights)
+    neighbor_table = _neighbor_table(width, allow_diagonal)
+    
+    start_index = (start[0] + 1) * width + start[1] + 1
+    end_index = (end[0] + 1) * width + end[1] + 1
+    if start_index == end_index:
+        return BidirectionalSearchResult([start], 0.0, nodes_generated=2, max_open_size=2,
+                                         elapsed_ns=time.perf_counter_ns() - started_ns)
+    
+    # Índice 0 = direção para frente (alvo: fim), 1 = direção reversa (alvo: início)
+    targets = ((end[0] + 1, end[1] + 1), (start[0] + 1, start[1] + 1))
+    g_costs = (array('d', [math.inf]) * size, array('d', [math.inf]) * size)
+    parents = (array('l', [-1]) * size, array('l', [-1]) * size)
+    closed = (bytearray(size), bytearray(size))
+    stamps = (array('l', [0]) * size, array('l', [0]) * size)
+    open_lists: Tuple[list, list] = ([], [])
+    open_sizes = [1, 1]
+    explored = [0, 0]
+    
+    def heuristic(index: int, direction: int) -> float:
+        row, col = divmod(index, width)
+        target_row, target_col = targets[direction]
+        if use_euclidean:
+            return math.sqrt((row - target_row) ** 2 + (col - target_col) ** 2)
+        return abs(row - target_row) + abs(col - target_col)
+    
+    generation = 0
+    for direction, origin_index in ((0, start_index), (1, end_index)):
+        generation += 1
+        g_costs[direction][origin_index] = 0.0
+        stamps[direction][origin_index] = generation
+        h_cost = heuristic(origin_index, direction)
+        open_lists[direction].append((h_cost, h_cost, generation, origin_index))
+    
+    # Estatísticas
+    nodes_generated = 2
+    stale_pops = 0
+    max_open_size = 2
+    
+    best_cost = math.inf  # mu
+    meeting = -1
+    
+    while True:
+        # Descarta entradas obsoletas do topo para obter o menor f vivo de cada lado
+        for direction in (0, 1):
+            heap = open_lists[direction]
+            direction_stamps = stamps[direction]
+            while heap and direction_stamps[heap[0][3]] != heap[0][2]:
+                heapq.heappop(heap)
+                stale_pops += 1
+        
+        if not open_lists[0] or not open_lists[1]:
+            break
+        if open_lists[0][0][0] >= best_cost or open_lists[1][0][0] >= best_cost:
+            break
+        
+        direction = 0 if open_sizes[0] <= open_sizes[1] else 1
+        other = 1 - direction
+        g_this, g_other = g_costs[direction], g_costs[other]
+        parents_this, closed_this = parents[direction], closed[direction]
+        stamps_this = stamps[direction]
+        
+        f_cost, _, _, current = heapq.heappop(open_lists[direction])
+        stamps_this[current] = 0
+        closed_this[current] = 1
+        open_sizes[direction] -= 1
+        explored[direction] += 1
+        
+        if exploration_callback:
+            row, col = divmod(current, width)
+            exploration_callback((row - 1, col - 1), f_cost)
+        
+        current_g = g_this[current]
+        current_weight = weights[current]
+        for delta, move_cost in neighbor_table:
+            neighbor = current + delta
+            neighbor_weight = weights[neighbor]
+            if neighbor_weight == -1 or closed_this[neighbor]:
+                continue
+            
+            # Para frente entra-se no vizinho; na reversa, a aresta original entra em current
+            if direction == 0:
+                tentative_g_cost = current_g + move_cost * neighbor_weight
+            else:
+                tentative_g_cost = current_g + move_cost * current_weight
+            
+            if tentative_g_cost < g_this[neighbor]:
+                g_this[neighbor] = tentative_g_cost
+                parents_this[neighbor] = current
+                h_cost = heuristic(neighbor, direction)
+                if not stamps_this[neighbor]:
+                    open_sizes[direction] += 1
+                    max_open_size = max(max_open_size, open_sizes[0] + open_sizes[1])
+                generation += 1
+                stamps_this[neighbor] = generation
+                nodes_generated += 1
+                heapq.heappush(open_lists[direction],
+                               (tentative_g_cost + h_cost, h_cost, generation, neighbor))
+                
+                # Encontro das duas buscas: candidato a melhor caminho completo
+                total_cost = tentative_g_cost + g_other[neighbor]
+                if total_cost < best_cost:
+                    best_cost = total_cost
+                    meeting = neighbor
+    
+    elapsed_ns = time.perf_counter_ns() - started_ns
+    if meeting == -1:
+        return BidirectionalSearchResult(None, None, explored[0], explored[1],
+                                         nodes_generated, max_open_size, elapsed_ns,
+                                         stale_pops)
+    
+    # Metade inicial: do encontro até o início; metade final: do encontro até o fim
+    path = []
+    index = meeting
+    while index != -1:
+        row, col = divmod(index, width)
+        path.append((row - 1, col - 1))
+        index = parents[0][index]
+    path.reverse()
+    index = parents[1][meeting]
+    while index != -1:
+        row, col = divmod(index, width)
+        path.append((row - 1, col - 1))
+        index = parents[1][index]
+    
+    return BidirectionalSearchResult(path, best_cost, explored[0], explored[1],
+                                     nodes_generated, max_open_size, elapsed_ns, stale_pops)
+
+
+def print_search_result(result: SearchResult) -> None:
+    """
+    Imprime o resumo de uma busca no console.
+    
+    Args:
+        result: Resultado retornado por a_star
+    """
+    print(f"\n✓ Caminho encontrado!" if result.found else f"\n✗ Sem solução!")
+    print(f"  Nós explorados: {result.nodes_explored}")
+    if isinstance(result, BidirectionalSearchResult):
+        print(f"    ↳ a partir do início: {result.nodes_explored_forward}")
+        print(f"    ↳ a partir do fim: {result.nodes_explored_backward}")
+    if result.found:
+        print(f"  Custo total: {result.cost:.2f}")
+        print(f"  Tamanho do caminho: {len(result.path)} células")
+    print(f"  Nós gerados: {result.nodes_generated}")
+    print(f"  Entradas obsoletas descartadas: {result.stale_pops}")
+    print(f"  Tempo de busca: {result.elapsed_ns / 1e6:.2f} ms")
+
+
+def a_star_with_report(maze_grid: List[List[int]], start: Tuple[int, int],
+                       end: Tuple[int, int], allow_diagonal: bool = False,
+                       use_euclidean: bool = False, exploration_callback=None,
+                       engine: str = 'node', bidirectional: bool = False,
+                       component_labels=None,
+                       landmarks=None) -> Optional[Tuple[List[Tuple[int, int]], float]]:
+    """
+    Wrapper de compatibilidade: executa a_star e imprime o resumo da busca.
+    
+    Mantém o contrato antigo de a_star (usado por main.run_pathfinder).
+    
+    Args:
+        maze_grid: Matriz representando o labirinto (valores são pesos das células)
+        start: Posição inicial (linha, coluna)
+        end: Posição objetivo (linha, coluna)
+        allow_diagonal: Se True, permite movimentos diagonais
+        use_euclidean: Se True, usa distância Euclidiana; caso contrário, Manhattan
+        exploration_callback: Função chamada a cada nó explorado (para visualização)
+        engine: Motor de busca ('node', 'flat' ou 'jps')
+        bidirectional: Se True, usa bidirectional_a_star (engine é ignorado)
+        component_labels: Rótulos de componentes para responder de imediato
+            consultas sem caminho (veja a_star)
+        landmarks: LandmarkHeuristic para a heurística ALT (veja a_star); não se
+            aplica à busca bidirecional
+    
+    Returns:
+        Tupla (caminho, custo_total) se encontrado, None caso contrário
+    """
+    if bidirectional and component_labels is not None:
+        cols = len(maze_grid[0]) if len(maze_grid) > 0 else 0
+        if _in_different_components(component_labels, cols, start, end):
+            bidirectional = False  # a_star responde sem explorar nenhum nó
+    if bidirectional:
+        result = bidirectional_a_star(maze_grid, start, end, allow_diagonal, use_euclidean,
+                                      exploration_callback)
+    else:
+        result = a_star(maze_grid, start, end, allow_diagonal, use_euclidean,
+                        exploration_callback, engine, component_labels, landmarks)
+    print_search_result(result)
+    return result.as_tuple()
 
 
 # Função auxiliar para testes
@@ -287,7 +1271,7 @@ if __name__ == "__main__":
     
     print("Testando A* com movimentos ortogonais:")
     result = a_star(test_maze, start_pos, end_pos, allow_diagonal=False)
+    print_search_result(result)
     if result:
-        path, cost = result
-        print(f"Caminho: {path}")
-        print(f"Custo: {cost}")
+        print(f"Caminho: {result.path}")
+        print(f"Custo: {result.cost}")
@@ -39,7 +39,7 @@ print("\n[3/4] Testando algoritmo A*...")
 try:
     result = a_star(maze.grid, maze.start, maze.end, allow_diagonal=False)
     if result:
-        path, cost = result
+        path, cost = result.path, result.cost
         print(f"✓ Caminho encontrado com {len(path)} células e custo {cost:.2f}")
     else:
         print("✗ Nenhum caminho encontrado")